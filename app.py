@@ -1,37 +1,120 @@
 import sys
 import os
+import threading
 
 # Add project root to Python path
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
-from flask import Flask, request, render_template
+from flask import Flask, jsonify, request, render_template
 from config.settings import Config
-from src.core.embeddings import get_openai_embeddings
-from src.core.vector_store import get_vector_store, get_retriever
+from src.core.embeddings import get_query_embeddings
+from src.core.intent import IntentClassifier
+from src.core.vector_store import (
+    get_vector_store, get_retriever, get_side_store_retriever, get_sharded_retriever, get_snapshot_manager,
+    get_snapshot_retriever
+)
+from src.core.serving import ServingPointer, serving_namespaces
 from src.services.chat_service import ChatService
+from src.utils.static_assets import register_static_assets
+from src.utils.telemetry import logger
 
 app = Flask(__name__)
+register_static_assets(app)
 
 # Validate configuration
 Config.validate()
 
-# Initialize embeddings and vector store
-embeddings = get_openai_embeddings()
-vector_store = get_vector_store(embeddings)
-retriever = get_retriever(vector_store)
+# Read-only state, loaded once and shared copy-on-write by the workers serve.py forks
+serving_pointer = ServingPointer()
+snapshot_managers = {}  # serving namespace -> SnapshotManager
 
-# Initialize chat service
-chat_service = ChatService(retriever)
+def load_serving_state(pointer):
+    """Namespaces to search and intent classifier for a version of the serving pointer."""
+    # One namespace per source collection (setup_index.py), or its live blue/green slot (watch_index.py)
+    namespaces = sorted(set(serving_namespaces(pointer).values()))
+    if Config.VECTOR_BACKEND == "snapshot":
+        for namespace in namespaces:
+            if namespace not in snapshot_managers:
+                snapshot_managers[namespace] = get_snapshot_manager(namespace)
+    return {
+        "version": pointer["version"],
+        "namespaces": namespaces,
+        "classifier": IntentClassifier.from_manifest(namespaces=namespaces) if Config.INTENT_FILTERING else None,
+    }
+
+serving_state = load_serving_state(serving_pointer.current())
+
+chat_service = None
+_chat_service_lock = threading.Lock()
+
+def create_chat_service(state):
+    """Initialize embeddings, retriever and chat chain (network clients; one set per process)."""
+    namespaces, classifier = state["namespaces"], state["classifier"]
+    embeddings = get_query_embeddings()
+    if len(namespaces) > 1:
+        retriever = get_sharded_retriever(
+            embeddings, namespaces, classifier=classifier,
+            snapshot_managers=snapshot_managers if Config.VECTOR_BACKEND == "snapshot" else None
+        )
+    elif Config.VECTOR_BACKEND == "snapshot":
+        retriever = get_snapshot_retriever(embeddings, classifier=classifier, manager=snapshot_managers[namespaces[0]])
+    elif Config.TEXT_SIDE_STORE:
+        retriever = get_side_store_retriever(embeddings, classifier=classifier, namespace=namespaces[0])
+    else:
+        vector_store = get_vector_store(embeddings, namespace=namespaces[0])
+        retriever = get_retriever(vector_store, classifier=classifier)
+    return ChatService(retriever)
+
+def get_chat_service():
+    """The process's chat service, created on first use and rebuilt when the serving pointer flips."""
+    global chat_service, serving_state
+    pointer = serving_pointer.current()
+    service = chat_service
+    if service is not None and pointer["version"] == serving_state["version"]:
+        return service
+    with _chat_service_lock:
+        if pointer["version"] != serving_state["version"]:
+            try:
+                # Build the new service before publishing it: concurrent requests keep using the old one
+                state = load_serving_state(pointer)
+                service = create_chat_service(state)
+            except Exception as e:
+                # Keep answering from the previous namespaces until the next flip
+                logger.warning(f"⚠️  Could not switch to serving pointer v{pointer['version']}: {e}")
+                serving_state = {**serving_state, "version": pointer["version"]}
+            else:
+                serving_state, chat_service = state, service
+                # Retired slots' snapshots stay mapped only while in-flight requests still hold them
+                for namespace in set(snapshot_managers) - set(state["namespaces"]):
+                    del snapshot_managers[namespace]
+                logger.info(f"🔀 Serving pointer v{pointer['version']}: {', '.join(state['namespaces'])}")
+        if chat_service is None:
+            chat_service = create_chat_service(serving_state)
+        return chat_service
 
 @app.route("/")
 def index():
     return render_template("index.html")
 
+@app.route("/healthz")
+def healthz():
+    health = {"status": "ok", "pid": os.getpid(), "serving": serving_state["version"],
+              "namespaces": serving_state["namespaces"]}
+    if snapshot_managers:
+        health["snapshot"] = {
+            namespace: manager.current().version for namespace, manager in list(snapshot_managers.items())
+        }
+    return jsonify(health)
+
 @app.route("/get", methods=["POST"])
 def get_chat_response():
     user_message = request.form.get("msg")
-    return chat_service.get_response(user_message)
+    # Structured mode: the answer as typed blocks with sources and timings (see src/utils/answer_blocks.py)
+    if request.form.get("format") == "json" or request.accept_mimetypes.best == "application/json":
+        return get_chat_service().get_structured_response(user_message)
+    return get_chat_service().get_response(user_message)
 
 if __name__ == "__main__":
+    get_chat_service()
     app.run(debug=False)
@@ -0,0 +1,75 @@
+"""
+Benchmark: Camelot on every page vs. only on detected table-candidate pages.
+
+Usage:
+    python -m benchmarks.bench_camelot_scoping [num_files] [pages_per_file]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from benchmarks.corpus import build_corpus
+from src.utils.file_utils import PDFStructureExtractor
+
+
+def run(num_files: int = 3, pages_per_file: int = 12) -> dict:
+    extractor = PDFStructureExtractor()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_files = build_corpus(tmp_dir, num_files=num_files, pages_per_file=pages_per_file)
+        
+        full_time = scoped_time = detect_time = 0.0
+        full_tables = scoped_tables = 0
+        full_pages = set()
+        scoped_pages = set()
+        
+        for pdf_file in pdf_files:
+            start = time.perf_counter()
+            full = extractor.extract_with_camelot(pdf_file)
+            full_time += time.perf_counter() - start
+            full_tables += len(full["tables"])
+            full_pages.update((pdf_file, t["page"]) for t in full["tables"] if t["method"] == "lattice")
+            
+            start = time.perf_counter()
+            candidate_pages = extractor.detect_table_pages(pdf_file)
+            detect_time += time.perf_counter() - start
+            
+            start = time.perf_counter()
+            scoped = extractor.extract_with_camelot(pdf_file, pages=candidate_pages)
+            scoped_time += time.perf_counter() - start
+            scoped_tables += len(scoped["tables"])
+            scoped_pages.update((pdf_file, t["page"]) for t in scoped["tables"] if t["method"] == "lattice")
+    
+    total_pages = num_files * pages_per_file
+    print("\n" + "=" * 60)
+    print("📊 CAMELOT PAGE SCOPING BENCHMARK")
+    print("=" * 60)
+    print(f"📁 Corpus: {num_files} files, {total_pages} pages")
+    print(f"⏱️  All pages:      {full_time:8.2f}s  ({full_tables} tables)")
+    print(f"⏱️  Candidate scan: {detect_time:8.2f}s")
+    print(f"⏱️  Scoped Camelot: {scoped_time:8.2f}s  ({scoped_tables} tables)")
+    speedup = full_time / max(1e-9, detect_time + scoped_time)
+    print(f"🚀 Speed-up: {speedup:.1f}x")
+    print(f"🎯 Ruled tables found: {len(scoped_pages & full_pages)}/{len(full_pages)} of full scan")
+    print("=" * 60 + "\n")
+    
+    return {
+        "full_seconds": full_time,
+        "detect_seconds": detect_time,
+        "scoped_seconds": scoped_time,
+        "full_tables": full_tables,
+        "scoped_tables": scoped_tables,
+        "lattice_pages_recalled": len(scoped_pages & full_pages),
+        "lattice_pages_total": len(full_pages),
+    }
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    run(*args)
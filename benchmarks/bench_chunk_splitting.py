@@ -0,0 +1,137 @@
+"""
+Benchmark: structure-preserving splitters on large table- and list-heavy input.
+
+Compares the previous character-sized splitters, which grew each chunk by
+string concatenation, with the token-sized segment packer.
+
+Usage:
+    python -m pytest benchmarks/bench_chunk_splitting.py --benchmark-only
+"""
+
+import os
+import re
+import sys
+from typing import List
+
+import pytest
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.utils.chunking import ChunkType, DocumentTypeOptimizer, SemanticAwareChunker
+from src.utils.tokens import count_tokens
+
+LEGACY_CHUNK_SIZES = {ChunkType.TABLE_HEAVY: 1200, ChunkType.LIST_HEAVY: 600}
+
+
+def build_table_text(tables: int = 200, rows: int = 25) -> str:
+    sections = []
+    for t in range(tables):
+        sections.append(f"Tabel {t}: jadwal layanan laboratorium dan kontak admin gedung.")
+        rows_text = [f"| Lab {t}-{r} | 08.00-16.00 | Gedung {r} | ext. {1000 + r} |" for r in range(rows)]
+        sections.append("\n".join(["| Lab | Jam | Lokasi | Kontak |", "| --- | --- | --- | --- |"] + rows_text))
+    return "\n\n".join(sections)
+
+
+def build_list_text(lists: int = 400, items: int = 12) -> str:
+    lines = []
+    for l in range(lists):
+        lines.append(f"Prosedur {l}: langkah-langkah konfigurasi akun dan perangkat.")
+        lines.extend(f"{i + 1}. Buka menu pengaturan dan pilih opsi nomor {i} untuk prosedur {l}."
+                     for i in range(items))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def legacy_split_tables(text: str, chunk_size: int) -> List[str]:
+    """The previous _split_preserving_tables (string concatenation, no overlap)."""
+    chunks = []
+    current_chunk = ""
+    for section in text.split('\n\n'):
+        if len(current_chunk) + len(section) > chunk_size and current_chunk.strip():
+            chunks.append(current_chunk.strip())
+            current_chunk = section
+        else:
+            current_chunk += "\n\n" + section if current_chunk else section
+    if current_chunk.strip():
+        chunks.append(current_chunk.strip())
+    return chunks
+
+
+def legacy_split_lists(text: str, chunk_size: int) -> List[str]:
+    """The previous _split_preserving_lists (string concatenation, no overlap)."""
+    chunks = []
+    current_chunk = ""
+    lines = text.split('\n')
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if re.match(r'^\s*[-*•]\s', line) or re.match(r'^\s*\d+\.\s', line):
+            list_items = [line]
+            i += 1
+            while i < len(lines) and (
+                re.match(r'^\s*[-*•]\s', lines[i]) or
+                re.match(r'^\s*\d+\.\s', lines[i]) or
+                (lines[i].strip() and not lines[i].startswith(' ') == False)
+            ):
+                list_items.append(lines[i])
+                i += 1
+            list_text = '\n'.join(list_items)
+            if len(current_chunk) + len(list_text) > chunk_size and current_chunk.strip():
+                chunks.append(current_chunk.strip())
+                current_chunk = list_text
+            else:
+                current_chunk += "\n" + list_text if current_chunk else list_text
+        else:
+            if len(current_chunk) + len(line) > chunk_size and current_chunk.strip():
+                chunks.append(current_chunk.strip())
+                current_chunk = line
+            else:
+                current_chunk += "\n" + line if current_chunk else line
+            i += 1
+    if current_chunk.strip():
+        chunks.append(current_chunk.strip())
+    return chunks
+
+
+@pytest.fixture(scope="module")
+def table_text() -> str:
+    return build_table_text()
+
+
+@pytest.fixture(scope="module")
+def list_text() -> str:
+    return build_list_text()
+
+
+def test_chunks_respect_token_budgets(table_text, list_text):
+    chunker = SemanticAwareChunker()
+    for chunk_type, text in ((ChunkType.TABLE_HEAVY, table_text), (ChunkType.LIST_HEAVY, list_text)):
+        budget = DocumentTypeOptimizer.get_optimal_config(chunk_type)["chunk_tokens"]
+        chunks = chunker.split_preserving_structure(text, chunk_type)
+        assert chunks
+        # Whole tables may exceed the budget on their own; nothing else may
+        assert all(count_tokens(chunk) <= budget or chunk.count('|') >= 4 for chunk in chunks)
+
+
+@pytest.mark.benchmark(group="tables")
+def test_legacy_tables(benchmark, table_text):
+    benchmark(legacy_split_tables, table_text, LEGACY_CHUNK_SIZES[ChunkType.TABLE_HEAVY])
+
+
+@pytest.mark.benchmark(group="tables")
+def test_token_packer_tables(benchmark, table_text):
+    chunker = SemanticAwareChunker()
+    benchmark(chunker.split_preserving_structure, table_text, ChunkType.TABLE_HEAVY)
+
+
+@pytest.mark.benchmark(group="lists")
+def test_legacy_lists(benchmark, list_text):
+    benchmark(legacy_split_lists, list_text, LEGACY_CHUNK_SIZES[ChunkType.LIST_HEAVY])
+
+
+@pytest.mark.benchmark(group="lists")
+def test_token_packer_lists(benchmark, list_text):
+    chunker = SemanticAwareChunker()
+    benchmark(chunker.split_preserving_structure, list_text, ChunkType.LIST_HEAVY)
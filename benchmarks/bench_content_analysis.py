@@ -0,0 +1,117 @@
+"""
+Benchmark: single-pass content scanner vs. the legacy regex analysis.
+
+The legacy path ran analyze_content and classify_content separately, each
+with its own un-precompiled re calls, on every document and again on every
+chunk. The scanner collects all statistics in one pass and both consumers
+share the result.
+
+Usage:
+    python -m pytest benchmarks/bench_content_analysis.py --benchmark-only
+"""
+
+import os
+import re
+import sys
+from typing import Any, Dict, List
+
+import pytest
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.utils.chunking import ChunkType, scan_content
+
+NARRATIVE = (
+    "Untuk mengakses WiFi kampus, buka pengaturan jaringan dan pilih SSID UII. "
+    "Masukkan username dan password akun portal Anda. Jika koneksi gagal, "
+    "hubungi helpdesk di https://helpdesk.uii.ac.id atau kunjungi www.uii.ac.id! "
+)
+LIST_SECTION = "\n".join(
+    ["## Langkah reset password"]
+    + [f"{i}. Buka portal dan pilih menu reset langkah {i}." for i in range(1, 8)]
+    + [f"- Catatan {i}: simpan password baru dengan aman." for i in range(1, 6)]
+)
+TABLE_SECTION = "\n".join(
+    ["| Layanan | Jam | Lokasi | Kontak |", "| --- | --- | --- | --- |"]
+    + [f"| Layanan {i} | 08.00-16.00 | Gedung {i} | ext. 10{i} |" for i in range(1, 15)]
+)
+
+
+def build_texts() -> List[str]:
+    """Page- and chunk-sized texts mixing narrative, lists, tables and headers."""
+    page = "\n\n".join(["# Panduan Layanan IT", NARRATIVE * 6, LIST_SECTION, TABLE_SECTION, NARRATIVE * 3])
+    chunks = [NARRATIVE * 2, LIST_SECTION, TABLE_SECTION, "### Kontak\n\n" + NARRATIVE]
+    return [page] * 10 + chunks * 25
+
+
+def legacy_analyze_content(text: str) -> Dict[str, Any]:
+    """The previous SemanticAwareChunker.analyze_content."""
+    analysis = {
+        "word_count": len(text.split()),
+        "sentence_count": len(re.findall(r'[.!?]+', text)),
+        "paragraph_count": len([p for p in text.split('\n\n') if p.strip()]),
+        "has_tables": bool(re.search(r'\|.*\|', text)),
+        "has_lists": bool(re.search(r'^\s*[-*•]\s', text, re.MULTILINE)),
+        "has_headers": bool(re.search(r'^#{1,6}\s', text, re.MULTILINE)),
+        "has_links": bool(re.search(r'https?://|www\.|\.com|\.org', text)),
+        "table_count": len(re.findall(r'\|.*\|', text)),
+        "list_count": len(re.findall(r'^\s*[-*•]\s', text, re.MULTILINE)),
+        "link_count": len(re.findall(r'https?://[^\s]+', text))
+    }
+    header_match = re.search(r'^(#{1,6})\s', text, re.MULTILINE)
+    analysis["header_level"] = len(header_match.group(1)) if header_match else None
+    return analysis
+
+
+def legacy_classify_content(text: str) -> ChunkType:
+    """The previous ContentClassifier.classify_content."""
+    table_indicators = len(re.findall(r'\|.*\|', text)) + text.count('\t')
+    list_indicators = len(re.findall(r'^\s*[-*•]\s', text, re.MULTILINE))
+    numbered_list = len(re.findall(r'^\s*\d+\.\s', text, re.MULTILINE))
+    header_indicators = len(re.findall(r'^#{1,6}\s', text, re.MULTILINE))
+    code_indicators = text.count('```') + text.count('def ') + text.count('function ')
+
+    if table_indicators >= 3:
+        return ChunkType.TABLE_HEAVY
+    elif (list_indicators + numbered_list) >= 3:
+        return ChunkType.LIST_HEAVY
+    elif header_indicators >= 2:
+        return ChunkType.HEADER_SECTION
+    elif code_indicators >= 2:
+        return ChunkType.CODE_BLOCK
+    elif table_indicators + list_indicators + header_indicators >= 2:
+        return ChunkType.MIXED_CONTENT
+    return ChunkType.NARRATIVE_TEXT
+
+
+def run_legacy(texts: List[str]) -> list:
+    return [(legacy_analyze_content(text), legacy_classify_content(text)) for text in texts]
+
+
+def run_scanner(texts: List[str]) -> list:
+    results = []
+    for text in texts:
+        profile = scan_content(text)
+        results.append((profile.to_analysis(), profile.chunk_type))
+    return results
+
+
+@pytest.fixture(scope="module")
+def texts() -> List[str]:
+    return build_texts()
+
+
+def test_scanner_matches_legacy(texts):
+    assert run_scanner(texts) == run_legacy(texts)
+
+
+@pytest.mark.benchmark(group="content-analysis")
+def test_legacy_analysis(benchmark, texts):
+    benchmark(run_legacy, texts)
+
+
+@pytest.mark.benchmark(group="content-analysis")
+def test_single_pass_scanner(benchmark, texts):
+    benchmark(run_scanner, texts)
@@ -0,0 +1,140 @@
+"""
+Import-time and memory benchmark for the ingestion modules, with a stored baseline.
+
+Each case runs in a fresh interpreter and reports wall time and peak RSS
+(ru_maxrss) of the import, best of several runs. Importing the ingestion
+modules must not pull in the PDF processing libraries; that is checked on
+every run, and with --compare time and memory are checked against the
+baseline as in run_ingestion.py.
+
+Usage:
+    python -m benchmarks.bench_import_time --save       # record a new baseline
+    python -m benchmarks.bench_import_time --compare    # fail on regressions against it
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from typing import Dict, List
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "import_time.json")
+
+# Modules only an extractor that actually runs may import
+HEAVY_MODULES = ("fitz", "pymupdf", "pdfplumber", "camelot", "cv2", "pandas", "pytesseract", "unstructured")
+
+CASES = {
+    "import.file_utils": "import src.utils.file_utils",
+    "import.ocr": "import src.utils.ocr",
+    "import.chunking": "import src.utils.chunking",
+    "load.pymupdf": "import src.utils.file_utils; from src.utils import processors; processors.load('pymupdf')",
+    "load.pdfplumber": "import src.utils.file_utils; from src.utils import processors; processors.load('pdfplumber')",
+    "load.camelot": "import src.utils.file_utils; from src.utils import processors; processors.load('camelot')",
+}
+
+# Imports happen between the two measurements; the rest is interpreter startup
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+{code}
+seconds = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": seconds,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "heavy": sorted(m for m in {heavy!r} if m in sys.modules),
+}}))
+"""
+
+
+def run_case(code: str, repeats: int) -> Dict:
+    """Best import time and peak RSS over fresh interpreters."""
+    runs = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(code=code, heavy=HEAVY_MODULES)],
+            cwd=project_root, capture_output=True, text=True, check=True,
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return {
+        "seconds": min(run["seconds"] for run in runs),
+        "rss_mb": min(run["rss_mb"] for run in runs),
+        "heavy": runs[0]["heavy"],
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict, tolerance: float, min_delta: float) -> List[str]:
+    """Print a comparison table and return the names of regressed cases."""
+    regressions = []
+    print(f"\n{'case':20} {'time':>8} {'base':>8} {'Δ':>7}   {'RSS MB':>7} {'base':>7} {'Δ':>7}")
+    for name, result in results.items():
+        base = baseline["results"].get(name)
+        if not base:
+            print(f"{name:20} {result['seconds']:8.3f} {'-':>8} {'new':>7}   {result['rss_mb']:7.0f}")
+            continue
+        time_ratio = result["seconds"] / base["seconds"] if base["seconds"] else 1.0
+        mem_ratio = result["rss_mb"] / base["rss_mb"] if base["rss_mb"] else 1.0
+        slower = time_ratio > 1 + tolerance and result["seconds"] - base["seconds"] > min_delta
+        regressed = slower or mem_ratio > 1 + tolerance
+        if regressed:
+            regressions.append(name)
+        print(f"{name:20} {result['seconds']:8.3f} {base['seconds']:8.3f} {time_ratio - 1:+7.0%}   "
+              f"{result['rss_mb']:7.0f} {base['rss_mb']:7.0f} {mem_ratio - 1:+7.0%}"
+              f"{'   ❌' if regressed else ''}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark import time and memory of the ingestion modules.")
+    parser.add_argument("--repeats", type=int, default=5, help="fresh interpreters per case (best is kept)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="compare against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown / memory growth before a case counts as regressed")
+    parser.add_argument("--min-delta", type=float, default=0.05,
+                        help="ignore slowdowns smaller than this many seconds (timer noise)")
+    args = parser.parse_args()
+
+    results: Dict[str, Dict] = {}
+    exit_code = 0
+    for name, code in CASES.items():
+        results[name] = run_case(code, args.repeats)
+        heavy = results[name]["heavy"]
+        print(f"   ⏱️  {name:20} {results[name]['seconds']:7.3f}s  {results[name]['rss_mb']:6.0f} MB RSS"
+              f"  {', '.join(heavy) if heavy else '-'}")
+        if name.startswith("import.") and heavy:
+            print(f"   ❌ {name} imports PDF processing libraries eagerly: {', '.join(heavy)}")
+            exit_code = 1
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"❌ No baseline at {args.baseline}; run with --save first")
+            return 1
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance, args.min_delta)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+            exit_code = 1
+        else:
+            print(f"\n✅ No regressions beyond {args.tolerance:.0%}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                            "cpus": os.cpu_count()},
+                "results": results,
+            }, f, indent=2, sort_keys=True)
+        print(f"💾 Baseline saved to {args.baseline}")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Benchmark: enhanced_split_documents scaling from 1 to N worker processes.
+
+Documents are extracted once from a synthetic corpus and replicated to the
+requested count; every worker count must produce exactly the serial output.
+
+Usage:
+    python -m benchmarks.bench_parallel_chunking [num_documents] [max_workers]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from benchmarks.corpus import build_corpus
+from src.utils.chunking import enhanced_split_documents
+from src.utils.file_utils import load_pdf_documents
+
+
+def run(num_documents: int = 2000, max_workers: int = 0) -> dict:
+    max_workers = max_workers or os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        build_corpus(tmp_dir, num_files=4, pages_per_file=10)
+        with contextlib.redirect_stdout(io.StringIO()):
+            base_documents = load_pdf_documents(tmp_dir)
+
+    documents = (base_documents * (num_documents // len(base_documents) + 1))[:num_documents]
+
+    worker_counts = sorted({1, 2, 4, 8, max_workers} & set(range(1, max_workers + 1)))
+    timings = {}
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            chunks = enhanced_split_documents(documents, workers=workers)
+        timings[workers] = time.perf_counter() - start
+
+        output = [(chunk.page_content, chunk.metadata) for chunk in chunks]
+        if baseline is None:
+            baseline = output
+        elif output != baseline:
+            raise AssertionError(f"Output with {workers} workers differs from the serial output")
+
+    print("\n" + "="*60)
+    print(f"📊 PARALLEL CHUNKING ({len(documents)} documents, {len(baseline)} chunks)")
+    print("="*60)
+    for workers, seconds in timings.items():
+        print(f"   {workers:>2} worker(s): {seconds:6.2f}s  "
+              f"({len(documents) / seconds:7.1f} docs/s, {timings[1] / seconds:4.2f}x)")
+    print("   ✅ Output identical across worker counts")
+    print("="*60)
+
+    return {"documents": len(documents), "chunks": len(baseline), "seconds": timings}
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    run(*args)
@@ -0,0 +1,133 @@
+"""
+Benchmark: pre-fork server throughput and per-worker memory.
+
+Serves exact top-4 searches over a synthetic vector snapshot (the largest
+piece of shared state) with 1..N workers and reports requests/s and each
+worker's Rss, Pss (Rss with shared pages split between the processes
+sharing them) and private memory. With --no-preload every worker loads its
+own copy of the snapshot after forking, for comparison with loading it once
+in the master.
+
+Usage:
+    python -m benchmarks.bench_prefork [max_workers] [num_vectors] [--no-preload]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+import numpy as np
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from flask import Flask, jsonify
+
+from benchmarks.bench_snapshot_reload import write_snapshot
+from src.core.snapshot import SnapshotManager
+from src.utils.prefork import PreforkServer, _read_memory_kb
+
+
+def build_app(root: str, dimension: int, preload: bool):
+    app = Flask(__name__)
+    state = {"manager": SnapshotManager(root, reload_interval=60) if preload else None}
+    queries = np.random.default_rng(1).standard_normal((64, dimension), dtype=np.float32)
+    counter = [0]
+
+    def init_worker():
+        if state["manager"] is None:
+            state["manager"] = SnapshotManager(root, reload_interval=60)
+
+    @app.route("/search")
+    def search():
+        counter[0] += 1
+        results = state["manager"].current().search(queries[counter[0] % len(queries)], k=4)
+        return jsonify([document.page_content for document, _ in results])
+
+    return app, init_worker
+
+
+def load(port: int, seconds: float, clients: int) -> int:
+    """Requests completed by concurrent clients within the time window."""
+    done = [0] * clients
+    deadline = time.monotonic() + seconds
+
+    def client(i):
+        while time.monotonic() < deadline:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/search", timeout=30) as response:
+                response.read()
+            done[i] += 1
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(done)
+
+
+def measure(root: str, dimension: int, workers: int, preload: bool, seconds: float, clients: int) -> dict:
+    app, init_worker = build_app(root, dimension, preload)
+    server = PreforkServer(app, host="127.0.0.1", port=0, workers=workers, init_worker=init_worker)
+    pid = os.fork()
+    if pid == 0:
+        try:
+            server.serve_forever()
+        finally:
+            os._exit(0)
+
+    # Wait until every worker answers, then warm up
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            load(server.port, 0.5, workers * 2)
+            break
+        except OSError:
+            time.sleep(0.2)
+    requests = load(server.port, seconds, clients)
+
+    worker_pids = [int(p) for p in open(f"/proc/{pid}/task/{pid}/children").read().split()]
+    memory = [_read_memory_kb(worker) for worker in worker_pids]
+    master_memory = _read_memory_kb(pid)
+
+    os.kill(pid, 15)
+    os.waitpid(pid, 0)
+    server.socket.close()
+    return {
+        "workers": workers,
+        "requests_per_second": requests / seconds,
+        "master": master_memory,
+        "worker_memory": memory,
+    }
+
+
+def run(max_workers: int = 4, num_vectors: int = 50000, dimension: int = 1024, preload: bool = True,
+        seconds: float = 5.0, clients: int = 8) -> list:
+    vectors = np.random.default_rng(0).standard_normal((num_vectors, dimension), dtype=np.float32)
+    worker_counts = sorted({1, *range(2, max_workers + 1, 2), max_workers})
+
+    with tempfile.TemporaryDirectory() as root:
+        write_snapshot(root, vectors, "prefork")
+        results = [measure(root, dimension, workers, preload, seconds, clients) for workers in worker_counts]
+
+    print("\n" + "="*72)
+    print(f"🍴 PRE-FORK SERVER ({num_vectors} × {dimension} snapshot, "
+          f"{'loaded in master' if preload else 'loaded per worker'}, {os.cpu_count()} CPU(s))")
+    print("="*72)
+    print(f"   {'Workers':>7} {'Req/s':>8} {'Rss MB/worker':>14} {'Pss MB/worker':>14} {'Private MB/worker':>18}")
+    for result in results:
+        memory = [m for m in result["worker_memory"] if m]
+        average = lambda key: sum(m.get(key, 0) for m in memory) / max(1, len(memory)) / 1024
+        print(f"   {result['workers']:>7} {result['requests_per_second']:>8.1f} {average('Rss'):>14.0f} "
+              f"{average('Pss'):>14.0f} {average('Private'):>18.0f}")
+    print("="*72)
+    return results
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:] if not a.startswith("--")]
+    run(*args[:2], preload="--no-preload" not in sys.argv)
@@ -0,0 +1,107 @@
+"""
+Benchmark: snapshot publish/load time and hot swaps under concurrent queries.
+
+Writes a synthetic snapshot, measures how long a worker takes to map it, then
+publishes new versions while query threads keep searching through a
+SnapshotManager; every query must succeed and see a complete snapshot.
+
+Usage:
+    python -m benchmarks.bench_snapshot_reload [num_vectors] [dimension]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from langchain.schema.document import Document
+
+from src.core.snapshot import SnapshotManager, SnapshotWriter, load_snapshot
+
+
+def write_snapshot(root: str, vectors: np.ndarray, tag: str, batch_size: int = 1000) -> float:
+    start = time.perf_counter()
+    writer = SnapshotWriter(root, vectors.shape[1])
+    for offset in range(0, len(vectors), batch_size):
+        batch = [
+            (f"vec-{row}", Document(page_content=f"{tag} chunk {row}", metadata={"source": f"manual_{row % 50}.pdf"}))
+            for row in range(offset, min(offset + batch_size, len(vectors)))
+        ]
+        writer.add(batch, vectors[offset:offset + batch_size])
+    writer.commit()
+    return time.perf_counter() - start
+
+
+def run(num_vectors: int = 50000, dimension: int = 1024, swaps: int = 3, query_threads: int = 4) -> dict:
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((num_vectors, dimension), dtype=np.float32)
+    queries = rng.standard_normal((64, dimension), dtype=np.float32)
+
+    with tempfile.TemporaryDirectory() as root:
+        write_seconds = write_snapshot(root, vectors, "v0")
+
+        start = time.perf_counter()
+        snapshot = load_snapshot(root)
+        load_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for query in queries:
+            snapshot.search(query, k=4)
+        query_ms = (time.perf_counter() - start) / len(queries) * 1000
+
+        manager = SnapshotManager(root, reload_interval=0)
+        stop = threading.Event()
+        served, errors = [0], []
+
+        def query_loop():
+            i = 0
+            while not stop.is_set():
+                try:
+                    results = manager.current().search(queries[i % len(queries)], k=4)
+                    assert len(results) == 4
+                    served[0] += 1
+                except Exception as e:
+                    errors.append(e)
+                i += 1
+
+        threads = [threading.Thread(target=query_loop) for _ in range(query_threads)]
+        for thread in threads:
+            thread.start()
+        versions = {manager.current().version}
+        for swap in range(swaps):
+            write_snapshot(root, vectors, f"v{swap + 1}")
+            deadline = time.monotonic() + 10
+            while manager.current().version in versions and time.monotonic() < deadline:
+                time.sleep(0.05)
+            versions.add(manager.current().version)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    print("\n" + "="*60)
+    print(f"📸 SNAPSHOT RELOAD ({num_vectors} vectors × {dimension} dims, "
+          f"{vectors.nbytes / (1024 * 1024):.0f} MB)")
+    print("="*60)
+    print(f"   ✍️  Write + publish: {write_seconds:.2f}s")
+    print(f"   📂 Load (map vectors, decode sidecar): {load_seconds * 1000:.0f} ms")
+    print(f"   🔍 Exact top-4 query: {query_ms:.2f} ms")
+    print(f"   🔁 Versions served during {swaps} hot swaps: {len(versions)}")
+    print(f"   ✅ Queries served: {served[0]}, errors: {len(errors)}")
+    print("="*60)
+
+    return {
+        "write_seconds": write_seconds, "load_seconds": load_seconds, "query_ms": query_ms,
+        "versions_served": len(versions), "queries": served[0], "errors": len(errors),
+    }
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    run(*args)
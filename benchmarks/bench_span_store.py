@@ -0,0 +1,107 @@
+"""
+Benchmark: columnar SpanStore vs. the legacy dict-per-span PyMuPDF extraction.
+
+Measures extraction time, peak traced allocations and retained size for a
+synthetic text-heavy manual.
+
+Usage:
+    python -m benchmarks.bench_span_store [pages]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import fitz  # PyMuPDF
+
+from benchmarks.corpus import build_corpus
+from src.utils.file_utils import PDFStructureExtractor
+
+
+def legacy_extract_text_blocks(pdf_path: str) -> dict:
+    """The previous extract_with_pymupdf: one dict per span plus a font_key string per span."""
+    extractor = PDFStructureExtractor()
+    doc = fitz.open(pdf_path)
+    extracted_data = {"text_blocks": [], "fonts": {}}
+    for page_num in range(len(doc)):
+        blocks = doc[page_num].get_text("dict")
+        for block in blocks.get("blocks", []):
+            if "lines" in block:
+                for line in block["lines"]:
+                    for span in line.get("spans", []):
+                        font_info = {
+                            "font": span.get("font", ""),
+                            "size": span.get("size", 0),
+                            "flags": span.get("flags", 0),
+                            "color": span.get("color", 0)
+                        }
+                        extracted_data["text_blocks"].append({
+                            "text": span.get("text", ""),
+                            "bbox": span.get("bbox", []),
+                            "page": page_num + 1,
+                            "font_info": font_info,
+                            "is_header": extractor._is_header(
+                                font_info["size"], font_info["flags"], span.get("text", "")
+                            )
+                        })
+                        font_key = f"{font_info['font']}_{font_info['size']}"
+                        if font_key not in extracted_data["fonts"]:
+                            extracted_data["fonts"][font_key] = {"count": 0, "font_info": font_info}
+                        extracted_data["fonts"][font_key]["count"] += 1
+        
+        # Images and links are extracted the same way in both versions
+        page = doc[page_num]
+        for img_index, img in enumerate(page.get_images()):
+            page.get_image_bbox(img)
+        page.get_links()
+    doc.close()
+    return extracted_data
+
+
+def measure(fn, pdf_path: str) -> dict:
+    """Run fn once untraced for timing, then traced for peak and retained memory."""
+    start = time.perf_counter()
+    fn(pdf_path)
+    seconds = time.perf_counter() - start
+    
+    tracemalloc.start()
+    result = fn(pdf_path)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {"seconds": seconds, "peak_mb": peak / 2**20, "retained_mb": retained / 2**20,
+            "records": len(result["text_blocks"])}
+
+
+def run(pages: int = 200) -> dict:
+    extractor = PDFStructureExtractor()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = build_corpus(
+            tmp_dir, num_files=1, pages_per_file=pages,
+            page_mix="narrative:6,list:3,stream_table:1"
+        )[0]
+        legacy = measure(legacy_extract_text_blocks, pdf_path)
+        compact = measure(extractor.extract_with_pymupdf, pdf_path)
+    
+    print("\n" + "=" * 60)
+    print(f"📊 SPAN STORE BENCHMARK ({pages} pages)")
+    print("=" * 60)
+    for name, result in (("dict-per-span", legacy), ("SpanStore", compact)):
+        print(f"{name:>14}: {result['seconds']:6.2f}s  peak {result['peak_mb']:7.1f} MB  "
+              f"retained {result['retained_mb']:7.1f} MB  ({result['records']} records)")
+    print(f"🚀 Time: {legacy['seconds'] / max(1e-9, compact['seconds']):.1f}x faster, "
+          f"retained memory: {legacy['retained_mb'] / max(1e-9, compact['retained_mb']):.1f}x smaller")
+    print("=" * 60 + "\n")
+    
+    return {"legacy": legacy, "compact": compact}
+
+
+if __name__ == "__main__":
+    run(*[int(a) for a in sys.argv[1:2]])
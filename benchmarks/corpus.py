@@ -0,0 +1,138 @@
+"""
+Reproducible synthetic PDF corpus for ingestion benchmarks.
+
+Pages are generated with PyMuPDF from a seeded random source, so the same
+arguments always produce byte-identical content.
+"""
+
+import os
+import random
+from typing import List
+
+import fitz  # PyMuPDF
+
+WORDS = (
+    "akun email mahasiswa dosen jaringan wifi kampus password reset login "
+    "portal layanan sistem akademik perpustakaan keuangan server printer "
+    "aplikasi office lisensi instalasi konfigurasi keamanan verifikasi "
+    "pengguna data unduh unggah formulir bantuan teknis prosedur"
+).split()
+
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842  # A4 in points
+MARGIN = 50
+
+
+def _sentence(rng: random.Random, min_words: int = 8, max_words: int = 18) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng: random.Random, sentences: int = 5) -> str:
+    return " ".join(_sentence(rng) for _ in range(sentences))
+
+
+def add_narrative_page(doc: fitz.Document, rng: random.Random) -> None:
+    """Add a page of plain paragraphs under a large header."""
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    page.insert_text((MARGIN, MARGIN + 10), _sentence(rng, 3, 5).upper(), fontsize=20)
+    body = "\n\n".join(_paragraph(rng) for _ in range(4))
+    page.insert_textbox(
+        fitz.Rect(MARGIN, MARGIN + 40, PAGE_WIDTH - MARGIN, PAGE_HEIGHT - MARGIN),
+        body, fontsize=10,
+    )
+
+
+def add_list_page(doc: fitz.Document, rng: random.Random, items: int = 12) -> None:
+    """Add a page of bullet and numbered steps."""
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    page.insert_text((MARGIN, MARGIN + 10), "Langkah-langkah", fontsize=16)
+    lines = [f"- {_sentence(rng, 4, 8)}" for _ in range(items // 2)]
+    lines += [f"{i}. {_sentence(rng, 4, 8)}" for i in range(1, items - items // 2 + 1)]
+    page.insert_textbox(
+        fitz.Rect(MARGIN, MARGIN + 40, PAGE_WIDTH - MARGIN, PAGE_HEIGHT - MARGIN),
+        "\n".join(lines), fontsize=10,
+    )
+
+
+def add_table_page(
+    doc: fitz.Document, rng: random.Random, rows: int = 8, cols: int = 4, ruled: bool = True
+) -> None:
+    """Add a page holding one table, drawn with ruling lines or aligned columns only."""
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    page.insert_text((MARGIN, MARGIN + 10), f"Tabel {_sentence(rng, 2, 3)}", fontsize=14)
+    
+    top, row_height = MARGIN + 40, 22
+    col_width = (PAGE_WIDTH - 2 * MARGIN) / cols
+    for r in range(rows):
+        for c in range(cols):
+            text = f"Kolom {c + 1}" if r == 0 else f"{rng.choice(WORDS)} {rng.randint(1, 999)}"
+            page.insert_text((MARGIN + c * col_width + 4, top + r * row_height + 15), text, fontsize=9)
+    
+    if ruled:
+        bottom = top + rows * row_height
+        for r in range(rows + 1):
+            y = top + r * row_height
+            page.draw_line((MARGIN, y), (PAGE_WIDTH - MARGIN, y))
+        for c in range(cols + 1):
+            x = MARGIN + c * col_width
+            page.draw_line((x, top), (x, bottom))
+
+
+def add_image_page(doc: fitz.Document, rng: random.Random) -> None:
+    """Add a page with no text layer, only a rasterized rendering of text (a 'scan')."""
+    source = fitz.open()
+    add_narrative_page(source, rng)
+    pixmap = source[0].get_pixmap(dpi=100)
+    source.close()
+    
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    page.insert_image(page.rect, pixmap=pixmap)
+
+
+PAGE_BUILDERS = {
+    "narrative": add_narrative_page,
+    "list": add_list_page,
+    "ruled_table": lambda doc, rng: add_table_page(doc, rng, ruled=True),
+    "stream_table": lambda doc, rng: add_table_page(doc, rng, ruled=False),
+    "image": add_image_page,
+}
+
+
+def build_corpus(
+    output_dir: str,
+    num_files: int = 4,
+    pages_per_file: int = 10,
+    page_mix: str = "narrative:5,list:2,ruled_table:2,stream_table:1",
+    seed: int = 42,
+) -> List[str]:
+    """
+    Write a synthetic PDF corpus and return the generated file paths.
+    
+    Args:
+        output_dir: Directory to write PDFs into (created if missing)
+        num_files: Number of PDF files
+        pages_per_file: Pages per PDF
+        page_mix: Comma-separated 'kind:weight' pairs from PAGE_BUILDERS
+        seed: Random seed; identical arguments give identical PDFs
+    """
+    rng = random.Random(seed)
+    kinds, weights = [], []
+    for entry in page_mix.split(","):
+        kind, weight = entry.split(":")
+        kinds.append(kind.strip())
+        weights.append(float(weight))
+    
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for file_idx in range(num_files):
+        doc = fitz.open()
+        for _ in range(pages_per_file):
+            kind = rng.choices(kinds, weights=weights)[0]
+            PAGE_BUILDERS[kind](doc, rng)
+        
+        path = os.path.join(output_dir, f"manual_{file_idx:03d}.pdf")
+        doc.save(path, deflate=True, no_new_id=True)
+        doc.close()
+        paths.append(path)
+    
+    return paths
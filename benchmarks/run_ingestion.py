@@ -0,0 +1,182 @@
+"""
+Ingestion benchmark suite with stored time and peak-memory baselines.
+
+Generates the synthetic corpus (narrative pages with headers, bullet and
+numbered lists, ruled and unruled tables, image-only pages) and measures each
+extractor, the chunkers and the end-to-end load_pdf_documents path. Timings
+are the best of several repeats; peak memory is the traced allocation peak of
+one extra run.
+
+Usage:
+    python -m benchmarks.run_ingestion --save       # record a new baseline
+    python -m benchmarks.run_ingestion --compare    # fail on regressions against it
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from benchmarks.corpus import build_corpus
+from src.utils.chunking import enhanced_split_documents
+from src.utils.dedup import deduplicate_chunks
+from src.utils.file_utils import (
+    CAMELOT_AVAILABLE, PDFPLUMBER_AVAILABLE, PYMUPDF_AVAILABLE,
+    EnhancedPDFProcessor, PDFStructureExtractor, load_pdf_documents, split_documents
+)
+from src.utils.ocr import OCR_AVAILABLE, PageOCR
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "ingestion.json")
+PAGE_MIX = "narrative:4,list:2,ruled_table:2,stream_table:1,image:1"
+# Chunking is fast per document; replicate the corpus so timings rise above noise
+CHUNK_REPLICAS = 25
+
+
+def measure(fn: Callable[[], object], repeats: int) -> Dict[str, float]:
+    """Best and median wall time over repeats, plus traced peak memory of one run."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "seconds": min(timings),
+        "median_seconds": statistics.median(timings),
+        "peak_mb": peak / (1024 * 1024),
+    }
+
+
+def build_cases(pdf_files: List[str], corpus_dir: str) -> List[Tuple[str, Callable[[], object]]]:
+    """Benchmark cases, skipping extractors that are not installed."""
+    extractor = PDFStructureExtractor()
+    cases = []
+
+    def each_file(method, **kwargs):
+        return lambda: [method(pdf_file, **kwargs) for pdf_file in pdf_files]
+
+    if PYMUPDF_AVAILABLE:
+        cases.append(("extract.pymupdf", each_file(extractor.extract_with_pymupdf)))
+        cases.append(("extract.detect_table_pages", each_file(extractor.detect_table_pages)))
+    if PDFPLUMBER_AVAILABLE:
+        cases.append(("extract.pdfplumber", each_file(extractor.extract_with_pdfplumber)))
+    if CAMELOT_AVAILABLE:
+        candidate_pages = {pdf_file: extractor.detect_table_pages(pdf_file) for pdf_file in pdf_files}
+        cases.append(("extract.camelot", lambda: [
+            extractor.extract_with_camelot(pdf_file, pages=candidate_pages[pdf_file])
+            for pdf_file in pdf_files
+        ]))
+    if OCR_AVAILABLE and PYMUPDF_AVAILABLE:
+        ocr = PageOCR(cache_dir=None)
+        cases.append(("extract.ocr", each_file(ocr.ocr_pdf)))
+
+    cases.append(("load_pdf_documents", lambda: load_pdf_documents(corpus_dir)))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        processor = EnhancedPDFProcessor()
+        documents = [doc for pdf_file in pdf_files for doc in processor.process_pdf(pdf_file)]
+        documents = documents * CHUNK_REPLICAS
+        chunks = enhanced_split_documents(documents)
+    cases.append(("chunk.enhanced_split_documents", lambda: enhanced_split_documents(documents)))
+    cases.append(("chunk.split_documents", lambda: split_documents(documents)))
+    cases.append(("chunk.deduplicate", lambda: deduplicate_chunks(chunks)))
+    return cases
+
+
+def compare(
+    results: Dict[str, Dict[str, float]], baseline: Dict, tolerance: float, min_delta: float
+) -> List[str]:
+    """Print a comparison table and return the names of regressed cases."""
+    regressions = []
+    print(f"\n{'case':34} {'time':>9} {'base':>9} {'Δ':>7}   {'peak MB':>8} {'base':>8} {'Δ':>7}")
+    for name, result in results.items():
+        base = baseline["results"].get(name)
+        if not base:
+            print(f"{name:34} {result['seconds']:9.3f} {'-':>9} {'new':>7}   {result['peak_mb']:8.1f}")
+            continue
+        time_ratio = result["seconds"] / base["seconds"] if base["seconds"] else 1.0
+        mem_ratio = result["peak_mb"] / base["peak_mb"] if base["peak_mb"] else 1.0
+        slower = time_ratio > 1 + tolerance and result["seconds"] - base["seconds"] > min_delta
+        regressed = slower or mem_ratio > 1 + tolerance
+        if regressed:
+            regressions.append(name)
+        print(f"{name:34} {result['seconds']:9.3f} {base['seconds']:9.3f} {time_ratio - 1:+7.0%}   "
+              f"{result['peak_mb']:8.1f} {base['peak_mb']:8.1f} {mem_ratio - 1:+7.0%}"
+              f"{'   ❌' if regressed else ''}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ingestion stages on a synthetic PDF corpus.")
+    parser.add_argument("--files", type=int, default=4, help="PDF files in the corpus")
+    parser.add_argument("--pages", type=int, default=10, help="pages per PDF file")
+    parser.add_argument("--repeats", type=int, default=3, help="timed runs per case (best is kept)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="compare against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown / memory growth before a case counts as regressed")
+    parser.add_argument("--min-delta", type=float, default=0.02,
+                        help="ignore slowdowns smaller than this many seconds (timer noise)")
+    args = parser.parse_args()
+
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        pdf_files = build_corpus(corpus_dir, num_files=args.files, pages_per_file=args.pages, page_mix=PAGE_MIX)
+        print(f"📚 Corpus: {len(pdf_files)} files × {args.pages} pages ({PAGE_MIX})")
+
+        for name, fn in build_cases(pdf_files, corpus_dir):
+            results[name] = measure(fn, args.repeats)
+            print(f"   ⏱️  {name:34} {results[name]['seconds']:8.3f}s  {results[name]['peak_mb']:7.1f} MB peak")
+
+    exit_code = 0
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"❌ No baseline at {args.baseline}; run with --save first")
+            return 1
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("corpus") != {"files": args.files, "pages": args.pages, "page_mix": PAGE_MIX}:
+            print("⚠️  Baseline was recorded on a different corpus; ratios are not comparable")
+        regressions = compare(results, baseline, args.tolerance, args.min_delta)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+            exit_code = 1
+        else:
+            print(f"\n✅ No regressions beyond {args.tolerance:.0%}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "corpus": {"files": args.files, "pages": args.pages, "page_mix": PAGE_MIX},
+                "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                            "cpus": os.cpu_count()},
+                "results": results,
+            }, f, indent=2, sort_keys=True)
+        print(f"💾 Baseline saved to {args.baseline}")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
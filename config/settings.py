@@ -6,9 +6,128 @@ load_dotenv()
 class Config:
     PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-    PINECONE_INDEX_NAME = "chatbot-index"
+    
+    # Embedding model and index profiles. text-embedding-3 models support native
+    # dimension reduction, so smaller profiles reuse the same model.
+    EMBEDDING_MODEL = "text-embedding-3-large"
+    EMBEDDING_NATIVE_DIMENSION = 3072
+    INDEX_PROFILES = {
+        "compact": {"dimension": 256, "metric": "cosine", "index_name": "chatbot-index-256"},
+        "balanced": {"dimension": 1024, "metric": "cosine", "index_name": "chatbot-index-1024"},
+        "full": {"dimension": 3072, "metric": "cosine", "index_name": "chatbot-index"},
+    }
+    INDEX_PROFILE = os.getenv("INDEX_PROFILE", "full")
+    # Paths below derive from the index name, so an unknown profile must fail here (as in get_index_profile)
+    if INDEX_PROFILE not in INDEX_PROFILES:
+        raise ValueError(
+            f"Unknown index profile '{INDEX_PROFILE}'. Choose one of: {', '.join(INDEX_PROFILES)}"
+        )
+    PINECONE_INDEX_NAME = INDEX_PROFILES[INDEX_PROFILE]["index_name"]
+    INDEX_MANIFEST_PATH = os.getenv(
+        "INDEX_MANIFEST_PATH", f"data/.index_manifest-{PINECONE_INDEX_NAME}.json"
+    )
+    
+    EXTRACTION_CACHE_DIR = os.getenv("EXTRACTION_CACHE_DIR", "data/.extraction_cache")
+    
+    # Worker processes for semantic chunking (0 = one per CPU)
+    CHUNK_WORKERS = int(os.getenv("CHUNK_WORKERS", "0"))
+    
+    # Near-duplicate chunk elimination (MinHash/LSH) before embedding
+    DEDUP_ENABLED = os.getenv("DEDUP_ENABLED", "true").lower() == "true"
+    DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.8"))
+    
+    # OCR of scanned (image-only) pages
+    OCR_DPI = int(os.getenv("OCR_DPI", "300"))
+    OCR_WORKERS = int(os.getenv("OCR_WORKERS", "0"))  # 0 = one per CPU
+    OCR_LANG = os.getenv("OCR_LANG", "eng")
+    OCR_MIN_TEXT_CHARS = int(os.getenv("OCR_MIN_TEXT_CHARS", "20"))
+    OCR_CACHE_DIR = os.getenv("OCR_CACHE_DIR", "data/.ocr_cache")
+    
+    # Vector metadata: "indexed" fields are filterable, "stored" ones are only
+    # returned with results; every other chunk field stays local
+    METADATA_SCHEMA = {
+        "indexed": ["file_name", "page", "chunk_type", "content_type", "is_table"],
+        "stored": ["source"],
+    }
+    # Keep chunk text out of the index and read it from a local SQLite store
+    TEXT_SIDE_STORE = os.getenv("TEXT_SIDE_STORE", "false").lower() == "true"
+    TEXT_STORE_PATH = os.getenv("TEXT_STORE_PATH", f"data/.text_store-{PINECONE_INDEX_NAME}.sqlite")
+    
+    # Micro-batching of concurrent query embeddings while serving: wait up to
+    # this many milliseconds (0 disables) or until the batch is full
+    EMBED_BATCH_MAX_WAIT_MS = float(os.getenv("EMBED_BATCH_MAX_WAIT_MS", "5"))
+    EMBED_BATCH_MAX_SIZE = int(os.getenv("EMBED_BATCH_MAX_SIZE", "32"))
+    
+    # Pre-filter retrieval by metadata inferred from the question (manual
+    # names, table lookups); filtered results scoring below the minimum
+    # cosine similarity fall back to an unfiltered search
+    INTENT_FILTERING = os.getenv("INTENT_FILTERING", "true").lower() == "true"
+    INTENT_MIN_SCORE = float(os.getenv("INTENT_MIN_SCORE", "0.3"))
+    
+    # Serving backend: "pinecone", or "snapshot" for local memory-mapped
+    # snapshots written by setup_index.py --snapshot (hot-swapped on publish)
+    VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "pinecone")
+    SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", f"data/snapshots/{PINECONE_INDEX_NAME}")
+    SNAPSHOT_KEEP = int(os.getenv("SNAPSHOT_KEEP", "3"))
+    SNAPSHOT_RELOAD_INTERVAL = float(os.getenv("SNAPSHOT_RELOAD_INTERVAL", "5"))
+    
+    # Production server (serve.py): pre-forked workers (0 = one per CPU),
+    # each replaced after SERVER_MAX_REQUESTS (+ random jitter; 0 = never)
+    SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+    SERVER_PORT = int(os.getenv("SERVER_PORT", "5000"))
+    SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "0"))
+    SERVER_MAX_REQUESTS = int(os.getenv("SERVER_MAX_REQUESTS", "1000"))
+    SERVER_MAX_REQUESTS_JITTER = int(os.getenv("SERVER_MAX_REQUESTS_JITTER", "100"))
+    SERVER_GRACEFUL_TIMEOUT = float(os.getenv("SERVER_GRACEFUL_TIMEOUT", "60"))
+    
+    # Static assets: scripts/build_assets.py writes minified, fingerprinted and
+    # precompressed copies to STATIC_DIST_DIR; dynamic responses of at least
+    # COMPRESS_MIN_BYTES are gzipped
+    STATIC_DIR = "static"
+    STATIC_DIST_DIR = os.getenv("STATIC_DIST_DIR", "static/dist")
+    COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+    
+    # Ingestion console verbosity (DEBUG shows per-file steps) and telemetry report
+    INGEST_LOG_LEVEL = os.getenv("INGEST_LOG_LEVEL", "INFO")
+    INGEST_TELEMETRY_PATH = os.getenv("INGEST_TELEMETRY_PATH", "data/.ingest_telemetry.json")
+    
+    # Namespace sharding: PDFs in data/<collection>/ are indexed into their own
+    # namespace, with their own manifest and snapshot, and can be re-indexed
+    # independently; PDFs directly in data/ use the default namespace. Queries
+    # fan out to the relevant shards, waiting at most SHARD_TIMEOUT seconds
+    SHARD_TIMEOUT = float(os.getenv("SHARD_TIMEOUT", "2.0"))
+    
+    # Watch daemon (scripts/watch_index.py): rebuilds changed collections into
+    # their standby blue/green namespace once data/ has been quiet for
+    # WATCH_DEBOUNCE seconds, and flips the serving pointer after verifying it
+    SERVING_POINTER_PATH = os.getenv("SERVING_POINTER_PATH", f"data/.serving-{PINECONE_INDEX_NAME}.json")
+    WATCH_INTERVAL = float(os.getenv("WATCH_INTERVAL", "5"))
+    WATCH_DEBOUNCE = float(os.getenv("WATCH_DEBOUNCE", "30"))
+    WATCH_VERIFY_TIMEOUT = float(os.getenv("WATCH_VERIFY_TIMEOUT", "60"))
+    
+    # Indexing throughput
+    UPSERT_BATCH_SIZE = int(os.getenv("UPSERT_BATCH_SIZE", "100"))
+    EMBED_MAX_CONCURRENCY = int(os.getenv("EMBED_MAX_CONCURRENCY", "4"))
+    
+    @classmethod
+    def get_index_profile(cls, name=None):
+        """Return the settings of an index profile (the active one by default)."""
+        name = name or cls.INDEX_PROFILE
+        if name not in cls.INDEX_PROFILES:
+            raise ValueError(
+                f"Unknown index profile '{name}'. Choose one of: {', '.join(cls.INDEX_PROFILES)}"
+            )
+        return {"name": name, **cls.INDEX_PROFILES[name]}
+    
+    @classmethod
+    def namespace_path(cls, path, namespace=""):
+        """Per-namespace variant of a manifest/snapshot path ("x.json" -> "x@ns.json")."""
+        if not namespace:
+            return path
+        root, ext = os.path.splitext(path)
+        return f"{root}@{namespace}{ext}"
     
     @classmethod
     def validate(cls):
         if not cls.PINECONE_API_KEY or not cls.OPENAI_API_KEY:
-            raise ValueError("API keys are missing. Please check your .env file.")
\ No newline at end of file
+            raise ValueError("API keys are missing. Please check your .env file.")
@@ -0,0 +1,139 @@
+import sys
+import os
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import shutil
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from config.settings import Config
+
+# Optional: brotli variants (browsers prefer them over gzip)
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Optional: full JS/CSS minifiers; without them a conservative whitespace/comment pass is used
+try:
+    import rjsmin
+    import rcssmin
+    MINIFIERS_AVAILABLE = True
+except ImportError:
+    MINIFIERS_AVAILABLE = False
+
+ASSET_EXTENSIONS = (".css", ".js")
+
+def minify_css(source):
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    if MINIFIERS_AVAILABLE:
+        return rcssmin.cssmin(source)
+    source = re.sub(r"/\*.*?\*/", "", source, flags=re.DOTALL)
+    source = re.sub(r"\s+", " ", source)
+    source = re.sub(r"\s*([{};,>])\s*", r"\1", source)
+    source = re.sub(r":\s+", ":", source)
+    return source.replace(";}", "}").strip()
+
+def minify_js(source):
+    """
+    Drop comment lines, blank lines and indentation from a script.
+    
+    Lines inside template literals are kept verbatim, so the embedded CSS and
+    HTML strings are unchanged; trailing comments after code are left alone.
+    """
+    if MINIFIERS_AVAILABLE:
+        return rjsmin.jsmin(source)
+    lines = []
+    in_template = False
+    for line in source.splitlines():
+        stripped = line.strip()
+        if not in_template:
+            if not stripped or stripped.startswith("//"):
+                continue
+            line = stripped
+        lines.append(line)
+        # Unescaped backticks outside quotes toggle template-literal state
+        code = re.sub(r"\\.", "", line)
+        if not in_template:
+            code = re.sub(r"'[^']*'|\"[^\"]*\"", "", code)
+        if code.count("`") % 2:
+            in_template = not in_template
+    return "\n".join(lines) + "\n"
+
+def build_assets(static_dir=Config.STATIC_DIR, dist_dir=Config.STATIC_DIST_DIR, compress_level=9):
+    """
+    Minify, fingerprint and precompress the CSS and JS under static_dir.
+    
+    Each asset is written as dist_dir/<path>.<hash>.<ext> plus .gz (and .br
+    when brotli is installed) variants; manifest.json maps the source path
+    to the hashed one and records its hash for the ETag.
+    
+    Returns:
+        The manifest dict
+    """
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+    os.makedirs(dist_dir)
+
+    manifest = {}
+    for directory, subdirs, files in os.walk(static_dir):
+        subdirs[:] = [d for d in subdirs if os.path.join(directory, d) != dist_dir]
+        for file_name in sorted(files):
+            if not file_name.endswith(ASSET_EXTENSIONS):
+                continue
+            source_path = os.path.join(directory, file_name)
+            relative_path = os.path.relpath(source_path, static_dir).replace(os.sep, "/")
+            with open(source_path, "r", encoding="utf-8") as f:
+                source = f.read()
+
+            minified = minify_css(source) if file_name.endswith(".css") else minify_js(source)
+            data = minified.encode("utf-8")
+            digest = hashlib.sha256(data).hexdigest()[:12]
+            stem, extension = os.path.splitext(relative_path)
+            hashed_path = f"{stem}.{digest}{extension}"
+
+            output_path = os.path.join(dist_dir, hashed_path)
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            with open(output_path, "wb") as f:
+                f.write(data)
+            variants = {"identity": len(data)}
+            with open(f"{output_path}.gz", "wb") as f:
+                # mtime=0 keeps the .gz byte-identical across builds
+                compressed = gzip.compress(data, compresslevel=compress_level, mtime=0)
+                f.write(compressed)
+                variants["gzip"] = len(compressed)
+            if BROTLI_AVAILABLE:
+                with open(f"{output_path}.br", "wb") as f:
+                    compressed = brotli.compress(data, quality=11)
+                    f.write(compressed)
+                    variants["br"] = len(compressed)
+
+            manifest[relative_path] = {"path": hashed_path, "hash": digest, "bytes": variants}
+            sizes = ", ".join(f"{encoding} {size / 1024:.1f} KB" for encoding, size in variants.items())
+            print(f"📦 {relative_path} ({len(source.encode('utf-8')) / 1024:.1f} KB) → {hashed_path} [{sizes}]")
+
+    with open(os.path.join(dist_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def main():
+    parser = argparse.ArgumentParser(description="Build minified, fingerprinted and precompressed static assets")
+    parser.add_argument("--static-dir", default=Config.STATIC_DIR, help="Source static directory")
+    parser.add_argument("--dist-dir", default=Config.STATIC_DIST_DIR, help="Output directory (replaced)")
+    args = parser.parse_args()
+
+    if not BROTLI_AVAILABLE:
+        print("⚠️  brotli not installed; writing gzip variants only")
+    if not MINIFIERS_AVAILABLE:
+        print("ℹ️  rjsmin/rcssmin not installed; using the built-in conservative minifier")
+    manifest = build_assets(args.static_dir, args.dist_dir)
+    print(f"✅ Built {len(manifest)} asset(s) into {args.dist_dir}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Compare index profiles (embedding dimensions) on a labelled question set.
+
+Embeds the corpus once at full dimension (cached on disk), derives each
+smaller profile by truncation + re-normalization (equivalent to the API's
+`dimensions` parameter), and reports recall@k, MRR, query latency and bytes
+per vector for every profile in Config.INDEX_PROFILES.
+
+Usage:
+    python scripts/evaluate_profiles.py --questions eval/questions.jsonl
+"""
+
+import sys
+import os
+import argparse
+import json
+import time
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import numpy as np
+
+from config.settings import Config
+from src.core.embeddings import get_cached_embeddings
+from src.core.local_index import LocalVectorIndex, truncate_embeddings
+from src.core.metadata_schema import MetadataSchema, payload_report
+from src.evaluation.dataset import load_questions
+from src.evaluation.metrics import percentile, summarize_rankings
+from src.utils.chunking import enhanced_split_documents
+from src.utils.file_utils import load_pdf_documents
+from src.utils.manifest import assign_vector_ids
+from src.utils.telemetry import configure_logging
+
+
+def load_corpus_chunks(data_dir):
+    """Extract and chunk the corpus the same way setup_index.py does."""
+    documents = load_pdf_documents(data_dir, use_enhanced_processing=True)
+    chunks = enhanced_split_documents(documents, enhance_metadata=True, preserve_structure=True)
+    return assign_vector_ids(chunks)
+
+
+def evaluate_profile(profile, chunk_vectors, query_vectors, ids, texts, questions, ks, repeats=5):
+    """Evaluate one profile on pre-computed full-size embeddings."""
+    dimension = profile["dimension"]
+    index = LocalVectorIndex(ids, truncate_embeddings(chunk_vectors, dimension), texts=texts, normalized=True)
+    queries = truncate_embeddings(query_vectors, dimension)
+    max_k = max(ks)
+
+    rankings, latencies = [], []
+    for query, question in zip(queries, questions):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            results = index.search(query, k=max_k)
+        latencies.append((time.perf_counter() - start) / repeats * 1000)
+        rankings.append([question.is_relevant(ids[row], texts[row]) for row, _ in results])
+
+    summary = summarize_rankings(rankings, ks)
+    summary.update({
+        "profile": profile["name"],
+        "dimension": dimension,
+        "latency_p50_ms": percentile(latencies, 50),
+        "latency_p95_ms": percentile(latencies, 95),
+        "vector_bytes": dimension * 4,  # float32 values as stored by Pinecone
+    })
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate recall/latency/size of each index profile.")
+    parser.add_argument("--questions", required=True, help="labelled question set (JSONL)")
+    parser.add_argument("--data-dir", default="data/", help="directory with the PDF corpus")
+    parser.add_argument("--k", default="1,3,5", help="comma-separated cut-offs for recall@k")
+    parser.add_argument("--cache-dir", default="data/.embedding_cache", help="embedding cache directory")
+    parser.add_argument("--tolerance", type=float, default=0.02,
+                        help="allowed recall/MRR drop vs. the largest profile when recommending")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+    configure_logging()
+
+    ks = sorted(int(k) for k in args.k.split(","))
+    questions = load_questions(args.questions)
+    print(f"\n❓ Loaded {len(questions)} labelled questions")
+
+    chunks = load_corpus_chunks(args.data_dir)
+    if not chunks:
+        print("❌ No chunks to evaluate. Please add PDF files to the data directory.")
+        return
+    ids = [vector_id for vector_id, _ in chunks]
+    texts = [chunk.page_content for _, chunk in chunks]
+    # Metadata as upserted: the schema's fields plus the chunk text (unless kept in the side store)
+    metadata_bytes = payload_report(
+        [chunk for _, chunk in chunks], MetadataSchema.from_config(), Config.EMBEDDING_NATIVE_DIMENSION,
+        text_remote=not Config.TEXT_SIDE_STORE
+    )["lean_metadata_bytes"]
+
+    # One full-size embedding pass; smaller profiles are truncations of it
+    print(f"\n🤖 Embedding {len(texts)} chunks at {Config.EMBEDDING_NATIVE_DIMENSION} dims (cached)...")
+    embeddings = get_cached_embeddings(args.cache_dir, profile="full")
+    chunk_vectors = np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+    query_vectors = np.asarray([embeddings.embed_query(q.question) for q in questions], dtype=np.float32)
+
+    profiles = sorted(
+        (Config.get_index_profile(name) for name in Config.INDEX_PROFILES),
+        key=lambda profile: profile["dimension"]
+    )
+    results = [
+        evaluate_profile(profile, chunk_vectors, query_vectors, ids, texts, questions, ks)
+        for profile in profiles
+    ]
+
+    # Report
+    recall_cols = [f"recall@{k}" for k in ks]
+    print("\n" + "=" * 100)
+    print("📊 INDEX PROFILE EVALUATION")
+    print("=" * 100)
+    print(f"{'profile':<10}{'dims':>6}" + "".join(f"{c:>11}" for c in recall_cols)
+          + f"{'MRR':>8}{'p50 ms':>9}{'p95 ms':>9}{'vec B':>8}{'vec+meta B':>12}")
+    for r in results:
+        print(f"{r['profile']:<10}{r['dimension']:>6}" + "".join(f"{r[c]:>11.3f}" for c in recall_cols)
+              + f"{r['mrr']:>8.3f}{r['latency_p50_ms']:>9.3f}{r['latency_p95_ms']:>9.3f}"
+              + f"{r['vector_bytes']:>8}{r['vector_bytes'] + metadata_bytes:>12.0f}")
+    print("=" * 100)
+    print(f"ℹ️  Latency is exact local search over {len(ids)} vectors; "
+          f"metadata payload averages {metadata_bytes:.0f} bytes per vector")
+
+    reference = results[-1]
+    main_recall = recall_cols[-1]
+    for r in results:
+        if (r[main_recall] >= reference[main_recall] - args.tolerance
+                and r["mrr"] >= reference["mrr"] - args.tolerance):
+            print(f"✅ Recommended profile: '{r['profile']}' ({r['dimension']} dims) - "
+                  f"within {args.tolerance:.0%} of '{reference['profile']}' on {main_recall} and MRR")
+            print(f"   Set INDEX_PROFILE={r['profile']} and run scripts/setup_index.py to build it")
+            break
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"metadata_bytes": metadata_bytes, "results": results}, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
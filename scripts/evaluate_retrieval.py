@@ -0,0 +1,200 @@
+"""
+Compare chunking and retriever settings on a labelled question set.
+
+For each chunking configuration the corpus is re-chunked (the PDFs are
+extracted once), deduplicated as in setup_index.py, embedded with the
+active index profile's model (cached on disk) and loaded into a local
+index. The questions are then run concurrently against it, and for every
+k the report shows recall@k, MRR, the prompt tokens the top-k chunks add
+to each chat request, and retrieval latency.
+
+Chunking configurations:
+    semantic         enhanced_split_documents with DocumentTypeOptimizer.CHUNK_CONFIGS
+    semantic:0.75    the same with every chunk/overlap token size scaled by 0.75
+    basic:500:20     split_documents with chunk_size=500, chunk_overlap=20 (characters)
+
+Usage:
+    python scripts/evaluate_retrieval.py --questions eval/questions.jsonl \\
+        --chunking semantic,semantic:0.75,semantic:1.5,basic:500:20 --k 1,2,3,5
+"""
+
+import sys
+import os
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from statistics import mean
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import numpy as np
+
+from config.settings import Config
+from src.core.embeddings import get_cached_embeddings
+from src.core.local_index import LocalVectorIndex
+from src.evaluation.dataset import load_questions
+from src.evaluation.metrics import percentile, summarize_rankings
+from src.prompts.templates import IT_SUPPORT_SYSTEM_PROMPT
+from src.utils.chunking import DocumentTypeOptimizer, enhanced_split_documents
+from src.utils.dedup import deduplicate_chunks
+from src.utils.file_utils import load_pdf_documents, split_documents
+from src.utils.manifest import assign_vector_ids
+from src.utils.telemetry import configure_logging
+from src.utils.tokens import count_tokens
+
+
+def parse_chunking(spec):
+    """Parse a chunking configuration spec (see module docstring)."""
+    method, _, params = spec.partition(":")
+    if method == "semantic":
+        return {"name": spec, "method": "semantic", "scale": float(params) if params else 1.0}
+    if method == "basic":
+        size, _, overlap = params.partition(":")
+        return {"name": spec, "method": "basic",
+                "chunk_size": int(size) if size else 500, "chunk_overlap": int(overlap) if overlap else 20}
+    raise ValueError(f"Unknown chunking configuration '{spec}' (expected semantic[:scale] or basic[:size[:overlap]])")
+
+
+@contextmanager
+def scaled_chunk_configs(scale):
+    """Temporarily scale the token sizes of DocumentTypeOptimizer.CHUNK_CONFIGS."""
+    original = DocumentTypeOptimizer.CHUNK_CONFIGS
+    DocumentTypeOptimizer.CHUNK_CONFIGS = {
+        chunk_type: {
+            **config,
+            "chunk_tokens": max(1, round(config["chunk_tokens"] * scale)),
+            "overlap_tokens": round(config["overlap_tokens"] * scale),
+        }
+        for chunk_type, config in original.items()
+    }
+    try:
+        yield
+    finally:
+        DocumentTypeOptimizer.CHUNK_CONFIGS = original
+
+
+def chunk_corpus(documents, chunking):
+    """Chunk and deduplicate the extracted documents like setup_index.py does."""
+    if chunking["method"] == "semantic":
+        # Single process, so the scaled configuration applies to every document
+        with scaled_chunk_configs(chunking["scale"]):
+            chunks = enhanced_split_documents(documents, enhance_metadata=True, preserve_structure=True, workers=1)
+    else:
+        chunks = split_documents(documents, chunk_size=chunking["chunk_size"],
+                                 chunk_overlap=chunking["chunk_overlap"])
+    if Config.DEDUP_ENABLED and chunks:
+        chunks, _ = deduplicate_chunks(chunks)
+    return assign_vector_ids(chunks)
+
+
+def prompt_tokens(texts, question):
+    """Tokens of the chat prompt built from the retrieved chunks (system prompt + context + question)."""
+    return count_tokens(IT_SUPPORT_SYSTEM_PROMPT.format(context="\n\n".join(texts))) + count_tokens(question)
+
+
+def evaluate_chunking(chunking, documents, embeddings, query_vectors, questions, ks, concurrency):
+    """Evaluate every k on one chunking configuration."""
+    chunks = chunk_corpus(documents, chunking)
+    ids = [vector_id for vector_id, _ in chunks]
+    texts = [chunk.page_content for _, chunk in chunks]
+    print(f"\n🧩 {chunking['name']}: {len(chunks)} chunks, embedding (cached)...")
+    index = LocalVectorIndex(ids, np.asarray(embeddings.embed_documents(texts), dtype=np.float32), texts=texts)
+    max_k = max(ks)
+
+    def run_query(query_vector):
+        start = time.perf_counter()
+        results = index.search(query_vector, k=max_k)
+        return results, (time.perf_counter() - start) * 1000
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        start = time.perf_counter()
+        outcomes = list(executor.map(run_query, query_vectors))
+        wall_seconds = time.perf_counter() - start
+
+    latencies = [latency for _, latency in outcomes]
+    rankings = [
+        [question.is_relevant(ids[row], texts[row]) for row, _ in results]
+        for (results, _), question in zip(outcomes, questions)
+    ]
+
+    results = []
+    for k in ks:
+        summary = summarize_rankings([ranking[:k] for ranking in rankings], [k])
+        results.append({
+            "chunking": chunking["name"],
+            "k": k,
+            "chunks": len(chunks),
+            "avg_chunk_tokens": mean(count_tokens(text) for text in texts) if texts else 0.0,
+            "recall": summary[f"recall@{k}"],
+            "mrr": summary["mrr"],
+            "prompt_tokens": mean(
+                prompt_tokens([texts[row] for row, _ in search_results[:k]], question.question)
+                for (search_results, _), question in zip(outcomes, questions)
+            ),
+            "latency_p50_ms": percentile(latencies, 50),
+            "latency_p95_ms": percentile(latencies, 95),
+            "queries_per_second": len(questions) / wall_seconds if wall_seconds else 0.0,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare retrieval quality, prompt cost and latency "
+                                                 "across chunking configurations and k.")
+    parser.add_argument("--questions", required=True, help="labelled question set (JSONL)")
+    parser.add_argument("--data-dir", default="data/", help="directory with the PDF corpus")
+    parser.add_argument("--chunking", default="semantic,basic:500:20",
+                        help="comma-separated chunking configurations (see module docstring)")
+    parser.add_argument("--k", default="1,2,3,5", help="comma-separated numbers of retrieved chunks")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent queries")
+    parser.add_argument("--cache-dir", default="data/.embedding_cache", help="embedding cache directory")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+    configure_logging("WARNING")
+
+    ks = sorted(int(k) for k in args.k.split(","))
+    chunkings = [parse_chunking(spec.strip()) for spec in args.chunking.split(",") if spec.strip()]
+    questions = load_questions(args.questions)
+    print(f"\n❓ Loaded {len(questions)} labelled questions")
+
+    documents = load_pdf_documents(args.data_dir, use_enhanced_processing=True)
+    if not documents:
+        print("❌ No documents to evaluate. Please add PDF files to the data directory.")
+        return
+
+    profile = Config.get_index_profile()
+    print(f"🤖 Embedding with {Config.EMBEDDING_MODEL} at {profile['dimension']} dims (profile '{profile['name']}')")
+    embeddings = get_cached_embeddings(args.cache_dir)
+    query_vectors = np.asarray([embeddings.embed_query(q.question) for q in questions], dtype=np.float32)
+
+    results = []
+    for chunking in chunkings:
+        results.extend(evaluate_chunking(chunking, documents, embeddings, query_vectors, questions, ks,
+                                         args.concurrency))
+
+    # Report
+    print("\n" + "=" * 104)
+    print("📊 RETRIEVAL EVALUATION")
+    print("=" * 104)
+    print(f"{'chunking':<18}{'k':>3}{'chunks':>8}{'tok/chunk':>11}{'recall@k':>10}{'MRR':>8}"
+          f"{'prompt tok':>12}{'p50 ms':>9}{'p95 ms':>9}{'q/s':>9}")
+    for r in results:
+        print(f"{r['chunking']:<18}{r['k']:>3}{r['chunks']:>8}{r['avg_chunk_tokens']:>11.0f}{r['recall']:>10.3f}"
+              f"{r['mrr']:>8.3f}{r['prompt_tokens']:>12.0f}{r['latency_p50_ms']:>9.3f}"
+              f"{r['latency_p95_ms']:>9.3f}{r['queries_per_second']:>9.0f}")
+    print("=" * 104)
+    print(f"ℹ️  Latency is exact local search with {args.concurrency} concurrent queries; "
+          f"prompt tokens include the system prompt and the question")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"profile": profile["name"], "results": results}, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,84 +1,531 @@
 import sys
 import os
+import argparse
 
 # Add project root to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-from src.utils.file_utils import load_pdf_documents, split_documents
-from src.utils.chunking import enhanced_split_documents
+from src.utils.file_utils import (
+    collection_namespace, find_collections, get_extraction_cache, load_pdf_documents, split_documents
+)
+from src.utils.chunking import CHUNKER_VERSION, enhanced_split_documents
+from src.utils.dedup import deduplicate_chunks
+from src.utils.manifest import IngestionManifest, list_namespaces
+from src.core.serving import is_slot_namespace
+from src.core.metadata_schema import MetadataSchema, payload_report
+from src.core.snapshot import SnapshotWriter, load_snapshot
+from src.core.text_store import TextStore
+from src.core.uploader import PipelinedUploader
+from src.services.ingestion_pipeline import StreamingIngestionPipeline
+from src.utils.telemetry import configure_logging, logger, telemetry
 from src.core.embeddings import get_openai_embeddings
+from langchain.schema.document import Document
 from pinecone.grpc import PineconeGRPC as Pinecone
 from pinecone import ServerlessSpec
 from langchain_pinecone import PineconeVectorStore
 from config.settings import Config
 
-def setup_pinecone_index(use_enhanced_processing=True, use_semantic_chunking=True):
+# --collection name selecting the PDFs directly in data/ (default namespace)
+DEFAULT_COLLECTION = "_default"
+
+def connect_pinecone_index(reset_index=False, namespace=""):
+    """
+    Connect to the Pinecone index, creating it if needed.
+    
+    Args:
+        reset_index: Delete every vector of the namespace before upserting
+        namespace: Namespace (shard) being indexed; "" is the default namespace
+    
+    Returns:
+        (pinecone_client, index) tuple, or (None, None) if setup failed
+    """
+    index_profile = Config.get_index_profile()
+    logger.info(f"\n🌲 Setting up Pinecone index: {Config.PINECONE_INDEX_NAME} "
+                f"(profile '{index_profile['name']}', {index_profile['dimension']} dims)")
+    try:
+        pinecone_client = Pinecone(api_key=Config.PINECONE_API_KEY)
+        logger.info("   ✅ Pinecone client initialized")
+        
+        # Check if index exists
+        existing_indexes = pinecone_client.list_indexes()
+        index_names = [idx.name for idx in existing_indexes]
+        
+        if Config.PINECONE_INDEX_NAME in index_names:
+            logger.info(f"   ♻️  Index '{Config.PINECONE_INDEX_NAME}' already exists - will upsert documents")
+            
+            existing_dimension = pinecone_client.describe_index(Config.PINECONE_INDEX_NAME).dimension
+            if existing_dimension != index_profile["dimension"]:
+                logger.warning(f"   ❌ Index has {existing_dimension} dims but profile "
+                               f"'{index_profile['name']}' needs {index_profile['dimension']}")
+                return None, None
+            
+            # Get index stats
+            index = pinecone_client.Index(Config.PINECONE_INDEX_NAME)
+            stats = index.describe_index_stats()
+            logger.info(f"   📊 Current index stats: {stats.total_vector_count} vectors")
+            
+            if reset_index and namespace:
+                logger.info(f"   🧹 Resetting namespace '{namespace}' - deleting its vectors")
+                index.delete(delete_all=True, namespace=namespace)
+            elif reset_index:
+                logger.info("   🧹 Resetting index - deleting all existing vectors")
+                index.delete(delete_all=True)
+        else:
+            logger.info(f"   🆕 Creating new index '{Config.PINECONE_INDEX_NAME}'")
+            pinecone_client.create_index(
+                name=Config.PINECONE_INDEX_NAME,
+                dimension=index_profile["dimension"],
+                metric=index_profile["metric"],
+                spec=ServerlessSpec(cloud="gcp", region="europe-west4")
+            )
+            logger.info("   ✅ Index created successfully")
+            
+    except Exception as e:
+        logger.warning(f"   ❌ Pinecone setup failed: {e}")
+        return None, None
+    
+    return pinecone_client, pinecone_client.Index(Config.PINECONE_INDEX_NAME)
+
+def create_snapshot_writer(signature, namespace=""):
+    """Start a new local snapshot version of the active index profile (one snapshot root per namespace)."""
+    index_profile = Config.get_index_profile()
+    return SnapshotWriter(
+        Config.namespace_path(Config.SNAPSHOT_DIR, namespace),
+        dimension=index_profile["dimension"],
+        info={
+            "index_name": Config.PINECONE_INDEX_NAME,
+            "namespace": namespace,
+            "index_profile": index_profile["name"],
+            "embedding_model": Config.EMBEDDING_MODEL,
+            "signature": signature,
+        }
+    )
+
+def snapshot_is_complete(snapshot_dir, manifest):
+    """Whether the published snapshot holds every vector the manifest records."""
+    try:
+        published = load_snapshot(snapshot_dir)
+    except Exception as e:
+        logger.warning(f"   ⚠️  Published snapshot unreadable: {e}")
+        return False
+    if published is None:
+        return False
+    snapshot_ids = set(published.index.ids)
+    return all(
+        vector_id in snapshot_ids for entry in manifest.files.values() for vector_id in entry["chunk_ids"]
+    )
+
+def backfill_snapshot(snapshot_writer, index, manifest, base=None, namespace="", text_store=None):
+    """
+    Add indexed vectors the new snapshot would lack, fetched from Pinecone.
+    
+    Unchanged chunks are never re-embedded, so vectors indexed before
+    snapshots were enabled (or whose snapshot was wiped) are read back with
+    their metadata instead. Files with vectors Pinecone does not return are
+    dropped from the manifest, so the next run embeds them again.
+    
+    Returns:
+        Number of vectors fetched into the snapshot
+    """
+    missing = snapshot_writer.missing_ids(
+        [vector_id for entry in manifest.files.values() for vector_id in entry["chunk_ids"]], base
+    )
+    if not missing:
+        return 0
+    
+    logger.info(f"   📥 Fetching {len(missing)} indexed vector(s) the snapshot lacks from Pinecone...")
+    namespace_kwargs = {"namespace": namespace} if namespace else {}
+    fetch_batch_size = 100  # IDs per fetch request
+    fetched = set()
+    for start in range(0, len(missing), fetch_batch_size):
+        vectors = index.fetch(ids=missing[start:start + fetch_batch_size], **namespace_kwargs).vectors
+        # The side store keeps the text and full metadata the index leaves out
+        side_records = text_store.get_many(list(vectors)) if text_store else {}
+        batch, values = [], []
+        for vector_id, vector in vectors.items():
+            if vector_id in side_records:
+                text, metadata = side_records[vector_id]
+            else:
+                metadata = dict(vector.metadata or {})
+                text = metadata.pop("text", "")
+            batch.append((vector_id, Document(page_content=text, metadata=metadata)))
+            values.append(list(vector.values))
+        if batch:
+            snapshot_writer.add(batch, values)
+        fetched.update(vectors)
+    
+    absent = set(missing) - fetched
+    if absent:
+        stale_files = [path for path, entry in manifest.files.items() if absent.intersection(entry["chunk_ids"])]
+        for path in stale_files:
+            manifest.remove_file(path)
+        manifest.save()
+        logger.warning(f"   ⚠️  {len(absent)} indexed vector(s) missing from Pinecone; "
+                       f"{len(stale_files)} file(s) will be embedded again on the next run")
+    return len(fetched)
+
+def commit_snapshot(snapshot_writer, manifest, reset_index=False, namespace="", index=None, text_store=None):
+    """
+    Publish a snapshot, carrying over unchanged vectors of the previous one.
+    
+    Indexed vectors that neither this run nor the previous snapshot provide
+    are fetched from Pinecone when an index is given (backfill_snapshot).
+    Warns when the snapshot still holds fewer vectors than the manifest records.
+    """
+    base = None
+    if not reset_index:
+        try:
+            base = load_snapshot(Config.namespace_path(Config.SNAPSHOT_DIR, namespace))
+        except Exception as e:
+            logger.warning(f"   ⚠️  Previous snapshot unreadable, not carried over: {e}")
+    
+    with telemetry.span("snapshot"):
+        if index is not None:
+            backfill_snapshot(snapshot_writer, index, manifest, base, namespace, text_store)
+        path = snapshot_writer.commit(base=base)
+    logger.info(f"   📸 Snapshot published: {path} ({snapshot_writer.count} vectors)")
+    
+    indexed = sum(len(entry["chunk_ids"]) for entry in manifest.files.values())
+    if snapshot_writer.count < indexed:
+        logger.warning(f"   ⚠️  Snapshot lacks {indexed - snapshot_writer.count} indexed vectors; "
+                       f"the next --snapshot run fetches them")
+
+def run_streaming_ingestion(
+    manifest, 
+    file_diff, 
+    signature, 
+    use_enhanced_processing=True, 
+    use_semantic_chunking=True, 
+    reset_index=False,
+    extraction_cache=None,
+    snapshot=False,
+    reupsert=False,
+    namespace=""
+):
+    """
+    Stream changed PDFs through chunking, embedding and upserting with bounded memory.
+    
+    Documents and chunks are never materialized for the whole corpus; stages
+    are connected by bounded queues and peak memory is reported at the end.
+    """
+    logger.info("\n🌊 Streaming ingestion mode")
+    
+    logger.info("\n🤖 Initializing OpenAI embeddings...")
+    try:
+        openai_embeddings = get_openai_embeddings()
+        logger.info("   ✅ OpenAI embeddings ready")
+    except Exception as e:
+        logger.warning(f"   ❌ Failed to initialize embeddings: {e}")
+        return
+    
+    pinecone_client, index = connect_pinecone_index(reset_index=reset_index, namespace=namespace)
+    if index is None:
+        return
+    
+    snapshot_writer = create_snapshot_writer(signature, namespace) if snapshot else None
+    text_store = TextStore(Config.namespace_path(Config.TEXT_STORE_PATH, namespace)) if Config.TEXT_SIDE_STORE else None
+    pipeline = StreamingIngestionPipeline(
+        embeddings=openai_embeddings,
+        index=index,
+        manifest=manifest,
+        use_enhanced_processing=use_enhanced_processing,
+        use_semantic_chunking=use_semantic_chunking,
+        extraction_cache=extraction_cache,
+        snapshot_writer=snapshot_writer,
+        text_store=text_store,
+        reupsert=reupsert,
+        namespace=namespace
+    )
+    
+    logger.info(f"\n🔮 Streaming {len(file_diff.to_process)} file(s) into the index...")
+    try:
+        stats = pipeline.run(file_diff)
+    except Exception as e:
+        logger.warning(f"   ❌ Streaming ingestion failed: {e}")
+        if snapshot_writer:
+            snapshot_writer.abort()
+        return
+    
+    manifest.data["signature"] = signature
+    manifest.save()
+    if snapshot_writer:
+        commit_snapshot(
+            snapshot_writer, manifest, reset_index=reset_index, namespace=namespace, index=index, text_store=text_store
+        )
+    
+    logger.info("\n" + "="*80)
+    logger.info("🎉 STREAMING INDEX SETUP COMPLETED")
+    logger.info("="*80)
+    logger.info(f"   📁 PDF files processed: {stats.files_processed}")
+    logger.info(f"   📄 Documents extracted: {stats.documents}")
+    logger.info(f"   📝 Chunks created: {stats.chunks} ({stats.chunks_unchanged} unchanged, "
+                f"{stats.duplicates_removed} duplicates merged)")
+    logger.info(f"   📤 Vectors upserted: {stats.vectors_upserted} in {stats.batches} batch(es)")
+    if stats.elapsed_seconds:
+        logger.info(f"   ⚡ Throughput: {stats.vectors_upserted / stats.elapsed_seconds:.1f} chunks/s "
+                    f"({stats.retries} retries)")
+    logger.info(f"   🗑️  Vectors deleted: {stats.vectors_deleted}")
+    logger.info(f"   ⏱️  Elapsed: {stats.elapsed_seconds:.1f}s")
+    for stage, seconds in stats.stage_seconds.items():
+        logger.info(f"      • {stage}: {seconds:.1f}s")
+    logger.info(f"   🧠 Memory: start {stats.start_rss_mb:.0f} MB, peak {stats.peak_rss_mb:.0f} MB")
+    logger.info("="*80 + "\n")
+    
+    return {
+        "success": True,
+        "files_processed": stats.files_processed,
+        "documents_extracted": stats.documents,
+        "chunks_created": stats.chunks,
+        "vectors_upserted": stats.vectors_upserted,
+        "vectors_deleted": stats.vectors_deleted,
+        "peak_rss_mb": stats.peak_rss_mb,
+        "processing_mode": "streaming"
+    }
+
+def setup_pinecone_index(
+    use_enhanced_processing=True, 
+    use_semantic_chunking=True, 
+    incremental=True, 
+    dry_run=False, 
+    reset_index=False,
+    streaming=False,
+    use_extraction_cache=True,
+    snapshot=False,
+    telemetry_path=Config.INGEST_TELEMETRY_PATH,
+    collections=None,
+    targets=None
+):
     """
     Setup Pinecone index with enhanced PDF processing and semantic chunking.
     
+    Vector IDs are derived from file and chunk content hashes recorded in the
+    ingestion manifest, so re-runs only embed new or changed chunks and remove
+    vectors whose chunks no longer exist.
+    
+    Each source collection (sub-directory of data/) is indexed into its own
+    namespace with its own manifest and snapshot, one after another; PDFs
+    directly in data/ go to the default namespace. A collection whose
+    directory was removed has its vectors deleted.
+    
     Args:
         use_enhanced_processing: Whether to use enhanced PDF extraction
         use_semantic_chunking: Whether to use semantic-aware chunking
+        incremental: Only reprocess files whose content changed since the last run
+        dry_run: Report the planned upserts/deletions without embedding or writing
+        reset_index: Delete every vector in the index before upserting
+        streaming: Stream files through chunking/embedding/upserting with bounded memory
+        use_extraction_cache: Reuse cached extraction results of unchanged PDFs
+        snapshot: Also publish a memory-mapped local snapshot of the index for
+            VECTOR_BACKEND=snapshot servers (hot-swapped without restarts)
+        telemetry_path: Where to write the JSON report of per-stage and per-file
+            timings and counters (None to skip it)
+        collections: Only (re-)index these collections (sub-directory names,
+            DEFAULT_COLLECTION for PDFs directly in data/); None indexes all
+        targets: Mapping of namespace to the PDF files to index into it, instead
+            of the collections found in data/ (the watch daemon's standby slots)
+    
+    Returns:
+        The run summary, or a mapping of namespace to summary when several
+        collections were indexed
     """
-    print("\n" + "="*80)
-    print("🚀 ENHANCED CHATBOT IT SUPPORT UII - INDEX SETUP")
-    print("="*80)
+    telemetry.reset()
+    try:
+        if targets is not None:
+            collection_files = targets
+            namespaces = list(targets)
+        else:
+            collection_files = find_collections("data/")
+            # Blue/green slots belong to the watch daemon (src/core/serving.py)
+            indexed = [
+                namespace for namespace in list_namespaces(Config.INDEX_MANIFEST_PATH)
+                if not is_slot_namespace(namespace)
+            ]
+            namespaces = sorted(set(collection_files) | set(indexed)) or [""]
+        if collections is not None:
+            selected = {"" if name == DEFAULT_COLLECTION else collection_namespace(name) for name in collections}
+            for namespace in sorted(selected - set(namespaces)):
+                logger.warning(f"⚠️  Unknown collection '{namespace}' - no data/{namespace}/ directory or manifest")
+            namespaces = [namespace for namespace in namespaces if namespace in selected]
+        
+        results = {}
+        for namespace in namespaces:
+            results[namespace] = _setup_pinecone_index(
+                use_enhanced_processing=use_enhanced_processing,
+                use_semantic_chunking=use_semantic_chunking,
+                incremental=incremental,
+                dry_run=dry_run,
+                reset_index=reset_index,
+                streaming=streaming,
+                use_extraction_cache=use_extraction_cache,
+                snapshot=snapshot,
+                namespace=namespace,
+                pdf_files=collection_files.get(namespace, [])
+            )
+        if len(results) == 1:
+            return next(iter(results.values()))
+        return results
+    finally:
+        if telemetry_path:
+            telemetry.write_report(telemetry_path)
+            logger.info(f"📈 Telemetry report: {telemetry_path}")
+
+def _setup_pinecone_index(
+    use_enhanced_processing, 
+    use_semantic_chunking, 
+    incremental, 
+    dry_run, 
+    reset_index,
+    streaming,
+    use_extraction_cache,
+    snapshot,
+    namespace,
+    pdf_files
+):
+    manifest_path = Config.namespace_path(Config.INDEX_MANIFEST_PATH, namespace)
+    snapshot_dir = Config.namespace_path(Config.SNAPSHOT_DIR, namespace)
+    
+    logger.info("\n" + "="*80)
+    logger.info("🚀 ENHANCED CHATBOT IT SUPPORT UII - INDEX SETUP")
+    if namespace:
+        logger.info(f"📚 Namespace: {namespace}")
+    logger.info("="*80)
     
     # Validate configuration
-    print("🔐 Validating configuration...")
+    logger.info("🔐 Validating configuration...")
     try:
         Config.validate()
-        print("   ✅ API keys validated")
+        logger.info("   ✅ API keys validated")
     except ValueError as e:
-        print(f"   ❌ Configuration error: {e}")
-        return
+        logger.warning(f"   ❌ Configuration error: {e}")
+        if not dry_run:
+            return
     
-    # Load PDF documents with enhanced processing
-    print(f"\n📂 Loading PDF documents with {'enhanced' if use_enhanced_processing else 'basic'} processing...")
-    pdf_documents = load_pdf_documents("data/", use_enhanced_processing=use_enhanced_processing)
+    # Compare the corpus against the ingestion manifest
+    logger.info(f"\n🧾 Checking ingestion manifest: {manifest_path}")
+    manifest = IngestionManifest.load(manifest_path)
+    signature = (
+        f"{'enhanced' if use_enhanced_processing else 'basic'}-"
+        f"{f'semantic-v{CHUNKER_VERSION}' if use_semantic_chunking else 'basic'}"
+        f"{f'-dedup{Config.DEDUP_THRESHOLD}' if Config.DEDUP_ENABLED else ''}"
+    )
+    # Vectors upserted under another metadata schema must be rewritten
+    schema = MetadataSchema.from_config()
+    payload_layout = f"{schema.fingerprint}{'-sidetext' if Config.TEXT_SIDE_STORE else ''}"
+    reupsert = bool(manifest.files) and manifest.data.get("payload_layout") != payload_layout
+    if reupsert:
+        logger.info("   🧬 Metadata schema changed - every vector will be re-upserted")
+    manifest.data["payload_layout"] = payload_layout
+    if reset_index:
+        # The namespace is emptied before upserting: every chunk must be embedded again
+        manifest.clear()
+    file_diff = manifest.diff_files(
+        pdf_files, signature, force=not incremental or reset_index or reupsert
+    )
     
-    if not pdf_documents:
-        print("❌ No documents loaded. Please add PDF files to data/ directory.")
+    logger.info(f"   🆕 New files: {len(file_diff.new)}")
+    logger.info(f"   ✏️  Changed files: {len(file_diff.changed)}")
+    logger.info(f"   ♻️  Unchanged files: {len(file_diff.unchanged)}")
+    logger.info(f"   🗑️  Deleted files: {len(file_diff.deleted)}")
+    
+    if not pdf_files and not file_diff.deleted:
+        logger.warning("❌ No documents loaded. Please add PDF files to data/ directory.")
         return
     
+    extraction_cache = None
+    if use_extraction_cache:
+        extraction_cache = get_extraction_cache(use_enhanced_processing)
+        logger.info(f"   ⚡ Extraction cache: {extraction_cache.cache_dir}")
+    
+    if streaming and not dry_run:
+        return run_streaming_ingestion(
+            manifest, 
+            file_diff, 
+            signature, 
+            use_enhanced_processing=use_enhanced_processing, 
+            use_semantic_chunking=use_semantic_chunking, 
+            reset_index=reset_index,
+            extraction_cache=extraction_cache,
+            snapshot=snapshot,
+            reupsert=reupsert,
+            namespace=namespace
+        )
+    
+    # Load PDF documents with enhanced processing
+    pdf_documents = []
+    if file_diff.to_process:
+        logger.info(f"\n📂 Loading PDF documents with {'enhanced' if use_enhanced_processing else 'basic'} processing...")
+        pdf_documents = load_pdf_documents(
+            "data/", 
+            use_enhanced_processing=use_enhanced_processing, 
+            pdf_files=file_diff.to_process,
+            cache=extraction_cache
+        )
+        
+        # Files without documents keep their indexed vectors and are retried next run
+        extracted = {doc.metadata.get("source") for doc in pdf_documents}
+        failed = [path for path in file_diff.to_process if path not in extracted]
+        if failed:
+            logger.warning(f"   ⚠️  {len(failed)} file(s) yielded no documents and are left as indexed: "
+                           f"{', '.join(os.path.basename(path) for path in failed)}")
+            file_diff.exclude(failed)
+        
+        if not pdf_documents and not file_diff.deleted:
+            logger.warning("❌ No documents loaded. Please add PDF files to data/ directory.")
+            return
+    
     # Choose chunking strategy
-    if use_semantic_chunking:
-        print("\n🧠 Processing with semantic-aware chunking...")
+    if not pdf_documents:
+        document_chunks = []
+        chunking_method = "Semantic-aware chunking" if use_semantic_chunking else "Basic text splitting"
+    elif use_semantic_chunking:
+        logger.info("\n🧠 Processing with semantic-aware chunking...")
         document_chunks = enhanced_split_documents(
             pdf_documents, 
             enhance_metadata=True, 
-            preserve_structure=True
+            preserve_structure=True,
+            workers=Config.CHUNK_WORKERS
         )
         chunking_method = "Semantic-aware chunking"
     else:
-        print("\n✂️  Processing with basic text splitting...")
-        print(f"   📊 Chunk size: 500 characters")
-        print(f"   🔄 Chunk overlap: 20 characters")
-        document_chunks = split_documents(pdf_documents)
+        logger.info("\n✂️  Processing with basic text splitting...")
+        logger.info(f"   📊 Chunk size: 500 characters")
+        logger.info(f"   🔄 Chunk overlap: 20 characters")
+        with telemetry.span("chunk"):
+            document_chunks = split_documents(pdf_documents)
+        telemetry.count("chunks.created", len(document_chunks))
         chunking_method = "Basic text splitting"
     
-    if not document_chunks:
-        print("❌ No chunks created from documents.")
+    if pdf_documents and not document_chunks:
+        logger.warning("❌ No chunks created from documents.")
         return
     
+    # Drop near-duplicate chunks produced by overlapping extractors
+    if Config.DEDUP_ENABLED and document_chunks:
+        logger.info(f"\n🧬 Removing near-duplicate chunks (Jaccard ≥ {Config.DEDUP_THRESHOLD})...")
+        with telemetry.span("dedup"):
+            document_chunks, dedup_stats = deduplicate_chunks(document_chunks)
+        telemetry.count("chunks.duplicates_removed", dedup_stats.removed)
+        logger.info(f"   ✅ {dedup_stats.removed} duplicate(s) merged in {dedup_stats.duplicate_groups} group(s), "
+                    f"{dedup_stats.output_chunks} chunks kept")
+    
     # Enhanced statistics
-    print(f"\n📊 CHUNKING ANALYSIS")
-    print("="*60)
-    print(f"📝 Total chunks created: {len(document_chunks)}")
+    logger.info(f"\n📊 CHUNKING ANALYSIS")
+    logger.info("="*60)
+    logger.info(f"📝 Total chunks created: {len(document_chunks)}")
     
     # Calculate comprehensive statistics
     total_chars = sum(len(chunk.page_content) for chunk in document_chunks)
     avg_chunk_size = total_chars / len(document_chunks) if document_chunks else 0
     
-    print(f"💾 Total content: {total_chars:,} characters")
-    print(f"📏 Average chunk size: {avg_chunk_size:.0f} characters")
-    print(f"🎯 Chunking method: {chunking_method}")
+    logger.info(f"💾 Total content: {total_chars:,} characters")
+    logger.info(f"📏 Average chunk size: {avg_chunk_size:.0f} characters")
+    logger.info(f"🎯 Chunking method: {chunking_method}")
     
     # Advanced statistics for semantic chunking
-    if use_semantic_chunking:
+    semantic_scores = []
+    if use_semantic_chunking and document_chunks:
         chunk_types = {}
-        semantic_scores = []
         table_chunks = 0
         structured_chunks = 0
         
@@ -98,157 +545,251 @@ def setup_pinecone_index(use_enhanced_processing=True, use_semantic_chunking=Tru
             if chunk.metadata.get('has_headers', False):
                 structured_chunks += 1
         
-        print(f"\n🔍 SEMANTIC ANALYSIS:")
-        print(f"   📊 Table-containing chunks: {table_chunks}")
-        print(f"   🏗️  Structured chunks: {structured_chunks}")
+        logger.info(f"\n🔍 SEMANTIC ANALYSIS:")
+        logger.info(f"   📊 Table-containing chunks: {table_chunks}")
+        logger.info(f"   🏗️  Structured chunks: {structured_chunks}")
         
         if semantic_scores:
             avg_semantic_score = sum(semantic_scores) / len(semantic_scores)
-            print(f"   🎯 Average semantic score: {avg_semantic_score:.3f}")
+            logger.info(f"   🎯 Average semantic score: {avg_semantic_score:.3f}")
         
-        print(f"   📋 Chunk type distribution:")
+        logger.info(f"   📋 Chunk type distribution:")
         for chunk_type, count in chunk_types.items():
             percentage = (count / len(document_chunks)) * 100
-            print(f"      • {chunk_type}: {count} ({percentage:.1f}%)")
+            logger.info(f"      • {chunk_type}: {count} ({percentage:.1f}%)")
+    
+    # Plan vector changes against the manifest
+    plan = manifest.plan_chunks(file_diff, document_chunks, reupsert=reupsert)
+    
+    logger.info(f"\n🧮 INDEX DIFF")
+    logger.info("="*60)
+    logger.info(f"📤 Vectors to embed and upsert: {len(plan.to_upsert)}")
+    logger.info(f"🗑️  Vectors to delete: {len(plan.to_delete)}")
+    logger.info(f"♻️  Unchanged vectors kept: {plan.unchanged}")
+    
+    payload = payload_report(
+        document_chunks, schema, Config.get_index_profile()["dimension"],
+        text_remote=not Config.TEXT_SIDE_STORE
+    )
+    if payload:
+        logger.info(f"📦 Payload per vector: {payload['full_bytes_per_vector']:,.0f} B full metadata -> "
+                    f"{payload['lean_bytes_per_vector']:,.0f} B with schema {schema.fingerprint} "
+                    f"(metadata {payload['full_metadata_bytes']:,.0f} -> {payload['lean_metadata_bytes']:,.0f} B)")
+        logger.info(f"📦 Metadata per query response (k=2): {payload['full_bytes_per_query']:,.0f} -> "
+                    f"{payload['lean_bytes_per_query']:,.0f} B")
+        logger.debug("   Largest fields (avg bytes): " + ", ".join(
+            f"{field} {size:.0f}" for field, size in payload["largest_fields"].items()
+        ))
+    
+    if dry_run:
+        upserts_by_file = {}
+        for _, chunk in plan.to_upsert:
+            source = chunk.metadata.get("source", "unknown")
+            upserts_by_file[source] = upserts_by_file.get(source, 0) + 1
+        for path in file_diff.to_process:
+            logger.info(f"   ✏️  {path}: +{upserts_by_file.get(path, 0)} chunks")
+        for path in file_diff.deleted:
+            logger.info(f"   🗑️  {path}: -{len(manifest.files[path]['chunk_ids'])} chunks")
+        logger.info("\n🧪 Dry run - no embeddings created, index and manifest left untouched")
+        logger.info("="*60 + "\n")
+        return {
+            "success": True,
+            "dry_run": True,
+            "files_to_process": file_diff.to_process,
+            "files_deleted": file_diff.deleted,
+            "vectors_to_upsert": len(plan.to_upsert),
+            "vectors_to_delete": len(plan.to_delete),
+            "vectors_unchanged": plan.unchanged,
+            "payload": payload
+        }
+    
+    # An incomplete snapshot is completed from Pinecone below, even with nothing to upsert
+    rebuild_snapshot = snapshot and not reset_index and not snapshot_is_complete(snapshot_dir, manifest)
+    if not plan.to_upsert and not plan.to_delete and not reset_index and not rebuild_snapshot:
+        manifest.record(file_diff, document_chunks, signature)
+        manifest.save()
+        logger.info("\n✅ Index already up to date - nothing to embed or delete")
+        logger.info("="*60 + "\n")
+        return {
+            "success": True,
+            "files_processed": len(file_diff.to_process),
+            "vectors_upserted": 0,
+            "vectors_deleted": 0
+        }
     
     # Get embeddings
-    print("\n🤖 Initializing OpenAI embeddings...")
+    logger.info("\n🤖 Initializing OpenAI embeddings...")
     try:
         openai_embeddings = get_openai_embeddings()
-        print("   ✅ OpenAI embeddings ready")
+        logger.info("   ✅ OpenAI embeddings ready")
     except Exception as e:
-        print(f"   ❌ Failed to initialize embeddings: {e}")
+        logger.warning(f"   ❌ Failed to initialize embeddings: {e}")
         return
     
     # Initialize Pinecone client with enhanced setup
-    print(f"\n🌲 Setting up Pinecone index: {Config.PINECONE_INDEX_NAME}")
-    try:
-        pinecone_client = Pinecone(api_key=Config.PINECONE_API_KEY)
-        print("   ✅ Pinecone client initialized")
-        
-        # Check if index exists
-        existing_indexes = pinecone_client.list_indexes()
-        index_names = [idx.name for idx in existing_indexes]
-        
-        if Config.PINECONE_INDEX_NAME in index_names:
-            print(f"   ♻️  Index '{Config.PINECONE_INDEX_NAME}' already exists - will upsert documents")
-            
-            # Get index stats
-            index = pinecone_client.Index(Config.PINECONE_INDEX_NAME)
-            stats = index.describe_index_stats()
-            print(f"   📊 Current index stats: {stats.total_vector_count} vectors")
-        else:
-            print(f"   🆕 Creating new index '{Config.PINECONE_INDEX_NAME}'")
-            pinecone_client.create_index(
-                name=Config.PINECONE_INDEX_NAME,
-                dimension=3072,
-                metric="cosine",
-                spec=ServerlessSpec(cloud="gcp", region="europe-west4")
-            )
-            print("   ✅ Index created successfully")
-            
-    except Exception as e:
-        print(f"   ❌ Pinecone setup failed: {e}")
+    pinecone_client, index = connect_pinecone_index(reset_index=reset_index, namespace=namespace)
+    if index is None:
         return
+    namespace_kwargs = {"namespace": namespace} if namespace else {}
+    
+    text_store = TextStore(Config.namespace_path(Config.TEXT_STORE_PATH, namespace)) if Config.TEXT_SIDE_STORE else None
+    
+    # Remove vectors of deleted or changed chunks
+    if plan.to_delete and not reset_index:
+        logger.info(f"\n🗑️  Deleting {len(plan.to_delete)} stale vectors...")
+        try:
+            delete_batch_size = 1000  # Pinecone limit per delete request
+            with telemetry.span("delete"):
+                for start_idx in range(0, len(plan.to_delete), delete_batch_size):
+                    index.delete(ids=plan.to_delete[start_idx:start_idx + delete_batch_size], **namespace_kwargs)
+                if text_store:
+                    text_store.delete_many(plan.to_delete)
+            telemetry.count("vectors.deleted", len(plan.to_delete))
+            logger.info("   ✅ Stale vectors deleted")
+        except Exception as e:
+            logger.warning(f"   ❌ Vector deletion failed: {e}")
+            return
     
-    # Batch processing for large document sets
-    batch_size = 100  # Process in batches to avoid memory issues
-    total_batches = (len(document_chunks) + batch_size - 1) // batch_size
+    # Pipelined batch processing: concurrent embedding, overlapped upserts
+    uploader = PipelinedUploader(
+        openai_embeddings, index, schema=schema, text_store=text_store, namespace=namespace or None
+    )
+    total_batches = (len(plan.to_upsert) + uploader.batch_size - 1) // uploader.batch_size
     
-    print(f"\n🔮 Creating embeddings and upserting to vector store...")
-    print(f"   📤 Processing {len(document_chunks)} chunks in {total_batches} batch(es)")
-    print(f"   🔄 Batch size: {batch_size} chunks per batch")
+    logger.info(f"\n🔮 Creating embeddings and upserting to vector store...")
+    logger.info(f"   📤 Processing {len(plan.to_upsert)} chunks in {total_batches} batch(es)")
+    logger.info(f"   🔄 Batch size: {uploader.batch_size} chunks per batch, "
+                f"up to {uploader.limiter.max_limit} concurrent embedding requests")
     
+    snapshot_writer = create_snapshot_writer(signature, namespace) if snapshot else None
     try:
-        if total_batches > 1:
-            # Process in batches for large datasets
-            for batch_idx in range(total_batches):
-                start_idx = batch_idx * batch_size
-                end_idx = min((batch_idx + 1) * batch_size, len(document_chunks))
-                batch_chunks = document_chunks[start_idx:end_idx]
-                
-                print(f"   📦 Processing batch {batch_idx + 1}/{total_batches} ({len(batch_chunks)} chunks)...")
-                
-                PineconeVectorStore.from_documents(
-                    documents=batch_chunks,
-                    index_name=Config.PINECONE_INDEX_NAME,
-                    embedding=openai_embeddings
-                )
-                
-                print(f"   ✅ Batch {batch_idx + 1} completed")
-        else:
-            # Single batch processing
-            PineconeVectorStore.from_documents(
-                documents=document_chunks,
-                index_name=Config.PINECONE_INDEX_NAME,
-                embedding=openai_embeddings
-            )
+        # Stable IDs make re-runs overwrite instead of duplicating vectors
+        upload_stats = uploader.upload(
+            plan.to_upsert, on_batch=snapshot_writer.add if snapshot_writer else None
+        )
         
-        print("   ✅ All documents successfully embedded and stored")
+        logger.info("   ✅ All documents successfully embedded and stored")
+        logger.info(f"   ⚡ Throughput: {upload_stats.chunks_per_second:.1f} chunks/s "
+                    f"({upload_stats.elapsed_seconds:.1f}s, {upload_stats.retries} retries, "
+                    f"{upload_stats.rate_limited} rate-limited)")
         
     except Exception as e:
-        print(f"   ❌ Vector store creation failed: {e}")
+        logger.warning(f"   ❌ Vector store creation failed: {e}")
+        if snapshot_writer:
+            snapshot_writer.abort()
         return
     
+    # Record what is now in the index
+    manifest.record(file_diff, document_chunks, signature)
+    manifest.save()
+    logger.info(f"   🧾 Manifest updated: {manifest_path}")
+    
+    if snapshot_writer:
+        snapshot_writer.remove(plan.to_delete)
+        commit_snapshot(
+            snapshot_writer, manifest, reset_index=reset_index, namespace=namespace, index=index, text_store=text_store
+        )
+    
     # Verify index after processing
-    print("\n🔍 Verifying index integrity...")
+    logger.info("\n🔍 Verifying index integrity...")
     try:
-        index = pinecone_client.Index(Config.PINECONE_INDEX_NAME)
         final_stats = index.describe_index_stats()
-        print(f"   ✅ Final index contains {final_stats.total_vector_count} vectors")
+        logger.info(f"   ✅ Final index contains {final_stats.total_vector_count} vectors")
+        if namespace and namespace in final_stats.namespaces:
+            logger.info(f"   📚 Namespace '{namespace}': {final_stats.namespaces[namespace].vector_count} vectors")
         
         # Test query to ensure index is working
         test_vector_store = PineconeVectorStore(
             index_name=Config.PINECONE_INDEX_NAME,
-            embedding=openai_embeddings
+            embedding=openai_embeddings,
+            namespace=namespace or None
         )
         test_vector_store.similarity_search("test", k=1)
-        print(f"   🧪 Test query successful - index is operational")
+        logger.info(f"   🧪 Test query successful - index is operational")
         
     except Exception as e:
-        print(f"   ⚠️  Index verification failed: {e}")
+        logger.warning(f"   ⚠️  Index verification failed: {e}")
     
     # Final comprehensive summary
-    print("\n" + "="*80)
-    print("🎉 ENHANCED INDEX SETUP COMPLETED SUCCESSFULLY")
-    print("="*80)
+    logger.info("\n" + "="*80)
+    logger.info("🎉 ENHANCED INDEX SETUP COMPLETED SUCCESSFULLY")
+    logger.info("="*80)
     
     # File and document statistics
     unique_files = len(set(doc.metadata.get('file_name', 'unknown') for doc in pdf_documents))
     
-    print(f"📊 PROCESSING SUMMARY:")
-    print(f"   📁 PDF files processed: {unique_files}")
-    print(f"   📄 Raw documents extracted: {len(pdf_documents)}")
-    print(f"   📝 Final chunks created: {len(document_chunks)}")
-    print(f"   🎯 Processing mode: {'Enhanced' if use_enhanced_processing else 'Basic'}")
-    print(f"   🧠 Chunking strategy: {chunking_method}")
+    logger.info(f"📊 PROCESSING SUMMARY:")
+    logger.info(f"   📁 PDF files processed: {unique_files}")
+    logger.info(f"   📄 Raw documents extracted: {len(pdf_documents)}")
+    logger.info(f"   📝 Final chunks created: {len(document_chunks)}")
+    logger.info(f"   📤 Vectors upserted: {len(plan.to_upsert)}")
+    logger.info(f"   🗑️  Vectors deleted: {len(plan.to_delete)}")
+    logger.info(f"   🎯 Processing mode: {'Enhanced' if use_enhanced_processing else 'Basic'}")
+    logger.info(f"   🧠 Chunking strategy: {chunking_method}")
     
     # Content quality metrics
     if use_semantic_chunking and semantic_scores:
-        print(f"\n🎯 QUALITY METRICS:")
-        print(f"   📊 Semantic coherence: {avg_semantic_score:.3f}/1.0")
-        print(f"   🏗️  Structured content: {structured_chunks} chunks")
-        print(f"   📋 Table content: {table_chunks} chunks")
+        logger.info(f"\n🎯 QUALITY METRICS:")
+        logger.info(f"   📊 Semantic coherence: {avg_semantic_score:.3f}/1.0")
+        logger.info(f"   🏗️  Structured content: {structured_chunks} chunks")
+        logger.info(f"   📋 Table content: {table_chunks} chunks")
     
     # Technical details
-    print(f"\n🔧 TECHNICAL DETAILS:")
-    print(f"   🌲 Pinecone index: {Config.PINECONE_INDEX_NAME}")
-    print(f"   📡 Vector dimension: 3072")
-    print(f"   🎯 Distance metric: cosine")
-    print(f"   ☁️  Cloud: GCP (europe-west4)")
+    logger.info(f"\n🔧 TECHNICAL DETAILS:")
+    logger.info(f"   🌲 Pinecone index: {Config.PINECONE_INDEX_NAME}"
+                f"{f' (namespace {namespace})' if namespace else ''}")
+    logger.info(f"   📐 Index profile: {Config.INDEX_PROFILE}")
+    logger.info(f"   📡 Vector dimension: {Config.get_index_profile()['dimension']}")
+    logger.info(f"   🎯 Distance metric: {Config.get_index_profile()['metric']}")
+    logger.info(f"   ☁️  Cloud: GCP (europe-west4)")
     
-    print(f"\n✅ Status: READY FOR ENHANCED QUERIES")
-    print("="*80 + "\n")
+    logger.info(f"\n✅ Status: READY FOR ENHANCED QUERIES")
+    logger.info("="*80 + "\n")
     
     return {
         "success": True,
         "files_processed": unique_files,
         "documents_extracted": len(pdf_documents),
         "chunks_created": len(document_chunks),
+        "vectors_upserted": len(plan.to_upsert),
+        "vectors_deleted": len(plan.to_delete),
+        "namespace": namespace,
         "processing_mode": "enhanced" if use_enhanced_processing else "basic",
         "chunking_method": chunking_method,
         "semantic_score": avg_semantic_score if use_semantic_chunking and semantic_scores else None
     }
 
 if __name__ == "__main__":
-    setup_pinecone_index()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Build or update the Pinecone index from PDFs in data/.")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="show the planned upserts and deletions without embedding or writing")
+    parser.add_argument("--full", action="store_true",
+                        help="reprocess every file instead of only new or changed ones")
+    parser.add_argument("--reset", action="store_true",
+                        help="delete every vector in the index before upserting")
+    parser.add_argument("--stream", action="store_true",
+                        help="stream files through the pipeline with bounded memory")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="re-extract every PDF instead of using the extraction cache")
+    parser.add_argument("--snapshot", action="store_true",
+                        help="also publish a memory-mapped local snapshot for VECTOR_BACKEND=snapshot")
+    parser.add_argument("--collection", action="append", dest="collections", metavar="NAME",
+                        help=f"only index this collection (data/NAME/, or {DEFAULT_COLLECTION} for PDFs "
+                             f"directly in data/); repeatable")
+    parser.add_argument("--log-level", default=Config.INGEST_LOG_LEVEL,
+                        help="console verbosity: DEBUG shows per-file steps, WARNING only problems")
+    parser.add_argument("--telemetry", default=Config.INGEST_TELEMETRY_PATH,
+                        help="path of the JSON timing report ('' to skip it)")
+    args = parser.parse_args()
+    
+    configure_logging(args.log_level)
+    setup_pinecone_index(
+        incremental=not args.full,
+        dry_run=args.dry_run,
+        reset_index=args.reset,
+        streaming=args.stream,
+        use_extraction_cache=not args.no_cache,
+        snapshot=args.snapshot,
+        telemetry_path=args.telemetry or None,
+        collections=args.collections
+    )
\ No newline at end of file
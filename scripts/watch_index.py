@@ -0,0 +1,223 @@
+"""
+Ingestion daemon: watch data/ and rebuild changed collections blue/green.
+
+data/ is scanned every --interval seconds (file sizes and modification
+times). Added, changed or removed PDFs mark their collection dirty; once
+nothing has changed for --debounce seconds (a copy in progress keeps
+changing), each dirty collection is indexed incrementally into its standby
+slot namespace, verified, and the serving pointer is flipped to it
+(src/core/serving.py). Servers pick the flip up within
+SNAPSHOT_RELOAD_INTERVAL; until then, and whenever a build or verification
+fails, the live slot keeps serving unchanged. The standby slot catches up
+from its own manifest, so after the first build per slot only the files
+changed since that slot was last built are re-embedded.
+
+Usage:
+    python scripts/watch_index.py [--interval 5] [--debounce 30] [--snapshot] [--once]
+"""
+
+import sys
+import os
+import argparse
+import signal
+import threading
+import time
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from config.settings import Config
+from src.core.serving import SLOTS, publish_serving_pointer, read_serving_pointer, slot_namespace
+from src.core.snapshot import load_snapshot
+from src.utils.file_utils import find_collections
+from src.utils.manifest import IngestionManifest
+from src.utils.telemetry import configure_logging, logger
+from scripts.setup_index import connect_pinecone_index, setup_pinecone_index
+
+
+def scan_corpus(data_dir):
+    """Collection namespace -> {path: (size, mtime_ns)} of its PDFs."""
+    corpus = {}
+    for namespace, pdf_files in find_collections(data_dir).items():
+        files = {}
+        for path in pdf_files:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue  # Removed while scanning; the next scan sees it gone
+            files[path] = (stat.st_size, stat.st_mtime_ns)
+        corpus[namespace] = files
+    return corpus
+
+
+def changed_collections(previous, current):
+    """Namespaces whose set of PDFs or any PDF's size/mtime differs between two scans."""
+    return {
+        namespace for namespace in set(previous) | set(current)
+        if previous.get(namespace) != current.get(namespace)
+    }
+
+
+def stale_collections(corpus):
+    """Collections whose live slot does not match data/ (checked by content hash at startup)."""
+    live = read_serving_pointer()["namespaces"]
+    stale = set(live) - set(corpus)
+    for namespace, files in corpus.items():
+        if namespace not in live:
+            stale.add(namespace)
+            continue
+        manifest = IngestionManifest.load(Config.namespace_path(Config.INDEX_MANIFEST_PATH, live[namespace]))
+        diff = manifest.diff_files(list(files), manifest.data.get("signature", ""))
+        if diff.new or diff.changed or diff.deleted:
+            stale.add(namespace)
+    return stale
+
+
+def verify_slot(namespace, snapshot):
+    """
+    Check that a freshly built slot holds every vector its manifest records.
+
+    The manifest's IDs are fetched from the slot's namespace (a vector count
+    could be met by stale vectors left over from an earlier build). Pinecone
+    applies upserts asynchronously, so missing IDs are polled for up to
+    WATCH_VERIFY_TIMEOUT seconds.
+    """
+    manifest = IngestionManifest.load(Config.namespace_path(Config.INDEX_MANIFEST_PATH, namespace))
+    expected = sorted({vector_id for entry in manifest.files.values() for vector_id in entry["chunk_ids"]})
+    if not expected:
+        logger.warning(f"   ❌ Slot {namespace} has no indexed chunks")
+        return False
+
+    if snapshot:
+        published = load_snapshot(Config.namespace_path(Config.SNAPSHOT_DIR, namespace))
+        snapshot_ids = set(published.index.ids) if published is not None else set()
+        missing = [vector_id for vector_id in expected if vector_id not in snapshot_ids]
+        if missing:
+            logger.warning(f"   ❌ Snapshot of {namespace} lacks {len(missing)} of {len(expected)} vectors")
+            return False
+
+    _, index = connect_pinecone_index()
+    if index is None:
+        return False
+    fetch_batch_size = 100  # IDs per fetch request
+    missing = expected
+    deadline = time.monotonic() + Config.WATCH_VERIFY_TIMEOUT
+    while True:
+        found = set()
+        for start in range(0, len(missing), fetch_batch_size):
+            response = index.fetch(ids=missing[start:start + fetch_batch_size], namespace=namespace)
+            found.update(response.vectors)
+        missing = [vector_id for vector_id in missing if vector_id not in found]
+        if not missing:
+            logger.info(f"   ✅ Slot {namespace} verified: all {len(expected)} vectors present")
+            return True
+        if time.monotonic() >= deadline:
+            logger.warning(f"   ❌ Slot {namespace} lacks {len(missing)} of {len(expected)} vectors after "
+                           f"{Config.WATCH_VERIFY_TIMEOUT:.0f}s")
+            return False
+        time.sleep(2)
+
+
+def rebuild_collection(namespace, pdf_files, streaming=True, snapshot=False):
+    """Build a collection into its standby slot and flip the pointer to it; returns whether it flipped."""
+    live = read_serving_pointer()["namespaces"].get(namespace)
+    standby = next(slot_namespace(namespace, slot) for slot in SLOTS if slot_namespace(namespace, slot) != live)
+    label = namespace or "default"
+    logger.info(f"\n🔨 Rebuilding collection '{label}' into {standby} (live: {live or 'none'})")
+
+    result = setup_pinecone_index(
+        incremental=True,
+        streaming=streaming,
+        snapshot=snapshot,
+        telemetry_path=None,
+        targets={standby: pdf_files}
+    )
+    if not result or not result.get("success"):
+        logger.warning(f"   ❌ Build of {standby} failed; '{label}' keeps serving {live or 'nothing'}")
+        return False
+    if not verify_slot(standby, snapshot):
+        logger.warning(f"   ❌ Verification of {standby} failed; '{label}' keeps serving {live or 'nothing'}")
+        return False
+
+    namespaces = read_serving_pointer()["namespaces"]
+    namespaces[namespace] = standby
+    version = publish_serving_pointer(namespaces)
+    logger.info(f"   🔀 '{label}' now served from {standby} (pointer v{version}); {live or 'no slot'} kept for rollback")
+    return True
+
+
+def retire_collection(namespace, streaming=True, snapshot=False):
+    """Stop serving a collection whose directory was removed, then empty both of its slots."""
+    namespaces = read_serving_pointer()["namespaces"]
+    if namespaces.pop(namespace, None) is not None:
+        version = publish_serving_pointer(namespaces)
+        logger.info(f"\n🗑️  Collection '{namespace or 'default'}' removed from serving (pointer v{version})")
+    for slot in SLOTS:
+        standby = slot_namespace(namespace, slot)
+        if not os.path.exists(Config.namespace_path(Config.INDEX_MANIFEST_PATH, standby)):
+            continue  # Never built by the daemon
+        setup_pinecone_index(
+            incremental=True,
+            streaming=streaming,
+            snapshot=snapshot,
+            telemetry_path=None,
+            targets={standby: []}
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch data/ and rebuild changed collections blue/green.")
+    parser.add_argument("--data-dir", default="data/", help="directory with the PDF collections")
+    parser.add_argument("--interval", type=float, default=Config.WATCH_INTERVAL, help="seconds between scans")
+    parser.add_argument("--debounce", type=float, default=Config.WATCH_DEBOUNCE,
+                        help="seconds data/ must stay unchanged before rebuilding")
+    parser.add_argument("--no-stream", action="store_true", help="build without the streaming pipeline")
+    parser.add_argument("--snapshot", action="store_true",
+                        help="also publish a memory-mapped local snapshot per slot for VECTOR_BACKEND=snapshot")
+    parser.add_argument("--once", action="store_true", help="bring every collection up to date and exit")
+    parser.add_argument("--log-level", default=Config.INGEST_LOG_LEVEL, help="console verbosity")
+    args = parser.parse_args()
+    configure_logging(args.log_level)
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+
+    corpus = scan_corpus(args.data_dir)
+    dirty = stale_collections(corpus)
+    changed_at = time.monotonic() - args.debounce  # What is stale at startup needs no debounce
+    logger.info(f"👀 Watching {args.data_dir} ({len(corpus)} collection(s), {len(dirty)} out of date)")
+
+    while not stop.is_set():
+        if dirty and time.monotonic() - changed_at >= args.debounce:
+            for namespace in sorted(dirty):
+                if stop.is_set():
+                    break
+                if namespace in corpus:
+                    if rebuild_collection(namespace, list(corpus[namespace]), not args.no_stream, args.snapshot):
+                        dirty.discard(namespace)
+                else:
+                    retire_collection(namespace, not args.no_stream, args.snapshot)
+                    dirty.discard(namespace)
+            # Failed builds are retried after the next quiet period
+            changed_at = time.monotonic()
+        if args.once:
+            break
+
+        stop.wait(args.interval)
+        scan = scan_corpus(args.data_dir)
+        changed = changed_collections(corpus, scan)
+        if changed:
+            logger.info(f"📝 Changes in {', '.join(sorted(n or 'default' for n in changed))}; "
+                        f"rebuilding after {args.debounce:.0f}s without changes")
+            dirty |= changed
+            changed_at = time.monotonic()
+        corpus = scan
+
+    logger.info("👋 Watch daemon stopped")
+    return 1 if args.once and dirty else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
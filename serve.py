@@ -0,0 +1,52 @@
+"""
+Production entry point: pre-forked multi-worker server for the chatbot.
+
+The master imports app.py, which loads the shared read-only state (library
+code, intent vocabulary, local vector snapshot), then forks the workers;
+each worker creates its own OpenAI/Pinecone clients before serving.
+
+Usage:
+    python serve.py [--workers N] [--port PORT] [--max-requests N]
+"""
+
+import sys
+import os
+import argparse
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, project_root)
+
+from config.settings import Config
+from src.utils.prefork import PreforkServer
+from src.utils.telemetry import configure_logging
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the chatbot with pre-forked worker processes")
+    parser.add_argument("--host", default=Config.SERVER_HOST, help="Interface to bind")
+    parser.add_argument("--port", type=int, default=Config.SERVER_PORT, help="Port to bind")
+    parser.add_argument("--workers", type=int, default=Config.SERVER_WORKERS,
+                        help="Worker processes (0 = one per CPU)")
+    parser.add_argument("--max-requests", type=int, default=Config.SERVER_MAX_REQUESTS,
+                        help="Replace a worker after this many requests (0 = never)")
+    parser.add_argument("--log-level", default=None, help="Console log level (default: INGEST_LOG_LEVEL)")
+    args = parser.parse_args()
+
+    configure_logging(args.log_level)
+
+    import app as web
+
+    server = PreforkServer(
+        web.app,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        max_requests=args.max_requests,
+        max_requests_jitter=Config.SERVER_MAX_REQUESTS_JITTER,
+        graceful_timeout=Config.SERVER_GRACEFUL_TIMEOUT,
+        init_worker=web.get_chat_service,
+    )
+    server.serve_forever()
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,146 @@
+import queue
+import threading
+import time
+from typing import List, Optional
+
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
+from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
+from config.settings import Config
+from src.utils.telemetry import IngestionTelemetry
+
+def get_openai_embeddings(profile=None):
+    """Download OpenAI embeddings model sized for an index profile (the active one by default)."""
+    index_profile = Config.get_index_profile(profile)
+    if index_profile["dimension"] < Config.EMBEDDING_NATIVE_DIMENSION:
+        return OpenAIEmbeddings(model=Config.EMBEDDING_MODEL, dimensions=index_profile["dimension"])
+    return OpenAIEmbeddings(model=Config.EMBEDDING_MODEL)
+
+def get_cached_embeddings(cache_dir, profile=None):
+    """OpenAI embeddings backed by an on-disk cache, for repeatable offline evaluation."""
+    index_profile = Config.get_index_profile(profile)
+    return CacheBackedEmbeddings.from_bytes_store(
+        get_openai_embeddings(profile),
+        LocalFileStore(cache_dir),
+        namespace=f"{Config.EMBEDDING_MODEL}-{index_profile['dimension']}",
+        query_embedding_cache=True,
+        key_encoder="sha256"
+    )
+
+
+class _PendingQuery:
+    __slots__ = ("text", "enqueued", "done", "vector", "error")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.enqueued = time.perf_counter()
+        self.done = threading.Event()
+        self.vector: Optional[List[float]] = None
+        self.error: Optional[BaseException] = None
+
+
+class BatchingEmbeddings(Embeddings):
+    """
+    Coalesce concurrent embed_query calls into batched embed_documents calls.
+    
+    A background thread takes the first waiting query, keeps collecting for up
+    to max_wait_ms or until max_batch_size queries are queued, sends them in one
+    request and hands each caller its own vector. A lone query therefore waits
+    at most max_wait_ms extra. embed_documents calls pass straight through.
+    
+    Metrics (stages "embed_batch" and "embed_batch.queue", counters
+    "embed_batch.batches", "embed_batch.queries" and "embed_batch.size.<n>")
+    are collected in self.metrics.
+    """
+
+    def __init__(self, embeddings: Embeddings, max_wait_ms: Optional[float] = None,
+                 max_batch_size: Optional[int] = None):
+        self.embeddings = embeddings
+        self.max_wait = (Config.EMBED_BATCH_MAX_WAIT_MS if max_wait_ms is None else max_wait_ms) / 1000
+        self.max_batch_size = max(1, max_batch_size or Config.EMBED_BATCH_MAX_SIZE)
+        self.metrics = IngestionTelemetry()
+        self._queue: "queue.Queue[_PendingQuery]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        self._ensure_worker()
+        pending = _PendingQuery(text)
+        self._queue.put(pending)
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.vector
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="embed-batcher", daemon=True)
+                self._worker.start()
+
+    def _collect(self) -> List[_PendingQuery]:
+        """Block for the first query, then gather more until the batch is full or max_wait passes."""
+        batch = [self._queue.get()]
+        deadline = batch[0].enqueued + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            sent = time.perf_counter()
+            for pending in batch:
+                self.metrics.record("embed_batch.queue", sent - pending.enqueued)
+            self.metrics.count("embed_batch.batches")
+            self.metrics.count("embed_batch.queries", len(batch))
+            self.metrics.count(f"embed_batch.size.{len(batch)}")
+
+            try:
+                # Identical concurrent questions are embedded once
+                texts = list(dict.fromkeys(pending.text for pending in batch))
+                with self.metrics.span("embed_batch"):
+                    vectors = dict(zip(texts, self.embeddings.embed_documents(texts)))
+                for pending in batch:
+                    pending.vector = vectors[pending.text]
+            except Exception as e:
+                for pending in batch:
+                    pending.error = e
+            finally:
+                for pending in batch:
+                    pending.done.set()
+
+    def stats(self) -> dict:
+        """Batch count, mean batch size and queueing delay so far."""
+        report = self.metrics.report()
+        counters, queue_stage = report["counters"], report["stages"].get("embed_batch.queue", {})
+        batches = counters.get("embed_batch.batches", 0)
+        return {
+            "batches": batches,
+            "queries": counters.get("embed_batch.queries", 0),
+            "mean_batch_size": counters.get("embed_batch.queries", 0) / batches if batches else 0.0,
+            "mean_queue_ms": queue_stage.get("mean_seconds", 0.0) * 1000,
+            "max_queue_ms": queue_stage.get("max_seconds", 0.0) * 1000,
+            "batch_sizes": dict(sorted(
+                (int(name.rsplit(".", 1)[1]), value)
+                for name, value in counters.items() if name.startswith("embed_batch.size.")
+            )),
+        }
+
 
-def get_openai_embeddings():
-    """Download OpenAI embeddings model with specified model."""
-    return OpenAIEmbeddings(model="text-embedding-3-large")
\ No newline at end of file
+def get_query_embeddings(profile=None):
+    """OpenAI embeddings for serving, micro-batching concurrent queries unless disabled."""
+    embeddings = get_openai_embeddings(profile)
+    if Config.EMBED_BATCH_MAX_WAIT_MS <= 0:
+        return embeddings
+    return BatchingEmbeddings(embeddings)
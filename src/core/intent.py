@@ -0,0 +1,109 @@
+"""
+Keyword/regex intent classifier mapping questions to metadata filters.
+
+Two signals are cheap and reliable enough to pre-filter on:
+
+- Manual targeting: distinctive words of the indexed file names ("vpn",
+  "eduroam", "sso") appearing in the question restrict the search to those
+  manuals (file_name).
+- Table lookups: schedule, price, contact and extension questions are
+  answered by extracted tables (content_type "table").
+
+Both are hints, not hard constraints: the retriever falls back to an
+unfiltered search when the filtered results score poorly.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from config.settings import Config
+from src.utils.manifest import IngestionManifest, list_namespaces
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+TABLE_INTENT_PATTERN = re.compile(
+    r"\b(tabel|table|jadwal|schedule|tarif|harga|price|biaya|kontak|contact|ekstensi|extension"
+    r"|jam (operasional|layanan|kerja)|opening hours|nomor (telepon|telp|ext))\b",
+    re.IGNORECASE
+)
+
+# File name words that say nothing about which manual is meant
+GENERIC_FILE_WORDS = {
+    "pdf", "manual", "panduan", "guide", "user", "users", "pengguna", "buku", "book", "petunjuk",
+    "teknis", "doc", "docs", "dokumen", "document", "final", "rev", "revisi", "versi", "version",
+    "dan", "and", "the", "for", "untuk", "uii", "bsi", "new", "baru", "copy",
+}
+
+
+@dataclass
+class QueryIntent:
+    """Metadata filter inferred from a question, with the words that triggered it."""
+    filter: Dict[str, Any] = field(default_factory=dict)
+    matched: List[str] = field(default_factory=list)
+
+
+class IntentClassifier:
+    """Map questions to metadata filters using file-name vocabulary and keyword rules."""
+
+    def __init__(self, file_names: Iterable[str] = (), max_files: int = 3):
+        """
+        Args:
+            file_names: Names of the indexed PDF files
+            max_files: Skip the file filter when a question matches more manuals than this
+        """
+        self.max_files = max_files
+        self.file_words: Dict[str, Set[str]] = {}
+
+        file_names = sorted(set(file_names))
+        word_files: Dict[str, Set[str]] = {}
+        for file_name in file_names:
+            stem = os.path.splitext(file_name)[0].lower()
+            for word in set(WORD_PATTERN.findall(stem)):
+                if len(word) >= 3 and not word.isdigit() and word not in GENERIC_FILE_WORDS:
+                    word_files.setdefault(word, set()).add(file_name)
+
+        # Words shared by most manuals do not single one out
+        limit = max(1, len(file_names) // 2)
+        self.file_words = {word: files for word, files in word_files.items() if len(files) <= limit}
+
+    @classmethod
+    def from_manifest(
+        cls, manifest_path: str = Config.INDEX_MANIFEST_PATH, namespaces: Optional[Iterable[str]] = None, **kwargs
+    ) -> "IntentClassifier":
+        """
+        Build the file-name vocabulary from the files recorded in the ingestion manifests.
+
+        Args:
+            manifest_path: Manifest of the default namespace; the others sit next to it
+            namespaces: Namespaces whose manifests to read (default: all of them)
+        """
+        if namespaces is None:
+            namespaces = list_namespaces(manifest_path)
+        file_names = [
+            os.path.basename(path)
+            for namespace in namespaces
+            for path in IngestionManifest.load(Config.namespace_path(manifest_path, namespace)).files
+        ]
+        return cls(file_names, **kwargs)
+
+    def classify(self, question: str) -> QueryIntent:
+        intent = QueryIntent()
+
+        files: Set[str] = set()
+        for word in set(WORD_PATTERN.findall(question.lower())):
+            if word in self.file_words:
+                files |= self.file_words[word]
+                intent.matched.append(word)
+        if files and len(files) <= self.max_files:
+            intent.filter["file_name"] = {"$in": sorted(files)}
+        else:
+            intent.matched.clear()
+
+        table_match = TABLE_INTENT_PATTERN.search(question)
+        if table_match:
+            intent.filter["content_type"] = {"$eq": "table"}
+            intent.matched.append(table_match.group(0).lower())
+
+        return intent
@@ -0,0 +1,86 @@
+"""
+In-process vector index for exact nearest-neighbour search with numpy.
+
+Used where a network round trip to Pinecone is unwanted: offline evaluation,
+benchmarks and serving from local snapshots. Vectors are L2-normalized on
+insert, so inner product equals cosine similarity.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize each row of a 2-D float array (zero rows stay zero)."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def truncate_embeddings(vectors: np.ndarray, dimension: int) -> np.ndarray:
+    """
+    Shorten text-embedding-3 vectors to `dimension` and re-normalize.
+    
+    This matches what the API's `dimensions` parameter returns, so one
+    full-size embedding pass can be evaluated at every smaller profile.
+    """
+    return normalize_rows(np.ascontiguousarray(vectors[:, :dimension], dtype=np.float32))
+
+
+class LocalVectorIndex:
+    """Exact cosine-similarity search over an in-memory (or memory-mapped) matrix."""
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        texts: Optional[Sequence[str]] = None,
+        metadatas: Optional[Sequence[Dict[str, Any]]] = None,
+        normalized: bool = False,
+    ):
+        """
+        Args:
+            ids: Vector IDs, one per row
+            vectors: 2-D float32 array (may be a np.memmap)
+            texts: Optional chunk texts, one per row
+            metadatas: Optional metadata dicts, one per row
+            normalized: Whether rows are already L2-normalized
+        """
+        if len(ids) != len(vectors):
+            raise ValueError(f"Got {len(ids)} ids for {len(vectors)} vectors")
+        self.ids = list(ids)
+        self.vectors = vectors if normalized else normalize_rows(np.asarray(vectors, dtype=np.float32))
+        self.texts = texts
+        self.metadatas = metadatas
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dimension(self) -> int:
+        return int(self.vectors.shape[1]) if len(self.ids) else 0
+
+    def search(
+        self, query_vector: Sequence[float], k: int = 4, candidates: Optional[np.ndarray] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Return the k most similar rows as (row, score) pairs, best first.
+        
+        Args:
+            query_vector: Query embedding (normalized here)
+            k: Number of results
+            candidates: Optional array of row numbers to restrict the search to
+        """
+        if not len(self.ids):
+            return []
+        query = np.asarray(query_vector, dtype=np.float32)
+        query = query / (np.linalg.norm(query) or 1.0)
+
+        matrix = self.vectors if candidates is None else self.vectors[candidates]
+        scores = matrix @ query
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        rows = top if candidates is None else candidates[top]
+        return [(int(row), float(scores[i])) for row, i in zip(rows, top)]
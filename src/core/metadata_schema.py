@@ -0,0 +1,135 @@
+"""
+Declarative schema for the metadata sent with each vector.
+
+Chunks carry ~30 metadata fields (extractor output, ChunkMetadata analysis,
+dedup provenance), but queries only need a few of them back. Each field has
+one of three roles:
+
+- indexed: sent to the vector index and used in metadata filters
+- stored:  sent to the vector index and returned with results, not filtered on
+- local:   never leaves this machine (kept in the text side store, if enabled)
+
+Fields not named in the schema are local. Serverless Pinecone indexes every
+metadata field, so the indexed/stored split documents intent there; on pod
+indexes it maps to metadata_config={"indexed": [...]}.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from langchain.schema.document import Document
+
+from config.settings import Config
+
+
+def _coerce(value: Any) -> Any:
+    """Convert a metadata value to a type the index accepts (None means drop it)."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple, set)):
+        return [str(item) for item in value]
+    return str(value)
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+@dataclass(frozen=True)
+class MetadataSchema:
+    """Which metadata fields are indexed, stored or kept local."""
+    indexed: Tuple[str, ...] = ()
+    stored: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_config(cls, spec: Optional[Dict[str, Iterable[str]]] = None) -> "MetadataSchema":
+        spec = spec if spec is not None else Config.METADATA_SCHEMA
+        return cls(indexed=tuple(spec.get("indexed", ())), stored=tuple(spec.get("stored", ())))
+
+    @property
+    def remote_fields(self) -> Tuple[str, ...]:
+        return self.indexed + self.stored
+
+    @property
+    def fingerprint(self) -> str:
+        """Short hash of the schema; a change means remote payloads must be rewritten."""
+        spec = json.dumps({"indexed": sorted(self.indexed), "stored": sorted(self.stored)})
+        return hashlib.sha1(spec.encode("utf-8")).hexdigest()[:8]
+
+    def role(self, field: str) -> str:
+        if field in self.indexed:
+            return "indexed"
+        if field in self.stored:
+            return "stored"
+        return "local"
+
+    def remote(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """The part of the metadata sent to the vector index."""
+        remote = {}
+        for field in self.remote_fields:
+            value = _coerce(metadata.get(field))
+            if value is not None:
+                remote[field] = value
+        return remote
+
+    def local(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """The part of the metadata that stays local."""
+        remote_fields = set(self.remote_fields)
+        return {field: value for field, value in metadata.items() if field not in remote_fields}
+
+
+def payload_report(
+    chunks: List[Document],
+    schema: MetadataSchema,
+    dimension: int,
+    k: int = 2,
+    text_remote: bool = True,
+    text_key: str = "text",
+) -> Dict[str, Any]:
+    """
+    Average bytes per vector and per query response, before and after the schema.
+
+    Metadata is measured as compact JSON; vectors as float32 values (which
+    queries do not return by default).
+
+    Args:
+        chunks: Chunks that would be upserted
+        schema: Metadata schema to apply
+        dimension: Vector dimension
+        k: Results per query
+        text_remote: Whether chunk text is still sent to the index
+        text_key: Metadata key holding the chunk text
+    """
+    if not chunks:
+        return {}
+    full_bytes, lean_bytes = 0, 0
+    field_bytes: Dict[str, int] = {}
+    for chunk in chunks:
+        full = {**chunk.metadata, text_key: chunk.page_content}
+        lean = schema.remote(chunk.metadata)
+        if text_remote:
+            lean[text_key] = chunk.page_content
+        full_bytes += _json_size(full)
+        lean_bytes += _json_size(lean)
+        for field, value in full.items():
+            field_bytes[field] = field_bytes.get(field, 0) + _json_size({field: value})
+
+    count = len(chunks)
+    vector_bytes = dimension * 4
+    full_metadata, lean_metadata = full_bytes / count, lean_bytes / count
+    return {
+        "vectors": count,
+        "vector_bytes": vector_bytes,
+        "full_metadata_bytes": full_metadata,
+        "lean_metadata_bytes": lean_metadata,
+        "full_bytes_per_vector": vector_bytes + full_metadata,
+        "lean_bytes_per_vector": vector_bytes + lean_metadata,
+        "full_bytes_per_query": k * full_metadata,
+        "lean_bytes_per_query": k * lean_metadata,
+        "largest_fields": {
+            field: total / count
+            for field, total in sorted(field_bytes.items(), key=lambda item: -item[1])[:5]
+        },
+    }
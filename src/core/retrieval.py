@@ -0,0 +1,120 @@
+"""
+Retriever base with metadata pre-filtering and unfiltered fallback.
+
+Backends implement search(query_vector, k, filter). When a classifier maps
+the question to a metadata filter, the filtered search runs first; if it
+returns fewer than k chunks or its best score is below min_score, the
+question is answered from an unfiltered search instead. The query is
+embedded once for both searches.
+
+ShardedRetriever fans a search out to one backend per index namespace
+concurrently and merges the results by score; shards that do not answer
+within the timeout are left out rather than holding up the answer.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain.schema.document import Document
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.retrievers import BaseRetriever
+from pydantic import PrivateAttr
+
+from config.settings import Config
+from src.utils.telemetry import logger
+
+
+class FilteredVectorRetriever(BaseRetriever):
+    """Embed the query, search with the classifier's filter, fall back to an unfiltered search."""
+
+    embeddings: Any
+    k: int = 2
+    classifier: Any = None
+    min_score: float = Config.INTENT_MIN_SCORE
+
+    def search(
+        self, query_vector: List[float], k: int, filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Document, float]]:
+        """Top-k (Document, similarity) pairs, best first, restricted to filter if given."""
+        raise NotImplementedError
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        query_vector = self.embeddings.embed_query(query)
+        filter = self.classifier.classify(query).filter if self.classifier is not None else None
+
+        if filter:
+            results = self.search(query_vector, self.k, filter)
+            if len(results) >= self.k and results[0][1] >= self.min_score:
+                return [document for document, _ in results]
+            best = f"{results[0][1]:.3f}" if results else "none"
+            logger.debug(f"🔎 Filter {filter} matched {len(results)} chunk(s), best score {best}; "
+                         f"falling back to an unfiltered search")
+
+        return [document for document, _ in self.search(query_vector, self.k)]
+
+
+class VectorStoreRetriever(FilteredVectorRetriever):
+    """FilteredVectorRetriever over a LangChain vector store (PineconeVectorStore)."""
+
+    vector_store: Any
+
+    def search(
+        self, query_vector: List[float], k: int, filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Document, float]]:
+        return self.vector_store.similarity_search_by_vector_with_score(query_vector, k=k, filter=filter)
+
+
+class ShardedRetriever(FilteredVectorRetriever):
+    """Search the relevant namespace shards concurrently and merge their results by score."""
+
+    shards: Dict[str, Any]
+    shard_files: Dict[str, List[str]] = {}
+    timeout: float = Config.SHARD_TIMEOUT
+    _executor: ThreadPoolExecutor = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Room for a second query while a timed-out shard is still blocking a thread
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(4, 2 * len(self.shards)), thread_name_prefix="shard"
+        )
+
+    def select_shards(self, filter: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Namespaces that can hold matches for the filter (all of them without a file filter)."""
+        files = (filter or {}).get("file_name", {}).get("$in")
+        if not files:
+            return list(self.shards)
+        selected = [
+            namespace for namespace in self.shards
+            if set(files) & set(self.shard_files.get(namespace, ()))
+        ]
+        return selected or list(self.shards)
+
+    def search(
+        self, query_vector: List[float], k: int, filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Document, float]]:
+        namespaces = self.select_shards(filter)
+        start = time.perf_counter()
+        futures = {
+            self._executor.submit(self.shards[namespace].search, query_vector, k, filter): namespace
+            for namespace in namespaces
+        }
+        done, late = wait(futures, timeout=self.timeout)
+
+        results: List[Tuple[Document, float]] = []
+        for future in done:
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                logger.warning(f"⚠️  Shard '{futures[future] or 'default'}' failed: {e}")
+        for future in late:
+            future.cancel()
+            logger.warning(f"⚠️  Shard '{futures[future] or 'default'}' did not answer within "
+                           f"{self.timeout:.1f}s; answering without it")
+        logger.debug(f"🧩 Searched {len(done)}/{len(namespaces)} shard(s) in "
+                     f"{(time.perf_counter() - start) * 1000:.0f} ms")
+
+        results.sort(key=lambda result: result[1], reverse=True)
+        return results[:k]
@@ -0,0 +1,103 @@
+"""
+Blue/green serving pointer: which index namespace serves each collection.
+
+The watch daemon (scripts/watch_index.py) never updates the namespace that
+is serving. Every collection has two slot namespaces, blue and green; a
+rebuild goes into the standby slot, is verified, and only then does the
+pointer file flip the collection to it. The pointer is replaced atomically,
+so readers see the old or the new mapping, never a mix, and the previous
+slot stays intact for a rollback. Collections missing from the pointer are
+served from their plain namespace, as indexed by setup_index.py.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from config.settings import Config
+from src.utils.manifest import list_namespaces
+
+SLOTS = ("blue", "green")
+
+
+def slot_namespace(namespace: str, slot: str) -> str:
+    """Namespace of one blue/green slot of a collection ("" -> "blue", "hr" -> "hr--blue")."""
+    return f"{namespace}--{slot}" if namespace else slot
+
+
+def is_slot_namespace(namespace: str) -> bool:
+    return any(namespace == slot or namespace.endswith(f"--{slot}") for slot in SLOTS)
+
+
+def read_serving_pointer(path: str = Config.SERVING_POINTER_PATH) -> Dict:
+    """The published pointer: {"version": n, "namespaces": {collection: slot namespace}}."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"version": 0, "namespaces": {}}
+
+
+def publish_serving_pointer(namespaces: Dict[str, str], path: str = Config.SERVING_POINTER_PATH) -> int:
+    """Atomically replace the pointer with a new mapping; returns its version."""
+    version = read_serving_pointer(path)["version"] + 1
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": version, "updated_at": time.time(), "namespaces": namespaces}, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return version
+
+
+def serving_namespaces(
+    pointer: Optional[Dict] = None, manifest_path: str = Config.INDEX_MANIFEST_PATH
+) -> Dict[str, str]:
+    """
+    Map every indexed collection to the namespace serving it.
+
+    Collections indexed by setup_index.py serve from their own namespace;
+    the pointer overrides that for collections managed by the watch daemon.
+    """
+    pointer = pointer if pointer is not None else read_serving_pointer()
+    namespaces = {
+        namespace: namespace for namespace in list_namespaces(manifest_path) if not is_slot_namespace(namespace)
+    }
+    namespaces.update(pointer["namespaces"])
+    return namespaces or {"": ""}
+
+
+class ServingPointer:
+    """The published pointer, re-read at most once per interval."""
+
+    def __init__(
+        self, path: str = Config.SERVING_POINTER_PATH, reload_interval: float = Config.SNAPSHOT_RELOAD_INTERVAL
+    ):
+        """
+        Args:
+            path: Pointer file written by the watch daemon
+            reload_interval: Seconds between reads of the file (0 reads it on every call)
+        """
+        self.path = path
+        self.reload_interval = reload_interval
+        self._pointer = read_serving_pointer(path)
+        self._checked_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def current(self) -> Dict:
+        if time.monotonic() - self._checked_at >= self.reload_interval and self._lock.acquire(blocking=False):
+            try:
+                self._checked_at = time.monotonic()
+                self._pointer = read_serving_pointer(self.path)
+            except (OSError, ValueError):
+                pass  # Keep serving the last good mapping
+            finally:
+                self._lock.release()
+        return self._pointer
+
+    @property
+    def version(self) -> int:
+        return self.current()["version"]
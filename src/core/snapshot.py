@@ -0,0 +1,392 @@
+"""
+Versioned, memory-mapped vector snapshots with hot-swap reloading.
+
+A snapshot is a directory holding the L2-normalized vectors as one raw
+float32 matrix (vectors.f32, memory-mapped read-only so every worker process
+shares the same page-cache pages), the chunk IDs, texts and metadata in a
+compressed JSON-lines sidecar, and a small meta.json. Snapshots are written
+to a temporary directory and renamed into place; the CURRENT file names the
+live version and is replaced atomically, so readers only ever see complete
+snapshots. SnapshotManager polls CURRENT and swaps to a new version between
+requests: in-flight searches keep the snapshot object they started with.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain.schema.document import Document
+
+from config.settings import Config
+from src.core.local_index import LocalVectorIndex, normalize_rows
+from src.core.retrieval import FilteredVectorRetriever
+from src.utils.telemetry import logger
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+SNAPSHOT_FORMAT = 1
+CURRENT_FILE = "CURRENT"
+VECTORS_FILE = "vectors.f32"
+META_FILE = "meta.json"
+CHUNKS_FILE = "chunks.jsonl.zst" if ZSTD_AVAILABLE else "chunks.jsonl.z"
+
+
+def _compressor():
+    if ZSTD_AVAILABLE:
+        return zstandard.ZstdCompressor(level=10).compressobj()
+    return zlib.compressobj(6)
+
+
+def _decompress(data: bytes, file_name: str) -> bytes:
+    if file_name.endswith(".zst"):
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return zlib.decompressobj().decompress(data)
+
+
+def read_current_version(root: str) -> Optional[str]:
+    """Version named by root/CURRENT, or None when no snapshot was published."""
+    try:
+        with open(os.path.join(root, CURRENT_FILE), "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def publish_snapshot(root: str, version: str) -> None:
+    """Atomically point root/CURRENT at a snapshot version."""
+    tmp_path = os.path.join(root, f"{CURRENT_FILE}.tmp.{os.getpid()}")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(version)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, os.path.join(root, CURRENT_FILE))
+
+
+def list_snapshots(root: str) -> List[str]:
+    """Complete snapshot versions under root, oldest first."""
+    if not os.path.isdir(root):
+        return []
+    return sorted(
+        name for name in os.listdir(root)
+        if not name.startswith(".") and os.path.exists(os.path.join(root, name, META_FILE))
+    )
+
+
+class VectorSnapshot:
+    """A loaded snapshot: memory-mapped vectors plus chunk texts and metadata."""
+
+    def __init__(self, path: str):
+        with open(os.path.join(path, META_FILE), "r", encoding="utf-8") as f:
+            self.meta: Dict[str, Any] = json.load(f)
+        if self.meta.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported snapshot format in {path}: {self.meta.get('format')}")
+
+        self.path = path
+        self.version = self.meta["version"]
+        count, dimension = self.meta["count"], self.meta["dimension"]
+
+        ids, texts, metadatas = [], [], []
+        chunks_file = self.meta["chunks_file"]
+        with open(os.path.join(path, chunks_file), "rb") as f:
+            payload = _decompress(f.read(), chunks_file)
+        for line in payload.splitlines():
+            vector_id, text, metadata = json.loads(line)
+            ids.append(vector_id)
+            texts.append(text)
+            metadatas.append(metadata)
+        if len(ids) != count:
+            raise ValueError(f"Snapshot {path} lists {len(ids)} chunks for {count} vectors")
+
+        vectors = (
+            np.memmap(os.path.join(path, VECTORS_FILE), dtype=np.float32, mode="r", shape=(count, dimension))
+            if count else np.zeros((0, dimension), dtype=np.float32)
+        )
+        self.index = LocalVectorIndex(ids, vectors, texts=texts, metadatas=metadatas, normalized=True)
+        self._value_rows: Dict[str, Dict[Any, np.ndarray]] = {}
+        self._value_rows_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def dimension(self) -> int:
+        return self.meta["dimension"]
+
+    def candidate_rows(self, filter: Dict[str, Any]) -> np.ndarray:
+        """
+        Rows whose metadata matches a Pinecone-style filter.
+
+        Supports implicit equality and $eq, $ne, $in and $nin per field,
+        combined with AND. Per-field value -> rows maps are built on first use.
+        """
+        rows = np.arange(len(self), dtype=np.int64)
+        for field, condition in filter.items():
+            if not isinstance(condition, dict):
+                condition = {"$eq": condition}
+            value_rows = self._rows_by_value(field)
+            for operator, operand in condition.items():
+                values = operand if operator in ("$in", "$nin") else [operand]
+                selected = np.concatenate(
+                    [value_rows.get(value, np.empty(0, dtype=np.int64)) for value in values] or
+                    [np.empty(0, dtype=np.int64)]
+                )
+                if operator in ("$eq", "$in"):
+                    rows = np.intersect1d(rows, selected, assume_unique=True)
+                elif operator in ("$ne", "$nin"):
+                    rows = np.setdiff1d(rows, selected, assume_unique=True)
+                else:
+                    raise ValueError(f"Unsupported filter operator: {operator}")
+        return rows
+
+    def _rows_by_value(self, field: str) -> Dict[Any, np.ndarray]:
+        value_rows = self._value_rows.get(field)
+        if value_rows is None:
+            with self._value_rows_lock:
+                grouped: Dict[Any, List[int]] = {}
+                for row, metadata in enumerate(self.index.metadatas):
+                    value = metadata.get(field)
+                    if isinstance(value, (str, int, float, bool)):
+                        grouped.setdefault(value, []).append(row)
+                value_rows = {value: np.asarray(rows, dtype=np.int64) for value, rows in grouped.items()}
+                self._value_rows[field] = value_rows
+        return value_rows
+
+    def search(
+        self,
+        query_vector: Sequence[float],
+        k: int = 4,
+        candidates: Optional[np.ndarray] = None,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[Document, float]]:
+        """Top-k chunks as (Document, cosine score) pairs, best first."""
+        if filter:
+            candidates = self.candidate_rows(filter) if candidates is None else \
+                np.intersect1d(candidates, self.candidate_rows(filter))
+            if not len(candidates):
+                return []
+        return [
+            (Document(
+                id=self.index.ids[row], page_content=self.index.texts[row], metadata=dict(self.index.metadatas[row])
+            ), score)
+            for row, score in self.index.search(query_vector, k=k, candidates=candidates)
+        ]
+
+
+def load_snapshot(root: str, version: Optional[str] = None) -> Optional[VectorSnapshot]:
+    """Load a snapshot version (the published one by default), or None if there is none."""
+    version = version or read_current_version(root)
+    if version is None:
+        return None
+    return VectorSnapshot(os.path.join(root, version))
+
+
+class SnapshotWriter:
+    """
+    Build a new snapshot version from upserted batches.
+
+    Vectors are appended to disk as batches arrive; texts and metadata are
+    streamed into the compressed sidecar. On commit, rows of a base snapshot
+    that were neither re-upserted nor removed are carried over, so an
+    incremental run produces a complete snapshot of the index.
+    """
+
+    def __init__(self, root: str, dimension: int, text_key: str = "text", info: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            root: Directory holding the snapshot versions and CURRENT
+            dimension: Vector dimension
+            text_key: Metadata key holding chunk text, dropped from stored metadata
+            info: Extra fields recorded in meta.json (index profile, signature, ...)
+        """
+        self.root = root
+        self.dimension = dimension
+        self.text_key = text_key
+        self.info = info or {}
+        # Sortable version names: oldest first when listed
+        now_ns = time.time_ns()
+        self.version = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now_ns // 10**9))}-{now_ns % 10**9:09d}"
+        self.tmp_path = os.path.join(root, f".{self.version}.tmp")
+        os.makedirs(self.tmp_path)
+
+        self.count = 0
+        self._ids = set()
+        self._removed = set()
+        self._lock = threading.Lock()
+        self._vectors = open(os.path.join(self.tmp_path, VECTORS_FILE), "wb")
+        self._chunks = open(os.path.join(self.tmp_path, CHUNKS_FILE), "wb")
+        self._compressor = _compressor()
+
+    def add(self, batch: Sequence[Tuple[str, Document]], vectors: Sequence[Sequence[float]]) -> None:
+        """Append upserted (vector_id, chunk) pairs with their embeddings (PipelinedUploader on_batch)."""
+        matrix = normalize_rows(np.asarray(vectors, dtype=np.float32).reshape(len(batch), self.dimension))
+        records = [
+            (vector_id, chunk.page_content,
+             {key: value for key, value in chunk.metadata.items() if key != self.text_key})
+            for vector_id, chunk in batch
+        ]
+        self._append(matrix, records)
+
+    def remove(self, vector_ids: Iterable[str]) -> None:
+        """Exclude vectors of the base snapshot (deleted or replaced chunks)."""
+        with self._lock:
+            self._removed.update(vector_ids)
+
+    def missing_ids(self, vector_ids: Iterable[str], base: Optional[VectorSnapshot] = None) -> List[str]:
+        """IDs that neither an added batch nor a carried-over row of base would provide."""
+        carried = set(base.index.ids) - self._removed if base is not None else set()
+        return [vector_id for vector_id in vector_ids if vector_id not in self._ids and vector_id not in carried]
+
+    def commit(self, base: Optional[VectorSnapshot] = None, keep: int = Config.SNAPSHOT_KEEP) -> str:
+        """
+        Finish the snapshot, publish it as CURRENT and prune old versions.
+
+        Args:
+            base: Previous snapshot whose surviving rows are carried over
+            keep: Number of snapshot versions to keep on disk
+
+        Returns:
+            Path of the published snapshot
+        """
+        if base is not None:
+            if base.dimension != self.dimension:
+                raise ValueError(f"Base snapshot has {base.dimension} dims, expected {self.dimension}")
+            index = base.index
+            rows = [
+                row for row, vector_id in enumerate(index.ids)
+                if vector_id not in self._ids and vector_id not in self._removed
+            ]
+            block = 4096
+            for start in range(0, len(rows), block):
+                block_rows = rows[start:start + block]
+                self._append(
+                    np.asarray(index.vectors[block_rows], dtype=np.float32),
+                    [(index.ids[row], index.texts[row], index.metadatas[row]) for row in block_rows]
+                )
+
+        self._chunks.write(self._compressor.flush())
+        for f in (self._vectors, self._chunks):
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+
+        with open(os.path.join(self.tmp_path, META_FILE), "w", encoding="utf-8") as f:
+            json.dump({
+                **self.info,
+                "format": SNAPSHOT_FORMAT,
+                "version": self.version,
+                "count": self.count,
+                "dimension": self.dimension,
+                "chunks_file": CHUNKS_FILE,
+                "created_at": time.time(),
+            }, f, indent=1)
+
+        path = os.path.join(self.root, self.version)
+        os.rename(self.tmp_path, path)
+        publish_snapshot(self.root, self.version)
+        self._prune(keep)
+        return path
+
+    def abort(self) -> None:
+        """Discard the unfinished snapshot."""
+        for f in (self._vectors, self._chunks):
+            if not f.closed:
+                f.close()
+        shutil.rmtree(self.tmp_path, ignore_errors=True)
+
+    def _append(self, matrix: np.ndarray, records: List[Tuple[str, str, Dict[str, Any]]]) -> None:
+        lines = b"".join(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8") + b"\n"
+            for record in records
+        )
+        with self._lock:
+            self._vectors.write(np.ascontiguousarray(matrix, dtype=np.float32).tobytes())
+            self._chunks.write(self._compressor.compress(lines))
+            self._ids.update(record[0] for record in records)
+            self.count += len(records)
+
+    def _prune(self, keep: int) -> None:
+        current = read_current_version(self.root)
+        versions = [version for version in list_snapshots(self.root) if version != current]
+        # Workers still mapping a pruned version keep their pages until they swap
+        for version in versions[:max(0, len(versions) - (keep - 1))]:
+            shutil.rmtree(os.path.join(self.root, version), ignore_errors=True)
+
+
+class SnapshotManager:
+    """Serve the published snapshot, swapping to a new version when CURRENT changes."""
+
+    def __init__(
+        self,
+        root: str = Config.SNAPSHOT_DIR,
+        reload_interval: float = Config.SNAPSHOT_RELOAD_INTERVAL,
+        dimension: Optional[int] = None,
+    ):
+        """
+        Args:
+            root: Directory holding the snapshot versions and CURRENT
+            reload_interval: Seconds between checks of CURRENT (0 checks on every request)
+            dimension: Expected vector dimension; snapshots with another one are rejected
+        """
+        self.root = root
+        self.reload_interval = reload_interval
+        self.dimension = dimension
+        self._snapshot: Optional[VectorSnapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        if not self.reload(force=True):
+            raise FileNotFoundError(f"No vector snapshot published in {root}; run setup_index.py --snapshot")
+
+    def current(self) -> VectorSnapshot:
+        """The live snapshot (checking for a newer version at most once per interval)."""
+        if time.monotonic() - self._checked_at >= self.reload_interval:
+            self.reload()
+        return self._snapshot
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Load the version named by CURRENT if it differs from the live one.
+
+        A version that fails to load is logged and skipped; the live snapshot
+        keeps serving. Returns whether a snapshot is available.
+        """
+        if not self._lock.acquire(blocking=force or self._snapshot is None):
+            return True  # Another thread is already checking
+        try:
+            self._checked_at = time.monotonic()
+            version = read_current_version(self.root)
+            if version is None or (self._snapshot is not None and version == self._snapshot.version):
+                return self._snapshot is not None
+            try:
+                snapshot = VectorSnapshot(os.path.join(self.root, version))
+                if self.dimension and snapshot.dimension != self.dimension:
+                    raise ValueError(f"snapshot has {snapshot.dimension} dims, expected {self.dimension}")
+            except Exception as e:
+                logger.warning(f"⚠️  Could not load snapshot {version}: {e}")
+                return self._snapshot is not None
+
+            # A single reference assignment: requests see the old or the new snapshot, never a mix
+            self._snapshot = snapshot
+            logger.info(f"🔁 Serving vector snapshot {version} ({len(snapshot)} vectors)")
+            return True
+        finally:
+            self._lock.release()
+
+
+class SnapshotRetriever(FilteredVectorRetriever):
+    """LangChain retriever over the live snapshot of a SnapshotManager."""
+
+    manager: Any
+
+    def search(
+        self, query_vector: List[float], k: int, filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Document, float]]:
+        return self.manager.current().search(query_vector, k=k, filter=filter)
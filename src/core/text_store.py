@@ -0,0 +1,99 @@
+"""
+Local side store for chunk text and local-only metadata, keyed by vector ID.
+
+With TEXT_SIDE_STORE enabled the vector index only holds the lean metadata
+of the schema; the text and full metadata live in a SQLite file next to the
+ingestion manifest and are looked up for the handful of IDs a query returns.
+Like the manifest, each namespace has its own file
+(Config.namespace_path(TEXT_STORE_PATH, namespace)), so deleting one
+namespace's stale IDs never touches rows another namespace still serves.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from langchain.schema.document import Document
+
+from config.settings import Config
+from src.core.retrieval import FilteredVectorRetriever
+
+
+class TextStore:
+    """SQLite table of (vector_id, text, metadata JSON)."""
+
+    def __init__(self, path: str = Config.TEXT_STORE_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS chunks (id TEXT PRIMARY KEY, text TEXT NOT NULL, metadata TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    def put_many(self, records: Iterable[Tuple[str, str, Dict[str, Any]]]) -> None:
+        """Insert or replace (vector_id, text, metadata) records in one transaction."""
+        rows = [
+            (vector_id, text, json.dumps(metadata, ensure_ascii=False, separators=(",", ":"), default=str))
+            for vector_id, text, metadata in records
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO chunks VALUES (?, ?, ?)", rows)
+
+    def get_many(self, vector_ids: Sequence[str]) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """Look up texts and metadata; missing IDs are absent from the result."""
+        if not vector_ids:
+            return {}
+        placeholders = ",".join("?" * len(vector_ids))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, text, metadata FROM chunks WHERE id IN ({placeholders})", list(vector_ids)
+            ).fetchall()
+        return {vector_id: (text, json.loads(metadata)) for vector_id, text, metadata in rows}
+
+    def delete_many(self, vector_ids: Iterable[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM chunks WHERE id = ?", [(vector_id,) for vector_id in vector_ids])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SideStoreRetriever(FilteredVectorRetriever):
+    """Query the vector index for IDs and lean metadata, then read texts from the side store."""
+
+    index: Any
+    text_store: Any
+    namespace: Optional[str] = None
+
+    def search(
+        self, query_vector: List[float], k: int, filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Document, float]]:
+        kwargs: Dict[str, Any] = {"namespace": self.namespace} if self.namespace else {}
+        if filter:
+            kwargs["filter"] = filter
+        response = self.index.query(vector=query_vector, top_k=k, include_metadata=True, **kwargs)
+        matches = response["matches"]
+        stored = self.text_store.get_many([match["id"] for match in matches])
+
+        documents = []
+        for match in matches:
+            if match["id"] not in stored:
+                continue  # Upserted by a run without the side store
+            text, metadata = stored[match["id"]]
+            documents.append((
+                Document(id=match["id"], page_content=text, metadata={**metadata, **(match.get("metadata") or {})}),
+                match.get("score")
+            ))
+        return documents
@@ -0,0 +1,302 @@
+"""
+Pipelined embedding and upsert of document chunks.
+
+Batches are embedded concurrently (up to a concurrency limit that shrinks when
+the API answers 429 and slowly grows back), while a dedicated upsert worker
+writes finished batches through one shared index handle. Embedding batch N+1
+therefore overlaps with upserting batch N, and indexing speed is bounded by
+API quota rather than round-trip latency.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from langchain.schema.document import Document
+
+from config.settings import Config
+from src.core.metadata_schema import MetadataSchema
+from src.core.text_store import TextStore
+from src.utils.telemetry import RateLimitedLog, logger, telemetry
+
+RATE_LIMIT_MARKERS = ("429", "rate limit", "ratelimit", "too many requests", "resource_exhausted")
+TRANSIENT_MARKERS = ("503", "unavailable", "timed out", "timeout", "connection reset")
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether an exception from OpenAI or Pinecone signals HTTP 429 / quota exhaustion."""
+    for attr in ("status_code", "status", "code"):
+        if getattr(error, attr, None) == 429:
+            return True
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in RATE_LIMIT_MARKERS)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Whether an exception looks like a temporary network or server failure."""
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in TRANSIENT_MARKERS)
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read a Retry-After header from the error's HTTP response, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+@dataclass
+class UploadStats:
+    """Counters collected while uploading."""
+    chunks: int = 0
+    batches: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    embed_seconds: float = 0.0
+    upsert_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    min_concurrency: int = 0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunks / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that halves on rate limiting and creeps back up on success."""
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max(1, max_limit)
+        self.limit = self.max_limit
+        self.min_seen = self.max_limit
+        self._active = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+
+    def release(self) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def on_rate_limited(self) -> None:
+        with self._cond:
+            self.limit = max(1, self.limit // 2)
+            self.min_seen = min(self.min_seen, self.limit)
+            self._successes = 0
+
+    def on_success(self) -> None:
+        with self._cond:
+            self._successes += 1
+            if self.limit < self.max_limit and self._successes >= 2 * self.limit:
+                self.limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+
+class PipelinedUploader:
+    """Embed and upsert (vector_id, chunk) pairs with overlapping, rate-limit-aware stages."""
+
+    def __init__(
+        self,
+        embeddings,
+        index,
+        batch_size: int = Config.UPSERT_BATCH_SIZE,
+        max_concurrency: int = Config.EMBED_MAX_CONCURRENCY,
+        max_pending_upserts: int = 2,
+        max_retries: int = 6,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        text_key: str = "text",
+        namespace: Optional[str] = None,
+        log: Optional[Callable[[str], None]] = None,
+        schema: Optional[MetadataSchema] = None,
+        text_store: Optional[TextStore] = None,
+    ):
+        """
+        Args:
+            embeddings: LangChain embeddings used for embed_documents
+            index: Pinecone index handle (one gRPC handle, shared by all batches)
+            batch_size: Chunks per embedding request and upsert call
+            max_concurrency: Maximum embedding requests in flight
+            max_pending_upserts: Embedded batches allowed to wait for the upsert worker
+            max_retries: Retries per request on 429/transient errors
+            base_delay: First backoff step in seconds (full jitter, doubled per attempt)
+            max_delay: Cap on a single backoff in seconds
+            text_key: Metadata key holding the chunk text (LangChain's default is "text")
+            namespace: Pinecone namespace to upsert into
+            log: Progress callback (a rate-limited "ingest" logger by default)
+            schema: Metadata schema deciding which fields are upserted (Config.METADATA_SCHEMA by default)
+            text_store: Optional side store; when given, chunk text and full metadata
+                are written there instead of into the index
+        """
+        self.embeddings = embeddings
+        self.index = index
+        self.batch_size = batch_size
+        self.max_pending_upserts = max_pending_upserts
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.text_key = text_key
+        self.namespace = namespace
+        self.log = log or RateLimitedLog()
+        self.schema = schema or MetadataSchema.from_config()
+        self.text_store = text_store
+        self.limiter = AdaptiveLimiter(max_concurrency)
+        self._stats_lock = threading.Lock()
+
+    def upload(
+        self,
+        items: Iterable[Tuple[str, Document]],
+        on_batch: Optional[Callable[[List[Tuple[str, Document]], List[List[float]]], None]] = None,
+    ) -> UploadStats:
+        """
+        Embed and upsert every (vector_id, chunk) pair.
+
+        The input is consumed lazily: no more than the concurrency limit plus
+        max_pending_upserts batches are held in memory at once.
+
+        Args:
+            items: Iterable of (vector_id, chunk) pairs
+            on_batch: Optional callback receiving each upserted batch and its vectors
+        """
+        stats = UploadStats(min_concurrency=self.limiter.limit)
+        start_time = time.perf_counter()
+
+        embed_pool = ThreadPoolExecutor(max_workers=self.limiter.max_limit, thread_name_prefix="embed")
+        upsert_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="upsert")
+        pending_embeds: deque = deque()
+        pending_upserts: deque = deque()
+
+        def hand_over(block: bool) -> None:
+            # Pass embedded batches to the upsert worker in submission order
+            while pending_embeds and (block or pending_embeds[0][1].done()):
+                batch, embed_future = pending_embeds.popleft()
+                vectors = embed_future.result()
+                while len(pending_upserts) >= self.max_pending_upserts:
+                    pending_upserts.popleft().result()
+                pending_upserts.append(
+                    upsert_pool.submit(self._upsert, batch, vectors, stats, on_batch)
+                )
+
+        try:
+            batch: List[Tuple[str, Document]] = []
+            for item in items:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    self._submit_embed(embed_pool, pending_embeds, batch, stats)
+                    batch = []
+                    hand_over(block=False)
+            if batch:
+                self._submit_embed(embed_pool, pending_embeds, batch, stats)
+
+            hand_over(block=True)
+            while pending_upserts:
+                pending_upserts.popleft().result()
+        finally:
+            embed_pool.shutdown(wait=True, cancel_futures=True)
+            upsert_pool.shutdown(wait=True, cancel_futures=True)
+
+        stats.elapsed_seconds = time.perf_counter() - start_time
+        stats.min_concurrency = self.limiter.min_seen
+        return stats
+
+    def _submit_embed(
+        self, pool: ThreadPoolExecutor, pending: deque, batch: List[Tuple[str, Document]], stats: UploadStats
+    ) -> None:
+        # Blocks while the (possibly reduced) concurrency limit is reached
+        self.limiter.acquire()
+        pending.append((batch, pool.submit(self._embed, batch, stats)))
+
+    def _embed(self, batch: List[Tuple[str, Document]], stats: UploadStats) -> List[List[float]]:
+        try:
+            start = time.perf_counter()
+            vectors = self._with_retry(
+                self.embeddings.embed_documents, [chunk.page_content for _, chunk in batch], stats=stats
+            )
+            elapsed = time.perf_counter() - start
+            with self._stats_lock:
+                stats.embed_seconds += elapsed
+            telemetry.record("embed", elapsed)
+            telemetry.count("chunks.embedded", len(batch))
+            return vectors
+        finally:
+            self.limiter.release()
+
+    def _upsert(
+        self,
+        batch: List[Tuple[str, Document]],
+        vectors: List[List[float]],
+        stats: UploadStats,
+        on_batch: Optional[Callable] = None,
+    ) -> None:
+        records = [
+            self._to_record(vector_id, chunk, values)
+            for (vector_id, chunk), values in zip(batch, vectors)
+        ]
+        kwargs: Dict[str, Any] = {"namespace": self.namespace} if self.namespace else {}
+
+        start = time.perf_counter()
+        if self.text_store is not None:
+            # Written first, so a vector is never served without its text
+            self.text_store.put_many(
+                (vector_id, chunk.page_content, chunk.metadata) for vector_id, chunk in batch
+            )
+        self._with_retry(self.index.upsert, vectors=records, stats=stats, **kwargs)
+        if on_batch:
+            on_batch(batch, vectors)
+
+        elapsed = time.perf_counter() - start
+        telemetry.record("upsert", elapsed)
+        telemetry.count("vectors.upserted", len(batch))
+        with self._stats_lock:
+            stats.upsert_seconds += elapsed
+            stats.batches += 1
+            stats.chunks += len(batch)
+            batches, chunks = stats.batches, stats.chunks
+        self.log(f"   📦 Batch {batches} upserted ({chunks} chunks, concurrency {self.limiter.limit})")
+
+    def _to_record(self, vector_id: str, chunk: Document, values: List[float]) -> Tuple[str, List[float], Dict]:
+        metadata = self.schema.remote(chunk.metadata)
+        if self.text_store is None:
+            metadata[self.text_key] = chunk.page_content
+        return vector_id, values, metadata
+
+    def _with_retry(self, fn: Callable, *args, stats: UploadStats, **kwargs):
+        """Call fn, retrying 429s and transient failures with full-jitter exponential backoff."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = fn(*args, **kwargs)
+                self.limiter.on_success()
+                return result
+            except Exception as e:
+                rate_limited = is_rate_limit_error(e)
+                if attempt >= self.max_retries or not (rate_limited or is_transient_error(e)):
+                    raise
+
+                if rate_limited:
+                    self.limiter.on_rate_limited()
+                delay = _retry_after_seconds(e)
+                if delay is None:
+                    delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+                with self._stats_lock:
+                    stats.retries += 1
+                    stats.rate_limited += int(rate_limited)
+                telemetry.count("upload.rate_limited" if rate_limited else "upload.transient_errors")
+                logger.warning(f"   ⏳ {'Rate limited' if rate_limited else 'Transient error'}, "
+                               f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})")
+                time.sleep(delay)
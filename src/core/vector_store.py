@@ -1,16 +1,98 @@
+import os
+
 from langchain_pinecone import PineconeVectorStore
+from pinecone.grpc import PineconeGRPC as Pinecone
 from config.settings import Config
+from src.core.retrieval import ShardedRetriever, VectorStoreRetriever
+from src.core.snapshot import SnapshotManager, SnapshotRetriever
+from src.core.text_store import SideStoreRetriever, TextStore
+from src.utils.manifest import IngestionManifest
 
-def get_vector_store(embeddings):
-    """Initialize vector store from existing index."""
+def get_vector_store(embeddings, namespace=""):
+    """Initialize vector store from existing index (one namespace of it)."""
     return PineconeVectorStore.from_existing_index(
         index_name=Config.PINECONE_INDEX_NAME, 
-        embedding=embeddings
+        embedding=embeddings,
+        namespace=namespace or None
     )
 
-def get_retriever(vector_store, k=2):
-    """Create retriever to search documents by similarity."""
+def get_retriever(vector_store, k=2, classifier=None):
+    """
+    Create retriever to search documents by similarity.
+    
+    With an intent classifier, searches are pre-filtered on the metadata it
+    infers from the question, falling back to an unfiltered search.
+    """
+    if classifier is not None:
+        return VectorStoreRetriever(
+            vector_store=vector_store, embeddings=vector_store.embeddings, k=k, classifier=classifier
+        )
     return vector_store.as_retriever(
         search_type="similarity", 
         search_kwargs={"k": k}
-    )
\ No newline at end of file
+    )
+
+def get_snapshot_manager(namespace=""):
+    """Load the published local snapshot (memory-mapped, so safe to share with forked workers)."""
+    return SnapshotManager(
+        root=Config.namespace_path(Config.SNAPSHOT_DIR, namespace),
+        dimension=Config.get_index_profile()["dimension"]
+    )
+
+def get_snapshot_retriever(embeddings, k=2, classifier=None, manager=None):
+    """Create retriever over the published local snapshot, hot-swapping to newer versions."""
+    manager = manager or get_snapshot_manager()
+    return SnapshotRetriever(manager=manager, embeddings=embeddings, k=k, classifier=classifier)
+
+def get_side_store_retriever(embeddings, k=2, classifier=None, namespace=""):
+    """Create retriever over a lean-metadata index whose chunk texts live in the local side store."""
+    index = Pinecone(api_key=Config.PINECONE_API_KEY).Index(Config.PINECONE_INDEX_NAME)
+    return SideStoreRetriever(
+        index=index, embeddings=embeddings,
+        text_store=TextStore(Config.namespace_path(Config.TEXT_STORE_PATH, namespace)),
+        k=k, classifier=classifier, namespace=namespace or None
+    )
+
+def get_shard_files(namespaces):
+    """File names recorded in each namespace's ingestion manifest."""
+    return {
+        namespace: sorted(
+            os.path.basename(path)
+            for path in IngestionManifest.load(Config.namespace_path(Config.INDEX_MANIFEST_PATH, namespace)).files
+        )
+        for namespace in namespaces
+    }
+
+def get_sharded_retriever(embeddings, namespaces, k=2, classifier=None, snapshot_managers=None):
+    """
+    Create retriever fanning out to every namespace of the configured backend.
+    
+    Args:
+        namespaces: Index namespaces, one per source collection
+        snapshot_managers: Snapshot manager per namespace, to search local snapshots instead of Pinecone
+    """
+    if snapshot_managers:
+        shards = {
+            namespace: SnapshotRetriever(manager=snapshot_managers[namespace], embeddings=embeddings, k=k)
+            for namespace in namespaces
+        }
+    elif Config.TEXT_SIDE_STORE:
+        index = Pinecone(api_key=Config.PINECONE_API_KEY).Index(Config.PINECONE_INDEX_NAME)
+        shards = {
+            namespace: SideStoreRetriever(
+                index=index, embeddings=embeddings,
+                text_store=TextStore(Config.namespace_path(Config.TEXT_STORE_PATH, namespace)),
+                k=k, namespace=namespace or None
+            )
+            for namespace in namespaces
+        }
+    else:
+        shards = {
+            namespace: VectorStoreRetriever(
+                vector_store=get_vector_store(embeddings, namespace), embeddings=embeddings, k=k
+            )
+            for namespace in namespaces
+        }
+    return ShardedRetriever(
+        shards=shards, shard_files=get_shard_files(namespaces), embeddings=embeddings, k=k, classifier=classifier
+    )
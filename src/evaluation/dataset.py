@@ -0,0 +1,50 @@
+"""
+Labelled question sets for retrieval evaluation.
+
+One JSON object per line:
+    {"question": "...", "relevant_ids": ["<vector id>", ...], "relevant_text": ["<snippet>", ...]}
+
+A retrieved chunk counts as relevant when its vector ID is listed in
+relevant_ids or its text contains any relevant_text snippet (case-insensitive).
+Snippets survive re-chunking, so they are the better choice when comparing
+chunking configurations; IDs are exact for a fixed corpus.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class LabelledQuestion:
+    """A question and the chunks that answer it."""
+    question: str
+    relevant_ids: List[str] = field(default_factory=list)
+    relevant_text: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        self._snippets = [snippet.lower() for snippet in self.relevant_text]
+
+    def is_relevant(self, vector_id: str, text: str = "") -> bool:
+        if vector_id in self.relevant_ids:
+            return True
+        text = text.lower()
+        return any(snippet in text for snippet in self._snippets)
+
+
+def load_questions(path: str) -> List[LabelledQuestion]:
+    """Load a JSONL labelled question set."""
+    questions = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if "question" not in item:
+                raise ValueError(f"{path}:{line_num}: missing 'question'")
+            questions.append(LabelledQuestion(
+                question=item["question"],
+                relevant_ids=item.get("relevant_ids", []),
+                relevant_text=item.get("relevant_text", []),
+            ))
+    return questions
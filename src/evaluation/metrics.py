@@ -0,0 +1,33 @@
+"""Ranking metrics for retrieval evaluation."""
+
+from statistics import mean
+from typing import Dict, List, Sequence
+
+
+def recall_at_k(relevance: Sequence[bool], k: int) -> float:
+    """1.0 if any of the first k results is relevant (hit rate), else 0.0."""
+    return 1.0 if any(relevance[:k]) else 0.0
+
+
+def reciprocal_rank(relevance: Sequence[bool]) -> float:
+    """1 / rank of the first relevant result, or 0.0 if none is relevant."""
+    for rank, relevant in enumerate(relevance, 1):
+        if relevant:
+            return 1.0 / rank
+    return 0.0
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of a sequence (0.0 for an empty one)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize_rankings(rankings: List[Sequence[bool]], ks: Sequence[int]) -> Dict[str, float]:
+    """Average recall@k for each k and MRR over per-question relevance lists."""
+    summary = {f"recall@{k}": mean(recall_at_k(r, k) for r in rankings) if rankings else 0.0 for k in ks}
+    summary["mrr"] = mean(reciprocal_rank(r) for r in rankings) if rankings else 0.0
+    return summary
@@ -1,8 +1,11 @@
+import re
+import time
+
 from langchain_openai import ChatOpenAI
-from langchain.chains.retrieval import create_retrieval_chain
 from langchain.chains.combine_documents import create_stuff_documents_chain
 from langchain_core.prompts import ChatPromptTemplate
 from src.prompts.templates import IT_SUPPORT_SYSTEM_PROMPT
+from src.utils.answer_blocks import parse_answer_blocks
 
 class ChatService:
     def __init__(self, retriever):
@@ -16,51 +19,104 @@ class ChatService:
             ("system", IT_SUPPORT_SYSTEM_PROMPT),
             ("human", "{input}"),
         ])
-        self.chain = self._create_chain()
-    
+        self.document_chain = self._create_chain()
+
     def _create_chain(self):
-        """Create RAG chain for document retrieval and answering."""
-        document_chain = create_stuff_documents_chain(self.llm, self.prompt)
-        return create_retrieval_chain(self.retriever, document_chain)
-    
-    def get_response(self, user_message):
-        """Get chat response for user message."""
-        if not user_message:
-            return "No message provided", 400
-        
-        chain_response = self.chain.invoke({"input": user_message})
-        full_answer = chain_response["answer"]
-        
+        """Create the chain answering from retrieved documents (retrieval runs separately, so it can be timed)."""
+        return create_stuff_documents_chain(self.llm, self.prompt)
+
+    def _answer(self, user_message):
+        """Retrieve context and generate an answer; returns (answer, documents, timings in ms)."""
+        start = time.perf_counter()
+        documents = self.retriever.invoke(user_message)
+        retrieved = time.perf_counter()
+        full_answer = self.document_chain.invoke({"input": user_message, "context": documents})
+        generated = time.perf_counter()
+
         # Clean up the response
-        final_answer = (
+        answer = (
             full_answer.split("System:", 1)[-1]
             if "System:" in full_answer
             else full_answer
         )
-        
+        timing = {
+            "retrieval_ms": round((retrieved - start) * 1000, 1),
+            "generation_ms": round((generated - retrieved) * 1000, 1),
+        }
+        return answer.strip(), documents, timing
+
+    def get_response(self, user_message):
+        """Get chat response for user message."""
+        if not user_message:
+            return "No message provided", 400
+
+        answer, _, _ = self._answer(user_message)
+
         # Additional cleanup to remove HTML artifacts
-        final_answer = self._clean_response_text(final_answer.strip())
-        
-        return final_answer
-    
-    def _clean_response_text(self, text):
-        """Clean response text from HTML artifacts and ensure proper formatting."""
-        import re
-        
+        return self._clean_response_text(answer)
+
+    def get_structured_response(self, user_message):
+        """
+        Get chat response as typed blocks (see src/utils/answer_blocks.py).
+
+        Returns:
+            Dict with the answer text (line breaks kept), its blocks, the
+            source chunks it was generated from and timings in ms
+        """
+        if not user_message:
+            return {"error": "No message provided"}, 400
+
+        start = time.perf_counter()
+        answer, documents, timing = self._answer(user_message)
+        answer = self._clean_response_text(answer, collapse_whitespace=False)
+        blocks = parse_answer_blocks(answer)
+        timing["total_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+        return {
+            "answer": answer,
+            "blocks": blocks,
+            "sources": [
+                {
+                    "id": document.id,
+                    "file_name": document.metadata.get("file_name"),
+                    "page": document.metadata.get("page"),
+                }
+                for document in documents
+            ],
+            "timing": timing,
+        }
+
+    def _clean_response_text(self, text, collapse_whitespace=True):
+        """
+        Clean response text from HTML artifacts and ensure proper formatting.
+
+        Args:
+            text: Model answer
+            collapse_whitespace: Join everything into one line; otherwise line
+                breaks (the answer's Markdown structure) are kept and the
+                HTML fragment heuristics are skipped, as they would eat plain
+                ">" in the Markdown (e.g. "Control Panel > Network")
+        """
         # Remove HTML attributes that might leak into text
         text = re.sub(r'target="_blank"[^>]*>', '', text, flags=re.IGNORECASE)
         text = re.sub(r'rel="[^"]*"[^>]*>', '', text, flags=re.IGNORECASE)
         text = re.sub(r'rel="noopener noreferrer"', '', text, flags=re.IGNORECASE)
-        
-        # Clean up orphaned HTML fragments
-        text = re.sub(r'>\s*([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', r' \1', text)
-        text = re.sub(r'([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\s*<', r'\1 ', text)
-        
-        # Remove broken HTML tags
-        text = re.sub(r'<[^>]*$', '', text)  # Remove incomplete tags at end
-        text = re.sub(r'^[^<]*>', '', text)  # Remove incomplete tags at start
-        
+
+        if collapse_whitespace:
+            # Clean up orphaned HTML fragments
+            text = re.sub(r'>\s*([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', r' \1', text)
+            text = re.sub(r'([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\s*<', r'\1 ', text)
+
+            # Remove broken HTML tags
+            text = re.sub(r'<[^>]*$', '', text)  # Remove incomplete tags at end
+            text = re.sub(r'^[^<]*>', '', text)  # Remove incomplete tags at start
+
         # Clean up extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
\ No newline at end of file
+        if collapse_whitespace:
+            text = re.sub(r'\s+', ' ', text)
+        else:
+            text = re.sub(r'(?<=\S)[ \t]+', ' ', text)  # Keep indentation (nested list items)
+            text = re.sub(r'[ \t]+$', '', text, flags=re.MULTILINE)
+            text = re.sub(r'\n{3,}', '\n\n', text)
+
+        return text.strip()
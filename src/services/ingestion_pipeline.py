@@ -0,0 +1,328 @@
+"""
+Streaming ingestion pipeline with bounded memory.
+
+PDF files flow through generators (files -> documents -> chunks -> embedding
+batches -> upserts) instead of being materialized as whole-corpus lists.
+Chunking runs in its own thread feeding a bounded queue, and the
+PipelinedUploader embeds and upserts with a bounded number of batches in
+flight, so a slow downstream stage blocks the upstream ones (backpressure)
+and memory stays flat regardless of corpus size.
+"""
+
+import queue
+import resource
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from langchain.schema.document import Document
+
+from config.settings import Config
+from src.core.snapshot import SnapshotWriter
+from src.core.text_store import TextStore
+from src.core.uploader import PipelinedUploader
+from src.utils.chunking import iter_enhanced_chunks
+from src.utils.dedup import DedupStats, iter_deduplicated
+from src.utils.extraction_cache import ExtractionCache
+from src.utils.file_utils import EnhancedPDFProcessor, iter_pdf_documents, split_documents
+from src.utils.manifest import FileDiff, IngestionManifest, iter_vector_ids
+from src.utils.telemetry import RateLimitedLog
+
+_DONE = object()
+
+
+def get_rss_mb() -> float:
+    """Current resident set size of this process in MB."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * resource.getpagesize() / (1024 * 1024)
+    except (OSError, IndexError, ValueError):
+        return get_peak_rss_mb()
+
+
+def get_peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def batched(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Group an iterable into lists of at most batch_size items."""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+@dataclass
+class PipelineStats:
+    """Counters and memory readings collected during a streaming run."""
+    files_processed: int = 0
+    documents: int = 0
+    chunks: int = 0
+    chunks_unchanged: int = 0
+    duplicates_removed: int = 0
+    batches: int = 0
+    retries: int = 0
+    vectors_upserted: int = 0
+    vectors_deleted: int = 0
+    start_rss_mb: float = 0.0
+    peak_rss_mb: float = 0.0
+    elapsed_seconds: float = 0.0
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+
+    def sample_memory(self) -> None:
+        self.peak_rss_mb = max(self.peak_rss_mb, get_rss_mb())
+
+    def add_stage_time(self, stage: str, seconds: float) -> None:
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+
+class StreamingIngestionPipeline:
+    """Stream PDFs into a Pinecone index without materializing the corpus."""
+
+    def __init__(
+        self,
+        embeddings,
+        index,
+        manifest: Optional[IngestionManifest] = None,
+        batch_size: int = Config.UPSERT_BATCH_SIZE,
+        max_pending_batches: int = 2,
+        use_enhanced_processing: bool = True,
+        use_semantic_chunking: bool = True,
+        text_key: str = "text",
+        extraction_cache: Optional[ExtractionCache] = None,
+        deduplicate: bool = Config.DEDUP_ENABLED,
+        snapshot_writer: Optional[SnapshotWriter] = None,
+        text_store: Optional[TextStore] = None,
+        reupsert: bool = False,
+        namespace: str = "",
+    ):
+        """
+        Args:
+            embeddings: LangChain embeddings used for embed_documents
+            index: Pinecone index handle used for upsert/delete (shared by all batches)
+            manifest: Ingestion manifest for stable IDs and skipping unchanged chunks
+            batch_size: Chunks per embedding/upsert batch
+            max_pending_batches: Queue depth between chunking and uploading (bounds memory)
+            use_enhanced_processing: Whether to use enhanced PDF extraction
+            use_semantic_chunking: Whether to use semantic-aware chunking
+            text_key: Metadata key holding the chunk text (LangChain's default is "text")
+            extraction_cache: Optional cache of extraction results for unchanged PDFs
+            deduplicate: Whether to merge near-duplicate chunks of each file before embedding
+            snapshot_writer: Optional writer receiving every upserted batch and deletion;
+                the caller commits it after a successful run
+            text_store: Optional side store for chunk text and full metadata
+            reupsert: Upsert every chunk, even those the manifest already lists
+                (after a metadata schema change)
+            namespace: Index namespace (shard) to upsert into and delete from
+        """
+        progress = RateLimitedLog()
+        self.uploader = PipelinedUploader(
+            embeddings, index, batch_size=batch_size, text_key=text_key,
+            log=lambda message: progress(f"{message} [RSS {get_rss_mb():.0f} MB]"),
+            text_store=text_store, namespace=namespace or None
+        )
+        self.index = index
+        self.namespace = namespace
+        self.manifest = manifest
+        self.batch_size = batch_size
+        self.max_pending_batches = max_pending_batches
+        self.use_enhanced_processing = use_enhanced_processing
+        self.use_semantic_chunking = use_semantic_chunking
+        self.extraction_cache = extraction_cache
+        self.deduplicate = deduplicate
+        self.snapshot_writer = snapshot_writer
+        self.text_store = text_store
+        self.reupsert = reupsert
+        self.dedup_stats = DedupStats()
+        self.processor = EnhancedPDFProcessor()
+        self.stats = PipelineStats()
+
+        self._stop = threading.Event()
+        self._errors: List[BaseException] = []
+        self._ids_by_file: Dict[str, List[str]] = {}
+        self._extracted: Set[str] = set()
+
+    def run(self, file_diff: FileDiff) -> PipelineStats:
+        """
+        Process the new/changed files of a diff and apply deletions.
+
+        Upserts happen before deletions, so the index never lacks content that
+        exists on disk. The manifest is updated in memory; the caller saves it.
+        """
+        self.stats = PipelineStats(
+            files_processed=len(file_diff.to_process), start_rss_mb=get_rss_mb()
+        )
+        self.dedup_stats = DedupStats()
+        self.stats.sample_memory()
+        start_time = time.perf_counter()
+
+        chunk_queue: "queue.Queue" = queue.Queue(maxsize=self.max_pending_batches)
+        chunker = threading.Thread(
+            target=self._run_stage, args=(self._produce_batches, file_diff.to_process, chunk_queue),
+            name="ingest-chunker", daemon=True
+        )
+        chunker.start()
+
+        try:
+            upload_stats = self.uploader.upload(
+                (item for batch in self._drain(chunk_queue) for item in batch),
+                on_batch=self._on_batch_upserted
+            )
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            chunker.join()
+
+        if self._errors:
+            raise self._errors[0]
+
+        self.stats.add_stage_time("embed", upload_stats.embed_seconds)
+        self.stats.add_stage_time("upsert", upload_stats.upsert_seconds)
+        self.stats.retries = upload_stats.retries
+        self.stats.duplicates_removed = self.dedup_stats.removed
+        self._apply_deletions(file_diff)
+        self.stats.elapsed_seconds = time.perf_counter() - start_time
+        self.stats.sample_memory()
+        self.stats.peak_rss_mb = max(self.stats.peak_rss_mb, get_peak_rss_mb())
+        return self.stats
+
+    # Stages -----------------------------------------------------------------
+
+    def _produce_batches(self, pdf_files: List[str], out_queue: "queue.Queue") -> None:
+        """Stage 1 (own thread): files -> documents -> chunks -> batches of (id, chunk)."""
+        for batch in batched(self._iter_new_chunks(pdf_files), self.batch_size):
+            self.stats.sample_memory()
+            if not self._put(out_queue, batch):
+                return
+
+    def _on_batch_upserted(self, batch: List[Tuple[str, Document]], vectors: List[List[float]]) -> None:
+        """Stages 2-3 run in the uploader (concurrent embedding, pipelined upserts)."""
+        self.stats.batches += 1
+        self.stats.vectors_upserted += len(batch)
+        if self.snapshot_writer is not None:
+            self.snapshot_writer.add(batch, vectors)
+        self.stats.sample_memory()
+
+    # Generators -------------------------------------------------------------
+
+    def _iter_documents(self, pdf_files: List[str]) -> Iterator[Document]:
+        for document in iter_pdf_documents(
+            pdf_files, use_enhanced_processing=self.use_enhanced_processing,
+            processor=self.processor, cache=self.extraction_cache
+        ):
+            self.stats.documents += 1
+            self._extracted.add(document.metadata.get("source", "unknown"))
+            yield document
+
+    def _iter_chunks(self, pdf_files: List[str]) -> Iterator[Document]:
+        documents = self._iter_documents(pdf_files)
+        if self.use_semantic_chunking:
+            chunks = iter_enhanced_chunks(documents, enhance_metadata=True, preserve_structure=True)
+        else:
+            chunks = (chunk for document in documents for chunk in split_documents([document]))
+        if self.deduplicate:
+            # Buffers one file's chunks at a time
+            chunks = iter_deduplicated(chunks, stats=self.dedup_stats)
+        yield from chunks
+
+    def _iter_new_chunks(self, pdf_files: List[str]) -> Iterator[Tuple[str, Document]]:
+        """Yield (vector_id, chunk) for chunks not yet in the index, tracking IDs per file."""
+        self._ids_by_file = {}
+        self._extracted = set()
+        known_ids: Dict[str, Set[str]] = {}
+
+        start = time.perf_counter()
+        for vector_id, chunk in iter_vector_ids(self._iter_chunks(pdf_files)):
+            source = chunk.metadata.get("source", "unknown")
+            if source not in known_ids:
+                # Files arrive one after another; only keep the current file's IDs
+                known_ids = {
+                    source: self.manifest.chunk_ids_for(source) if self.manifest and not self.reupsert else set()
+                }
+            self._ids_by_file.setdefault(source, []).append(vector_id)
+            self.stats.chunks += 1
+
+            if vector_id in known_ids[source]:
+                self.stats.chunks_unchanged += 1
+                continue
+
+            self.stats.add_stage_time("extract_and_chunk", time.perf_counter() - start)
+            yield vector_id, chunk
+            start = time.perf_counter()
+        self.stats.add_stage_time("extract_and_chunk", time.perf_counter() - start)
+
+    # Manifest and deletions -------------------------------------------------
+
+    def _apply_deletions(self, file_diff: FileDiff) -> None:
+        stale_ids: List[str] = []
+        for path in file_diff.to_process:
+            if path not in self._extracted:
+                # Extraction failed or yielded nothing: keep its vectors, retry next run
+                continue
+            chunk_ids = self._ids_by_file.get(path, [])
+            if self.manifest:
+                stale_ids.extend(sorted(self.manifest.chunk_ids_for(path) - set(chunk_ids)))
+                self.manifest.record_file(path, file_diff.file_hashes.get(path, ""), chunk_ids)
+        for path in file_diff.deleted:
+            if self.manifest:
+                stale_ids.extend(self.manifest.chunk_ids_for(path))
+                self.manifest.remove_file(path)
+
+        if self.snapshot_writer is not None:
+            self.snapshot_writer.remove(stale_ids)
+        if self.text_store is not None:
+            self.text_store.delete_many(stale_ids)
+
+        delete_batch_size = 1000  # Pinecone limit per delete request
+        for batch in batched(stale_ids, delete_batch_size):
+            self.index.delete(ids=batch, **({"namespace": self.namespace} if self.namespace else {}))
+            self.stats.vectors_deleted += len(batch)
+
+    # Thread plumbing --------------------------------------------------------
+
+    def _run_stage(self, stage, *args) -> None:
+        out_queue = args[-1]
+        try:
+            stage(*args)
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            self._put(out_queue, _DONE, force=True)
+
+    def _fail(self, error: BaseException) -> None:
+        self._errors.append(error)
+        self._stop.set()
+
+    def _put(self, out_queue: "queue.Queue", item: Any, force: bool = False) -> bool:
+        """Put with backpressure; gives up when another stage has failed."""
+        while True:
+            if self._stop.is_set() and not force:
+                return False
+            try:
+                out_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                if self._stop.is_set():
+                    return False
+
+    def _drain(self, in_queue: "queue.Queue") -> Iterator[Any]:
+        while True:
+            try:
+                item = in_queue.get(timeout=0.1)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+            if item is _DONE or self._stop.is_set():
+                return
+            yield item
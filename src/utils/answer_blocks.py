@@ -0,0 +1,161 @@
+"""
+Parse a chat answer into typed blocks for the structured /get response.
+
+The model answers in light Markdown (see IT_SUPPORT_SYSTEM_PROMPT):
+numbered steps, "-" bullets, **bold**, `code`, [links](url) and bare URLs.
+parse_answer_blocks turns that into a list of blocks the frontend renders
+directly:
+
+    {"type": "paragraph", "spans": [...]}
+    {"type": "heading", "level": 3, "spans": [...]}
+    {"type": "steps", "start": 1, "items": [{"spans": [...], "lists": [...]}]}
+    {"type": "bullets", "items": [{"spans": [...]}]}
+    {"type": "code", "text": "..."}
+
+where spans are {"type": "text" | "bold" | "code", "text": ...} or
+{"type": "link", "text": ..., "url": ...}. Only http(s) URLs become links.
+Indented steps or bullets under an item are kept in that item's "lists",
+as steps/bullets blocks of their own (a new one whenever the kind changes).
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+HEADING_PATTERN = re.compile(r"^(#{1,4})\s+(.*)$")
+STEP_PATTERN = re.compile(r"^(\d+)[.)]\s+(.*)$")
+BULLET_PATTERN = re.compile(r"^[-*+•]\s+(.*)$")
+RULE_PATTERN = re.compile(r"^(-{3,}|\*{3,}|_{3,})$")
+FENCE = "```"
+
+# Markdown link, bare URL, **bold**, `code` - in order of precedence
+INLINE_PATTERN = re.compile(
+    r"\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)\s]+)\)"
+    r"|(?P<url>https?://[^\s<>\"{}|\\^`\[\]]+)"
+    r"|\*\*(?P<bold>.+?)\*\*|__(?P<bold_alt>.+?)__"
+    r"|`(?P<code>[^`]+)`"
+)
+TRAILING_PUNCTUATION = ".,;:!?)"
+
+
+def parse_inline(text: str) -> List[Dict[str, str]]:
+    """Split one line of Markdown into text, bold, code and link spans."""
+    spans: List[Dict[str, str]] = []
+
+    def add_text(value: str) -> None:
+        if not value:
+            return
+        if spans and spans[-1]["type"] == "text":
+            spans[-1]["text"] += value
+        else:
+            spans.append({"type": "text", "text": value})
+
+    position = 0
+    for match in INLINE_PATTERN.finditer(text):
+        add_text(text[position:match.start()])
+        position = match.end()
+        if match.group("link_text") is not None:
+            url = match.group("link_url")
+            if url.startswith(("http://", "https://")):
+                spans.append({"type": "link", "text": match.group("link_text"), "url": url})
+            else:
+                add_text(match.group("link_text"))
+        elif match.group("url") is not None:
+            url = match.group("url")
+            trailing = len(url) - len(url.rstrip(TRAILING_PUNCTUATION))
+            if trailing:
+                url, position = url[:-trailing], position - trailing
+            spans.append({"type": "link", "text": url, "url": url})
+        elif match.group("code") is not None:
+            spans.append({"type": "code", "text": match.group("code")})
+        else:
+            spans.append({"type": "bold", "text": match.group("bold") or match.group("bold_alt")})
+    add_text(text[position:])
+    return spans
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip(" \t"))
+
+
+def parse_answer_blocks(text: str) -> List[Dict[str, Any]]:
+    """Parse a Markdown answer into typed blocks (see module docstring)."""
+    blocks: List[Dict[str, Any]] = []
+    paragraph: List[str] = []
+    current_list: Optional[Dict[str, Any]] = None
+    lines = text.replace("\r\n", "\n").split("\n")
+
+    def flush_paragraph() -> None:
+        if paragraph:
+            blocks.append({"type": "paragraph", "spans": parse_inline(" ".join(paragraph))})
+            paragraph.clear()
+
+    i = 0
+    while i < len(lines):
+        line = lines[i].rstrip()
+        stripped = line.strip()
+        i += 1
+
+        if stripped.startswith(FENCE):
+            flush_paragraph()
+            current_list = None
+            code_lines = []
+            while i < len(lines) and not lines[i].strip().startswith(FENCE):
+                code_lines.append(lines[i].rstrip())
+                i += 1
+            i += 1  # Closing fence
+            blocks.append({"type": "code", "text": "\n".join(code_lines)})
+            continue
+
+        if not stripped:
+            # A blank line ends a paragraph; a list continues if the next item follows
+            flush_paragraph()
+            continue
+        if RULE_PATTERN.match(stripped):
+            flush_paragraph()
+            current_list = None
+            continue
+
+        heading = HEADING_PATTERN.match(stripped)
+        step = STEP_PATTERN.match(stripped)
+        bullet = BULLET_PATTERN.match(stripped)
+        nested = current_list is not None and current_list["items"] and _indent(line) > 0
+
+        if (step or bullet) and nested and not (step and current_list["type"] == "steps" and _indent(line) < 2):
+            # Indented item under the previous step or bullet
+            content = (step or bullet).group(2 if step else 1)
+            nested_type = "steps" if step else "bullets"
+            nested_lists = current_list["items"][-1].setdefault("lists", [])
+            if not nested_lists or nested_lists[-1]["type"] != nested_type:
+                nested_lists.append({"type": nested_type, "items": []})
+                if step:
+                    nested_lists[-1]["start"] = int(step.group(1))
+            nested_lists[-1]["items"].append({"spans": parse_inline(content)})
+            continue
+
+        if heading:
+            flush_paragraph()
+            current_list = None
+            blocks.append({"type": "heading", "level": len(heading.group(1)), "spans": parse_inline(heading.group(2))})
+        elif step or bullet:
+            flush_paragraph()
+            list_type = "steps" if step else "bullets"
+            if current_list is None or current_list["type"] != list_type:
+                current_list = {"type": list_type, "items": []}
+                if step:
+                    current_list["start"] = int(step.group(1))
+                blocks.append(current_list)
+            current_list["items"].append({"spans": parse_inline(step.group(2) if step else bullet.group(1))})
+        elif current_list is not None and current_list["items"] and _indent(line) > 0 and not paragraph:
+            # Wrapped continuation of the previous item
+            spans = current_list["items"][-1]["spans"]
+            continuation = parse_inline(" " + stripped)
+            if spans and spans[-1]["type"] == "text" and continuation[0]["type"] == "text":
+                spans[-1] = {"type": "text", "text": spans[-1]["text"] + continuation.pop(0)["text"]}
+            spans.extend(continuation)
+        else:
+            current_list = None
+            paragraph.append(stripped)
+
+    flush_paragraph()
+    return blocks
+
@@ -5,14 +5,23 @@ This module provides intelligent document splitting that preserves semantic stru
 tables, headers, and other document elements for improved search quality.
 """
 
+import logging
+import os
 import re
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum
 
 from langchain.schema.document import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+from src.utils.telemetry import RateLimitedLog, logger, telemetry
+from src.utils.tokens import CHARS_PER_TOKEN, count_tokens
+
+# Bump whenever chunk boundaries change, so the index manifest re-chunks every file
+CHUNKER_VERSION = 2
+
 
 class ChunkType(Enum):
     """Types of content chunks for classification."""
@@ -24,20 +33,130 @@ class ChunkType(Enum):
     MIXED_CONTENT = "mixed_content"
 
 
+SENTENCE_END_PATTERN = re.compile(r'[.!?]+')
+LINK_PATTERN = re.compile(r'https?://[^\s]+')
+LIST_ITEM_PATTERN = re.compile(r'^\s*(?:[-*•]|\d+\.)\s')
+LIST_BULLETS = frozenset('-*•')
+LINK_MARKERS = ('http://', 'https://', 'www.', '.com', '.org')
+
+
+@dataclass
+class ContentProfile:
+    """Structural statistics of a text, collected in a single scan."""
+    word_count: int = 0
+    sentence_count: int = 0
+    paragraph_count: int = 0
+    table_count: int = 0        # lines containing a |...| cell run
+    tab_count: int = 0
+    list_count: int = 0         # bulleted list items
+    numbered_count: int = 0     # numbered list items ("1. ")
+    header_count: int = 0       # markdown headers
+    header_level: Optional[int] = None
+    code_count: int = 0
+    link_count: int = 0
+    has_links: bool = False
+    
+    @property
+    def chunk_type(self) -> ChunkType:
+        return ContentClassifier.classify_profile(self)
+    
+    def to_analysis(self) -> Dict[str, Any]:
+        """The analysis dict used for chunk metadata."""
+        return {
+            "word_count": self.word_count,
+            "sentence_count": self.sentence_count,
+            "paragraph_count": self.paragraph_count,
+            "has_tables": self.table_count > 0,
+            "has_lists": self.list_count > 0,
+            "has_headers": self.header_count > 0,
+            "has_links": self.has_links,
+            "table_count": self.table_count,
+            "list_count": self.list_count,
+            "link_count": self.link_count,
+            "header_level": self.header_level
+        }
+
+
+def _marker_ends_item(line: str, pos: int, is_last_line: bool) -> bool:
+    """Whether a list/header marker ending at pos is followed by whitespace (or a line break)."""
+    if pos < len(line):
+        return line[pos].isspace()
+    return not is_last_line
+
+
+def scan_content(text: str) -> ContentProfile:
+    """
+    Collect every structural statistic of a text in one pass over its lines.
+    
+    Line-anchored markers (table rows, bullets, numbered items, headers) are
+    recognized with plain string checks on each line; whole-text counts use
+    C-level str methods and precompiled patterns.
+    """
+    profile = ContentProfile(
+        word_count=len(text.split()),
+        sentence_count=len(SENTENCE_END_PATTERN.findall(text)),
+        paragraph_count=sum(1 for p in text.split('\n\n') if p.strip()),
+        tab_count=text.count('\t'),
+        code_count=text.count('```') + text.count('def ') + text.count('function '),
+        has_links=any(marker in text for marker in LINK_MARKERS)
+    )
+    
+    if 'http' in text:
+        profile.link_count = len(LINK_PATTERN.findall(text))
+    has_pipes = '|' in text
+    
+    lines = text.split('\n')
+    last_index = len(lines) - 1
+    for index, line in enumerate(lines):
+        if not line:
+            continue
+        
+        first = line[0]
+        if first == '#':
+            level = len(line) - len(line.lstrip('#'))
+            if level <= 6 and _marker_ends_item(line, level, index == last_index):
+                profile.header_count += 1
+                if profile.header_level is None:
+                    profile.header_level = level
+        
+        if has_pipes and line.count('|') >= 2:
+            profile.table_count += 1
+        
+        stripped = line.lstrip() if first.isspace() else line
+        if not stripped:
+            continue
+        
+        lead = stripped[0]
+        if lead in LIST_BULLETS:
+            if _marker_ends_item(stripped, 1, index == last_index):
+                profile.list_count += 1
+        elif lead.isdecimal():
+            digits = 1
+            while digits < len(stripped) and stripped[digits].isdecimal():
+                digits += 1
+            if (digits < len(stripped) and stripped[digits] == '.'
+                    and _marker_ends_item(stripped, digits + 1, index == last_index)):
+                profile.numbered_count += 1
+    
+    return profile
+
+
 class ContentClassifier:
     """Classifies document content to determine optimal chunking strategy."""
     
     @staticmethod
     def classify_content(text: str) -> ChunkType:
         """Classify text content to determine chunk type."""
-        text_lower = text.lower()
-        
-        # Count various content indicators
-        table_indicators = len(re.findall(r'\|.*\|', text)) + text.count('\t')
-        list_indicators = len(re.findall(r'^\s*[-*•]\s', text, re.MULTILINE))
-        numbered_list = len(re.findall(r'^\s*\d+\.\s', text, re.MULTILINE))
-        header_indicators = len(re.findall(r'^#{1,6}\s', text, re.MULTILINE))
-        code_indicators = text.count('```') + text.count('def ') + text.count('function ')
+        return ContentClassifier.classify_profile(scan_content(text))
+    
+    @staticmethod
+    def classify_profile(profile: ContentProfile) -> ChunkType:
+        """Classify already-scanned content."""
+        table_indicators = profile.table_count + profile.tab_count
+        list_indicators = profile.list_count
+        numbered_list = profile.numbered_count
+        header_indicators = profile.header_count
+        code_indicators = profile.code_count
         
         # Classification logic
         if table_indicators >= 3:
@@ -105,35 +224,36 @@ class ChunkMetadata:
 class DocumentTypeOptimizer:
     """Optimizes chunking parameters based on document content type."""
     
+    # Budgets are in embedding-model tokens (roughly 4 characters per token)
     CHUNK_CONFIGS = {
         ChunkType.NARRATIVE_TEXT: {
-            "chunk_size": 800,
-            "chunk_overlap": 50,
+            "chunk_tokens": 200,
+            "overlap_tokens": 12,
             "separators": ["\n\n", "\n", ". ", "? ", "! ", " "]
         },
         ChunkType.TABLE_HEAVY: {
-            "chunk_size": 1200,
-            "chunk_overlap": 20,
+            "chunk_tokens": 300,
+            "overlap_tokens": 5,
             "separators": ["\n\n", "\n|", "\n"]
         },
         ChunkType.LIST_HEAVY: {
-            "chunk_size": 600,
-            "chunk_overlap": 30,
+            "chunk_tokens": 150,
+            "overlap_tokens": 8,
             "separators": ["\n\n", "\n- ", "\n* ", "\n• ", "\n"]
         },
         ChunkType.HEADER_SECTION: {
-            "chunk_size": 1000,
-            "chunk_overlap": 40,
+            "chunk_tokens": 250,
+            "overlap_tokens": 10,
             "separators": ["\n# ", "\n## ", "\n### ", "\n\n", "\n"]
         },
         ChunkType.CODE_BLOCK: {
-            "chunk_size": 1500,
-            "chunk_overlap": 100,
+            "chunk_tokens": 375,
+            "overlap_tokens": 25,
             "separators": ["\n```", "\n\n", "\n"]
         },
         ChunkType.MIXED_CONTENT: {
-            "chunk_size": 900,
-            "chunk_overlap": 60,
+            "chunk_tokens": 225,
+            "overlap_tokens": 15,
             "separators": ["\n\n", "\n# ", "\n## ", "\n- ", "\n", ". "]
         }
     }
@@ -155,24 +275,7 @@ class SemanticAwareChunker:
     
     def analyze_content(self, text: str) -> Dict[str, Any]:
         """Analyze text content for structural elements."""
-        analysis = {
-            "word_count": len(text.split()),
-            "sentence_count": len(re.findall(r'[.!?]+', text)),
-            "paragraph_count": len([p for p in text.split('\n\n') if p.strip()]),
-            "has_tables": bool(re.search(r'\|.*\|', text)),
-            "has_lists": bool(re.search(r'^\s*[-*•]\s', text, re.MULTILINE)),
-            "has_headers": bool(re.search(r'^#{1,6}\s', text, re.MULTILINE)),
-            "has_links": bool(re.search(r'https?://|www\.|\.com|\.org', text)),
-            "table_count": len(re.findall(r'\|.*\|', text)),
-            "list_count": len(re.findall(r'^\s*[-*•]\s', text, re.MULTILINE)),
-            "link_count": len(re.findall(r'https?://[^\s]+', text))
-        }
-        
-        # Determine header level if present
-        header_match = re.search(r'^(#{1,6})\s', text, re.MULTILINE)
-        analysis["header_level"] = len(header_match.group(1)) if header_match else None
-        
-        return analysis
+        return scan_content(text).to_analysis()
     
     def calculate_semantic_score(self, text: str, analysis: Dict[str, Any]) -> float:
         """Calculate semantic coherence score for a chunk."""
@@ -213,11 +316,15 @@ class SemanticAwareChunker:
             return self._split_preserving_lists(text, config)
         
         # Default semantic splitting
+        return self._recursive_split(text, config)
+    
+    def _recursive_split(self, text: str, config: Dict[str, Any]) -> List[str]:
+        """Split free text on the configured separators, sized in tokens."""
         splitter = RecursiveCharacterTextSplitter(
-            chunk_size=config["chunk_size"],
-            chunk_overlap=config["chunk_overlap"],
+            chunk_size=config["chunk_tokens"],
+            chunk_overlap=config["overlap_tokens"],
             separators=config["separators"],
-            length_function=len,
+            length_function=count_tokens,
             is_separator_regex=False
         )
         
@@ -225,39 +332,24 @@ class SemanticAwareChunker:
     
     def _split_preserving_tables(self, text: str, config: Dict[str, Any]) -> List[str]:
         """Split text while keeping tables intact within chunks."""
-        chunks = []
-        current_chunk = ""
-        
-        # Split by double newlines first
-        sections = text.split('\n\n')
-        
-        for section in sections:
-            # Check if section contains a table
-            if '|' in section and section.count('|') >= 4:
-                # If current chunk + table would be too long, finalize current chunk
-                if len(current_chunk) + len(section) > config["chunk_size"] and current_chunk.strip():
-                    chunks.append(current_chunk.strip())
-                    current_chunk = section
-                else:
-                    current_chunk += "\n\n" + section if current_chunk else section
+        segments: List[Tuple[str, int]] = []
+        for section in text.split('\n\n'):
+            if not section or section.isspace():
+                continue
+            tokens = count_tokens(section)
+            if tokens > config["chunk_tokens"] and section.count('|') < 4:
+                # Oversized prose is split further; tables always stay whole
+                segments.extend(
+                    (piece, count_tokens(piece)) for piece in self._recursive_split(section, config)
+                )
             else:
-                # Regular text section
-                if len(current_chunk) + len(section) > config["chunk_size"] and current_chunk.strip():
-                    chunks.append(current_chunk.strip())
-                    current_chunk = section
-                else:
-                    current_chunk += "\n\n" + section if current_chunk else section
-        
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+                segments.append((section, tokens))
         
-        return chunks
+        return self._pack_segments(segments, '\n\n', config)
     
     def _split_preserving_lists(self, text: str, config: Dict[str, Any]) -> List[str]:
         """Split text while keeping lists intact within chunks."""
-        chunks = []
-        current_chunk = ""
-        
+        segments: List[Tuple[str, int]] = []
         lines = text.split('\n')
         i = 0
         
@@ -265,46 +357,321 @@ class SemanticAwareChunker:
             line = lines[i]
             
             # Check if this line starts a list
-            if re.match(r'^\s*[-*•]\s', line) or re.match(r'^\s*\d+\.\s', line):
-                # Collect the entire list
+            if LIST_ITEM_PATTERN.match(line):
+                # Collect the entire list, including indented continuation lines
                 list_items = [line]
                 i += 1
-                
                 while i < len(lines) and (
-                    re.match(r'^\s*[-*•]\s', lines[i]) or 
-                    re.match(r'^\s*\d+\.\s', lines[i]) or
-                    (lines[i].strip() and not lines[i].startswith(' ') == False)
+                    LIST_ITEM_PATTERN.match(lines[i]) or
+                    (lines[i].strip() and lines[i].startswith(' '))
                 ):
                     list_items.append(lines[i])
                     i += 1
                 
                 list_text = '\n'.join(list_items)
-                
-                # Check if adding this list would exceed chunk size
-                if len(current_chunk) + len(list_text) > config["chunk_size"] and current_chunk.strip():
-                    chunks.append(current_chunk.strip())
-                    current_chunk = list_text
+                tokens = count_tokens(list_text)
+                if tokens > config["chunk_tokens"]:
+                    # Too long for one chunk: break between items, never inside one
+                    segments.extend((item, count_tokens(item)) for item in list_items)
                 else:
-                    current_chunk += "\n" + list_text if current_chunk else list_text
+                    segments.append((list_text, tokens))
             else:
-                # Regular line
-                if len(current_chunk) + len(line) > config["chunk_size"] and current_chunk.strip():
-                    chunks.append(current_chunk.strip())
-                    current_chunk = line
-                else:
-                    current_chunk += "\n" + line if current_chunk else line
+                segments.append((line, count_tokens(line)))
                 i += 1
         
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        return self._pack_segments(segments, '\n', config)
+    
+    def _pack_segments(
+        self, segments: List[Tuple[str, int]], joiner: str, config: Dict[str, Any]
+    ) -> List[str]:
+        """
+        Greedily pack whole (text, tokens) segments into chunks within the token budget.
+        
+        Segments are accumulated in a list with a running token count (no
+        repeated string concatenation). Each new chunk starts with trailing
+        segments of the previous one that fit in the overlap budget, or with
+        the tail words of the last segment when no whole segment fits.
+        """
+        budget = config["chunk_tokens"]
+        overlap_budget = config["overlap_tokens"]
+        joiner_tokens = count_tokens(joiner)
+        
+        chunks = []
+        texts: List[str] = []
+        token_counts: List[int] = []
+        total = 0
+        has_new_content = False
+        
+        for segment, tokens in segments:
+            if texts and total + joiner_tokens + tokens > budget:
+                if has_new_content:
+                    chunks.append(joiner.join(texts).strip())
+                
+                room = min(overlap_budget, budget - tokens - joiner_tokens)
+                if room > 0:
+                    texts, token_counts, total = self._overlap_from(texts, token_counts, joiner_tokens, room)
+                else:
+                    texts, token_counts, total = [], [], 0
+                has_new_content = False
+            
+            if texts:
+                total += joiner_tokens
+            texts.append(segment)
+            token_counts.append(tokens)
+            total += tokens
+            has_new_content = has_new_content or (bool(segment) and not segment.isspace())
         
-        return chunks
+        if texts and has_new_content:
+            chunks.append(joiner.join(texts).strip())
+        
+        return [chunk for chunk in chunks if chunk]
+    
+    def _overlap_from(
+        self, texts: List[str], token_counts: List[int], joiner_tokens: int, max_tokens: int
+    ) -> Tuple[List[str], List[int], int]:
+        """Trailing context of a finished chunk to repeat at the start of the next one."""
+        carried = 0
+        start = len(texts)
+        while start > 0:
+            cost = token_counts[start - 1] + (joiner_tokens if start < len(texts) else 0)
+            if carried + cost > max_tokens:
+                break
+            carried += cost
+            start -= 1
+        if start < len(texts):
+            return texts[start:], token_counts[start:], carried
+        
+        # No whole segment fits: carry the last one's tail words (never part of a table)
+        if texts[-1].count('|') >= 4:
+            return [], [], 0
+        tail = self._tail_within(texts[-1], max_tokens)
+        if not tail:
+            return [], [], 0
+        tail_tokens = count_tokens(tail)
+        return [tail], [tail_tokens], tail_tokens
+    
+    def _tail_within(self, text: str, max_tokens: int) -> str:
+        """Trailing whole words of text within max_tokens."""
+        # Start from a character estimate and shrink word by word until it fits
+        words = text[-max_tokens * CHARS_PER_TOKEN:].split()[1:]
+        while words and count_tokens(" ".join(words)) > max_tokens:
+            words = words[1:]
+        return " ".join(words)
+
+
+def _split_document(
+    chunker: SemanticAwareChunker,
+    document: Document,
+    doc_idx: int,
+    enhance_metadata: bool = True,
+    verbose: bool = True
+) -> Iterator[Document]:
+    """Split one document into semantically-aware chunks with enhanced metadata."""
+    _, chunks = _chunk_document(chunker, document, doc_idx, enhance_metadata, verbose)
+    yield from chunks
+
+
+def _chunk_document(
+    chunker: SemanticAwareChunker,
+    document: Document,
+    doc_idx: int,
+    enhance_metadata: bool,
+    verbose: bool
+) -> Tuple[ChunkType, List[Document]]:
+    """Split one document, also returning its content type (from the same scan)."""
+    with telemetry.span("chunk", document.metadata.get("file_name")):
+        return _build_chunks(chunker, document, doc_idx, enhance_metadata, verbose)
+
+
+def _build_chunks(
+    chunker: SemanticAwareChunker,
+    document: Document,
+    doc_idx: int,
+    enhance_metadata: bool,
+    verbose: bool
+) -> Tuple[ChunkType, List[Document]]:
+    # Analyze and classify from a single scan
+    profile = scan_content(document.page_content)
+    content_analysis = profile.to_analysis()
+    chunk_type = profile.chunk_type
+    
+    # Split document while preserving structure
+    text_chunks = chunker.split_preserving_structure(document.page_content, chunk_type)
+    
+    if verbose:
+        logger.debug(f"   📝 Document {doc_idx}: {chunk_type.value}, "
+                     f"{content_analysis['word_count']} words, "
+                     f"{content_analysis['table_count']} tables, "
+                     f"{content_analysis['list_count']} lists -> {len(text_chunks)} chunks")
+    
+    # Create enhanced document chunks
+    chunks = []
+    for chunk_idx, chunk_text in enumerate(text_chunks):
+        chunk_profile = scan_content(chunk_text)
+        chunk_analysis = chunk_profile.to_analysis()
+        semantic_score = chunker.calculate_semantic_score(chunk_text, chunk_analysis)
+        
+        # Create enhanced metadata
+        if enhance_metadata:
+            enhanced_metadata = ChunkMetadata(
+                source=document.metadata.get("source", "unknown"),
+                file_name=document.metadata.get("file_name", "unknown"),
+                chunk_id=f"doc_{doc_idx}_chunk_{chunk_idx}",
+                chunk_type=chunk_profile.chunk_type,
+                char_count=len(chunk_text),
+                word_count=chunk_analysis["word_count"],
+                sentence_count=chunk_analysis["sentence_count"],
+                paragraph_count=chunk_analysis["paragraph_count"],
+                has_tables=chunk_analysis["has_tables"],
+                has_lists=chunk_analysis["has_lists"],
+                has_headers=chunk_analysis["has_headers"],
+                has_links=chunk_analysis["has_links"],
+                header_level=chunk_analysis["header_level"],
+                table_count=chunk_analysis["table_count"],
+                list_count=chunk_analysis["list_count"],
+                link_count=chunk_analysis["link_count"],
+                processor="semantic_chunker",
+                extraction_confidence=0.85,  # Base confidence
+                semantic_score=semantic_score
+            )
+            
+            # Merge with original metadata, remembering which extractor produced the text
+            final_metadata = {
+                **document.metadata,
+                **enhanced_metadata.to_dict(),
+                "extractor": document.metadata.get("processor", "unknown")
+            }
+        else:
+            final_metadata = {
+                **document.metadata,
+                "chunk_id": f"doc_{doc_idx}_chunk_{chunk_idx}",
+                "chunk_type": chunk_type.value,
+                "semantic_score": semantic_score
+            }
+        
+        # Create enhanced document chunk
+        chunks.append(Document(
+            page_content=chunk_text,
+            metadata=final_metadata
+        ))
+    
+    return chunk_type, chunks
+
+
+def iter_enhanced_chunks(
+    documents: Iterable[Document],
+    enhance_metadata: bool = True,
+    preserve_structure: bool = True,
+    start_doc_idx: int = 0
+) -> Iterator[Document]:
+    """
+    Lazily split a stream of documents into semantic chunks.
+    
+    Streaming counterpart of enhanced_split_documents: documents are consumed
+    one at a time and no summary statistics are accumulated, so memory stays
+    bounded by the largest single document.
+    
+    Args:
+        documents: Iterable of documents to split
+        enhance_metadata: Whether to add enhanced metadata to chunks
+        preserve_structure: Whether to preserve document structure
+        start_doc_idx: Index of the first document, used in chunk IDs
+    
+    Yields:
+        Semantically-aware document chunks with enhanced metadata
+    """
+    chunker = SemanticAwareChunker(
+        preserve_tables=preserve_structure,
+        preserve_lists=preserve_structure
+    )
+    
+    for doc_idx, document in enumerate(documents, start=start_doc_idx):
+        yield from _split_document(
+            chunker, document, doc_idx, enhance_metadata=enhance_metadata, verbose=False
+        )
+
+
+# Below this many documents, process start-up costs more than it saves
+PARALLEL_MIN_DOCUMENTS = 64
+
+# Per-process chunker reused across the batches a worker handles
+_worker_chunker: Optional[SemanticAwareChunker] = None
+
+
+def _chunk_batch(
+    payload: Tuple[int, List[Tuple[str, Dict[str, Any]]], bool, bool]
+) -> List[Tuple[List[Tuple[str, Dict[str, Any]]], str]]:
+    """
+    Worker entry point: split a batch of (text, metadata) documents.
+    
+    Documents and chunks cross the process boundary as plain tuples, and
+    chunk IDs derive from the global document index, so results do not
+    depend on how batches were scheduled.
+    
+    Returns:
+        Per document: ([(chunk_text, chunk_metadata), ...], document chunk type)
+    """
+    global _worker_chunker
+    start_doc_idx, batch, enhance_metadata, preserve_structure = payload
+    if _worker_chunker is None or _worker_chunker.preserve_tables != preserve_structure:
+        _worker_chunker = SemanticAwareChunker(
+            preserve_tables=preserve_structure,
+            preserve_lists=preserve_structure
+        )
+    
+    results = []
+    for offset, (page_content, metadata) in enumerate(batch):
+        document = Document(page_content=page_content, metadata=metadata)
+        chunk_type, chunks = _chunk_document(
+            _worker_chunker, document, start_doc_idx + offset,
+            enhance_metadata=enhance_metadata, verbose=False
+        )
+        results.append(([(chunk.page_content, chunk.metadata) for chunk in chunks], chunk_type.value))
+    return results
+
+
+def _parallel_split(
+    documents: List[Document],
+    enhance_metadata: bool,
+    preserve_structure: bool,
+    workers: int
+) -> List[Document]:
+    """Split documents in a process pool over contiguous document batches."""
+    # A few batches per worker balances load without much per-task overhead
+    batch_size = max(1, -(-len(documents) // (workers * 4)))
+    payloads = [
+        (
+            start,
+            [(doc.page_content, doc.metadata) for doc in documents[start:start + batch_size]],
+            enhance_metadata,
+            preserve_structure
+        )
+        for start in range(0, len(documents), batch_size)
+    ]
+    
+    enhanced_chunks = []
+    type_counts: Dict[str, int] = {}
+    progress = RateLimitedLog()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map() yields in submission order, so chunk order matches the serial path
+        for batch_idx, results in enumerate(pool.map(_chunk_batch, payloads), 1):
+            for chunks, document_type in results:
+                type_counts[document_type] = type_counts.get(document_type, 0) + 1
+                enhanced_chunks.extend(
+                    Document(page_content=text, metadata=metadata) for text, metadata in chunks
+                )
+            progress(f"   ✅ Batch {batch_idx}/{len(payloads)} done ({len(enhanced_chunks)} chunks so far)")
+    
+    logger.debug(f"   📝 Document content types: "
+                 + ", ".join(f"{name}: {count}" for name, count in sorted(type_counts.items())))
+    return enhanced_chunks
 
 
 def enhanced_split_documents(
     documents: List[Document], 
     enhance_metadata: bool = True,
-    preserve_structure: bool = True
+    preserve_structure: bool = True,
+    workers: int = 1
 ) -> List[Document]:
     """
     Enhanced document splitting with semantic awareness and rich metadata.
@@ -313,85 +680,42 @@ def enhanced_split_documents(
         documents: List of documents to split
         enhance_metadata: Whether to add enhanced metadata to chunks
         preserve_structure: Whether to preserve document structure
+        workers: Worker processes for chunking (0 = one per CPU); output is
+            identical to the single-process path
     
     Returns:
         List of semantically-aware document chunks with enhanced metadata
     """
-    chunker = SemanticAwareChunker(
-        preserve_tables=preserve_structure,
-        preserve_lists=preserve_structure
-    )
-    
-    enhanced_chunks = []
+    workers = min(workers or os.cpu_count() or 1, len(documents))
+    if len(documents) < PARALLEL_MIN_DOCUMENTS:
+        workers = 1
     
-    print(f"\n📊 Enhanced semantic chunking of {len(documents)} documents...")
-    print("="*60)
+    logger.info(f"\n📊 Enhanced semantic chunking of {len(documents)} documents...")
+    logger.info("="*60)
     
-    for doc_idx, document in enumerate(documents):
-        print(f"\n🔄 Processing document {doc_idx + 1}/{len(documents)}")
-        
-        # Analyze content and classify
-        content_analysis = chunker.analyze_content(document.page_content)
-        chunk_type = chunker.content_classifier.classify_content(document.page_content)
-        
-        print(f"   📝 Content type: {chunk_type.value}")
-        print(f"   📊 Words: {content_analysis['word_count']}, "
-              f"Tables: {content_analysis['table_count']}, "
-              f"Lists: {content_analysis['list_count']}")
-        
-        # Split document while preserving structure
-        text_chunks = chunker.split_preserving_structure(document.page_content, chunk_type)
-        
-        print(f"   ✂️  Created {len(text_chunks)} semantic chunks")
-        
-        # Create enhanced document chunks
-        for chunk_idx, chunk_text in enumerate(text_chunks):
-            chunk_analysis = chunker.analyze_content(chunk_text)
-            semantic_score = chunker.calculate_semantic_score(chunk_text, chunk_analysis)
-            
-            # Create enhanced metadata
-            if enhance_metadata:
-                enhanced_metadata = ChunkMetadata(
-                    source=document.metadata.get("source", "unknown"),
-                    file_name=document.metadata.get("file_name", "unknown"),
-                    chunk_id=f"doc_{doc_idx}_chunk_{chunk_idx}",
-                    chunk_type=chunker.content_classifier.classify_content(chunk_text),
-                    char_count=len(chunk_text),
-                    word_count=chunk_analysis["word_count"],
-                    sentence_count=chunk_analysis["sentence_count"],
-                    paragraph_count=chunk_analysis["paragraph_count"],
-                    has_tables=chunk_analysis["has_tables"],
-                    has_lists=chunk_analysis["has_lists"],
-                    has_headers=chunk_analysis["has_headers"],
-                    has_links=chunk_analysis["has_links"],
-                    header_level=chunk_analysis["header_level"],
-                    table_count=chunk_analysis["table_count"],
-                    list_count=chunk_analysis["list_count"],
-                    link_count=chunk_analysis["link_count"],
-                    processor="semantic_chunker",
-                    extraction_confidence=0.85,  # Base confidence
-                    semantic_score=semantic_score
-                )
-                
-                # Merge with original metadata
-                final_metadata = {**document.metadata, **enhanced_metadata.to_dict()}
-            else:
-                final_metadata = {
-                    **document.metadata,
-                    "chunk_id": f"doc_{doc_idx}_chunk_{chunk_idx}",
-                    "chunk_type": chunk_type.value,
-                    "semantic_score": semantic_score
-                }
-            
-            # Create enhanced document chunk
-            enhanced_chunk = Document(
-                page_content=chunk_text,
-                metadata=final_metadata
+    if workers > 1:
+        logger.info(f"⚡ Parallel chunking with {workers} worker processes")
+        # Worker processes keep their own telemetry, so time the pool as a whole
+        with telemetry.span("chunk.parallel"):
+            enhanced_chunks = _parallel_split(documents, enhance_metadata, preserve_structure, workers)
+    else:
+        chunker = SemanticAwareChunker(
+            preserve_tables=preserve_structure,
+            preserve_lists=preserve_structure
+        )
+        enhanced_chunks = []
+        progress = RateLimitedLog()
+        for doc_idx, document in enumerate(documents):
+            progress(f"   🔄 Processing document {doc_idx + 1}/{len(documents)}")
+            enhanced_chunks.extend(
+                _split_document(chunker, document, doc_idx, enhance_metadata=enhance_metadata)
             )
-            enhanced_chunks.append(enhanced_chunk)
     
-    # Summary statistics
+    # Summary statistics (walk every chunk, so only when they will be shown)
     total_chunks = len(enhanced_chunks)
+    telemetry.count("chunks.created", total_chunks)
+    if not total_chunks or not logger.isEnabledFor(logging.INFO):
+        return enhanced_chunks
     avg_semantic_score = sum(chunk.metadata.get("semantic_score", 0) for chunk in enhanced_chunks) / total_chunks
     
     chunk_type_counts = {}
@@ -399,14 +723,14 @@ def enhanced_split_documents(
         chunk_type = chunk.metadata.get("chunk_type", "unknown")
         chunk_type_counts[chunk_type] = chunk_type_counts.get(chunk_type, 0) + 1
     
-    print(f"\n📈 SEMANTIC CHUNKING SUMMARY")
-    print("="*60)
-    print(f"📄 Total chunks created: {total_chunks}")
-    print(f"🎯 Average semantic score: {avg_semantic_score:.3f}")
-    print(f"📊 Chunk type distribution:")
+    logger.info(f"\n📈 SEMANTIC CHUNKING SUMMARY")
+    logger.info("="*60)
+    logger.info(f"📄 Total chunks created: {total_chunks}")
+    logger.info(f"🎯 Average semantic score: {avg_semantic_score:.3f}")
+    logger.info(f"📊 Chunk type distribution:")
     for chunk_type, count in chunk_type_counts.items():
         percentage = (count / total_chunks) * 100
-        print(f"   • {chunk_type}: {count} ({percentage:.1f}%)")
-    print("="*60)
+        logger.info(f"   • {chunk_type}: {count} ({percentage:.1f}%)")
+    logger.info("="*60)
     
     return enhanced_chunks
\ No newline at end of file
@@ -0,0 +1,231 @@
+"""
+Near-duplicate chunk elimination with MinHash and locality-sensitive hashing.
+
+Several extractors often describe the same content (a table read by PyMuPDF,
+pdfplumber and both Camelot flavors), so identical or nearly identical chunks
+would be embedded, billed and returned together in the top-k. Each chunk is
+reduced to a MinHash signature of its word shingles; LSH banding proposes
+candidate pairs in near-linear time, and candidates whose estimated Jaccard
+similarity reaches the threshold are merged into the best-scoring chunk.
+"""
+
+import re
+import zlib
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+from langchain.schema.document import Document
+
+from config.settings import Config
+from src.utils.telemetry import telemetry
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+WORD_PATTERN = re.compile(r'\w+')
+
+
+@dataclass
+class DedupStats:
+    """Outcome of a deduplication pass."""
+    input_chunks: int = 0
+    output_chunks: int = 0
+    duplicate_groups: int = 0
+
+    @property
+    def removed(self) -> int:
+        return self.input_chunks - self.output_chunks
+
+    def merge(self, other: "DedupStats") -> None:
+        self.input_chunks += other.input_chunks
+        self.output_chunks += other.output_chunks
+        self.duplicate_groups += other.duplicate_groups
+
+
+class MinHasher:
+    """MinHash signatures over word shingles, computed with numpy."""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3, seed: int = 1):
+        """
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            shingle_size: Words per shingle
+            seed: Seed for the permutation parameters (fixed for reproducible results)
+        """
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> List[bytes]:
+        """Word shingles of the text, ignoring case, punctuation and table markup."""
+        words = WORD_PATTERN.findall(text.lower())
+        if len(words) <= self.shingle_size:
+            return [" ".join(words).encode("utf-8")] if words else []
+        return [
+            " ".join(words[i:i + self.shingle_size]).encode("utf-8")
+            for i in range(len(words) - self.shingle_size + 1)
+        ]
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature (num_perm uint64 values) of the text's shingle set."""
+        shingle_hashes = np.fromiter(
+            {zlib.crc32(shingle) for shingle in self.shingles(text)}, dtype=np.uint64
+        )
+        if shingle_hashes.size == 0:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+
+        # (a * x + b) mod p per permutation, truncated to 32 bits (uint64 wraps on overflow)
+        with np.errstate(over="ignore"):
+            permuted = (np.outer(self._a, shingle_hashes) + self._b[:, None]) % MERSENNE_PRIME
+        return (permuted & MAX_HASH).min(axis=1)
+
+
+def estimate_jaccard(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return float(np.count_nonzero(sig_a == sig_b)) / len(sig_a)
+
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def find_duplicate_groups(
+    signatures: Sequence[np.ndarray], threshold: float, bands: int
+) -> List[List[int]]:
+    """
+    Group indices of near-duplicate signatures.
+
+    Signatures sharing any LSH band bucket are compared with the bucket's
+    first member, and linked (union-find) when their estimated Jaccard
+    similarity reaches the threshold.
+    """
+    parent = list(range(len(signatures)))
+    if not signatures:
+        return []
+    rows = len(signatures[0]) // bands
+
+    for band in range(bands):
+        buckets: Dict[bytes, int] = {}
+        for i, signature in enumerate(signatures):
+            key = signature[band * rows:(band + 1) * rows].tobytes()
+            head = buckets.setdefault(key, i)
+            if head != i and _find(parent, i) != _find(parent, head):
+                if estimate_jaccard(signatures[head], signature) >= threshold:
+                    parent[_find(parent, i)] = _find(parent, head)
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(signatures)):
+        groups.setdefault(_find(parent, i), []).append(i)
+    return list(groups.values())
+
+
+def _quality(chunk: Document) -> Tuple[float, float, int]:
+    """Ranking key for picking a group's representative."""
+    metadata = chunk.metadata
+    return (
+        metadata.get("semantic_score", 0) or 0,
+        metadata.get("extraction_accuracy", 0) or 0,
+        len(chunk.page_content),
+    )
+
+
+def _merge_group(chunks: List[Document]) -> Document:
+    """Keep the best chunk of a duplicate group, recording where the others came from."""
+    best = max(chunks, key=_quality)
+    others = [chunk for chunk in chunks if chunk is not best]
+
+    processors = sorted({
+        str(chunk.metadata.get("extractor") or chunk.metadata.get("processor", "unknown"))
+        for chunk in chunks
+    })
+    metadata = {
+        **best.metadata,
+        "duplicates_merged": len(others),
+        "merged_processors": processors,
+        "merged_chunk_ids": [str(chunk.metadata.get("chunk_id", "")) for chunk in others],
+    }
+    pages = sorted({chunk.metadata["page"] for chunk in chunks if "page" in chunk.metadata})
+    if pages:
+        # Vector metadata lists must hold strings
+        metadata["merged_pages"] = [str(page) for page in pages]
+    return Document(page_content=best.page_content, metadata=metadata)
+
+
+def deduplicate_chunks(
+    chunks: List[Document],
+    threshold: float = Config.DEDUP_THRESHOLD,
+    num_perm: int = 128,
+    bands: int = 32,
+    shingle_size: int = 3,
+    per_source: bool = True,
+) -> Tuple[List[Document], DedupStats]:
+    """
+    Drop near-duplicate chunks, keeping the best-scoring one of each group.
+
+    Args:
+        chunks: Chunks to deduplicate (order is preserved for the survivors)
+        threshold: Minimum estimated Jaccard similarity to treat chunks as duplicates
+        num_perm: MinHash signature length
+        bands: LSH bands (num_perm / bands rows each); more bands catch weaker matches
+        shingle_size: Words per shingle
+        per_source: Only merge chunks of the same source file, so per-file
+            manifests and deletions stay correct
+
+    Returns:
+        (deduplicated chunks, statistics)
+    """
+    stats = DedupStats(input_chunks=len(chunks))
+    if per_source:
+        groups_by_source: Dict[str, List[int]] = {}
+        for i, chunk in enumerate(chunks):
+            groups_by_source.setdefault(chunk.metadata.get("source", "unknown"), []).append(i)
+        partitions = list(groups_by_source.values())
+    else:
+        partitions = [list(range(len(chunks)))]
+
+    hasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+    replacement: Dict[int, Document] = {}
+    dropped = set()
+
+    for indices in partitions:
+        signatures = [hasher.signature(chunks[i].page_content) for i in indices]
+        for group in find_duplicate_groups(signatures, threshold, bands):
+            if len(group) < 2:
+                continue
+            members = [indices[g] for g in group]
+            merged = _merge_group([chunks[i] for i in members])
+            # The survivor keeps the position of the group's first chunk
+            replacement[members[0]] = merged
+            dropped.update(members[1:])
+            stats.duplicate_groups += 1
+
+    result = [
+        replacement.get(i, chunk) for i, chunk in enumerate(chunks) if i not in dropped
+    ]
+    stats.output_chunks = len(result)
+    return result, stats
+
+
+def iter_deduplicated(
+    chunks: Iterable[Document], stats: DedupStats = None, **kwargs
+) -> Iterator[Document]:
+    """
+    Streaming deduplication: buffers one source file's chunks at a time.
+
+    Chunks of a file must arrive consecutively (as they do from the
+    ingestion pipeline). Statistics are accumulated into stats, if given.
+    """
+    for source, file_chunks in groupby(chunks, key=lambda chunk: chunk.metadata.get("source", "unknown")):
+        file_chunks = list(file_chunks)
+        with telemetry.span("dedup", file_chunks[0].metadata.get("file_name", source)):
+            deduplicated, file_stats = deduplicate_chunks(file_chunks, **kwargs)
+        telemetry.count("chunks.duplicates_removed", file_stats.removed)
+        if stats is not None:
+            stats.merge(file_stats)
+        yield from deduplicated
@@ -0,0 +1,106 @@
+"""
+Persistent cache of PDF extraction results.
+
+Extraction (PyMuPDF, pdfplumber, Camelot) is by far the slowest part of
+ingestion, while chunking parameters are what we iterate on. The cache stores
+the extracted Document lists keyed on the PDF's content hash plus the
+extractor version and configuration, compressed with zstd when available
+(zlib otherwise), so later runs can skip straight to chunking.
+"""
+
+import hashlib
+import json
+import os
+import zlib
+from typing import List, Optional, Tuple
+
+from langchain.schema.document import Document
+
+from src.utils.manifest import compute_file_hash
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+class ExtractionCache:
+    """On-disk cache of extracted documents, keyed by file hash and extractor config."""
+
+    def __init__(self, cache_dir: str, extractor_signature: str, compression_level: int = 10):
+        """
+        Args:
+            cache_dir: Directory holding the cache entries
+            extractor_signature: Extractor version/configuration; changing it invalidates entries
+            compression_level: zstd level (ignored for the zlib fallback)
+        """
+        self.cache_dir = cache_dir
+        self.extractor_signature = extractor_signature
+        self.compression_level = compression_level
+        self.extension = ".json.zst" if ZSTD_AVAILABLE else ".json.z"
+        self.hits = 0
+        self.misses = 0
+        self._hash_memo = {}
+
+    def key_for(self, pdf_path: str) -> str:
+        """Cache key for a PDF: its content hash combined with the extractor signature."""
+        stat = os.stat(pdf_path)
+        memo_key = (os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+        file_hash = self._hash_memo.get(memo_key)
+        if file_hash is None:
+            file_hash = compute_file_hash(pdf_path)
+            self._hash_memo[memo_key] = file_hash
+        return hashlib.sha256(f"{file_hash}:{self.extractor_signature}".encode("utf-8")).hexdigest()
+
+    def get(self, pdf_path: str) -> Optional[List[Document]]:
+        """Return the cached documents for a PDF, or None on a miss."""
+        entry_path = self._entry_path(self.key_for(pdf_path))
+        try:
+            with open(entry_path, "rb") as f:
+                payload = self._decompress(f.read())
+            entries = json.loads(payload)
+        except Exception:
+            # Missing, corrupt or unreadable entry: a miss, rewritten after extraction
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        # The same content may now live under another path or name
+        location = {"source": pdf_path, "file_name": os.path.basename(pdf_path)}
+        return [
+            Document(page_content=page_content, metadata={**metadata, **location})
+            for page_content, metadata in entries
+        ]
+
+    def put(self, pdf_path: str, documents: List[Document]) -> None:
+        """Store the extracted documents for a PDF (atomically)."""
+        entry_path = self._entry_path(self.key_for(pdf_path))
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+
+        payload = json.dumps(
+            [(doc.page_content, doc.metadata) for doc in documents],
+            ensure_ascii=False, separators=(",", ":"), default=str
+        ).encode("utf-8")
+
+        tmp_path = f"{entry_path}.tmp.{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            f.write(self._compress(payload))
+        os.replace(tmp_path, entry_path)
+
+    def stats(self) -> Tuple[int, int]:
+        """(hits, misses) since this cache object was created."""
+        return self.hits, self.misses
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + self.extension)
+
+    def _compress(self, data: bytes) -> bytes:
+        if ZSTD_AVAILABLE:
+            return zstandard.ZstdCompressor(level=self.compression_level).compress(data)
+        return zlib.compress(data, 6)
+
+    def _decompress(self, data: bytes) -> bytes:
+        if ZSTD_AVAILABLE:
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
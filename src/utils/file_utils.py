@@ -1,42 +1,33 @@
-from langchain_community.document_loaders import DirectoryLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain.schema.document import Document
 from typing import List, Dict, Any, Optional, Tuple
 import os
 import glob
 import re
+import logging
 
-# Import PDF processing libraries with fallback handling
-try:
-    import fitz  # PyMuPDF
-    PYMUPDF_AVAILABLE = True
-except ImportError:
-    PYMUPDF_AVAILABLE = False
+from config.settings import Config
+from src.core.serving import is_slot_namespace
+from src.utils import processors
+from src.utils.extraction_cache import ExtractionCache
+from src.utils.ocr import PageOCR
+from src.utils.span_store import SpanStore
+from src.utils.telemetry import RateLimitedLog, logger, telemetry
 
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
+# Bump whenever extraction output changes, to invalidate cached extractions
+EXTRACTOR_VERSION = 3
 
-try:
-    import camelot
-    CAMELOT_AVAILABLE = True
-except ImportError:
-    CAMELOT_AVAILABLE = False
+# PDF processing libraries are imported on first use (see src/utils/processors.py);
+# these flags only probe whether they are installed
+PYMUPDF_AVAILABLE = processors.is_available("pymupdf")
+PDFPLUMBER_AVAILABLE = processors.is_available("pdfplumber")
+CAMELOT_AVAILABLE = processors.is_available("camelot")
+UNSTRUCTURED_AVAILABLE = processors.is_available("unstructured")
 
-try:
-    from unstructured.partition.pdf import partition_pdf
-    UNSTRUCTURED_AVAILABLE = True
-except ImportError:
-    UNSTRUCTURED_AVAILABLE = False
 
-try:
-    import pytesseract
-    from PIL import Image
-    OCR_AVAILABLE = True
-except ImportError:
-    OCR_AVAILABLE = False
+def _text_only_dict_flags(fitz) -> int:
+    """Default 'dict' flags minus TEXT_PRESERVE_IMAGES, so image bytes are not copied out."""
+    return fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
 
 
 class PDFStructureExtractor:
@@ -47,25 +38,20 @@ class PDFStructureExtractor:
     
     def _check_available_processors(self) -> List[str]:
         """Check which PDF processors are available."""
-        processors = []
-        if PYMUPDF_AVAILABLE:
-            processors.append("pymupdf")
-        if PDFPLUMBER_AVAILABLE:
-            processors.append("pdfplumber")
-        if CAMELOT_AVAILABLE:
-            processors.append("camelot")
-        if UNSTRUCTURED_AVAILABLE:
-            processors.append("unstructured")
-        return processors
+        available = processors.available_processors()
+        if "ocr" in available and "pymupdf" not in available:
+            available.remove("ocr")  # Pages are rasterized with PyMuPDF
+        return available
     
     def extract_with_pymupdf(self, pdf_path: str) -> Dict[str, Any]:
         """Extract structured content using PyMuPDF."""
-        if not PYMUPDF_AVAILABLE:
-            raise ImportError("PyMuPDF not available")
+        fitz = processors.load("pymupdf")
+        text_flags = _text_only_dict_flags(fitz)
         
         doc = fitz.open(pdf_path)
+        spans = SpanStore()
         extracted_data = {
-            "text_blocks": [],
+            "text_blocks": spans,
             "images": [],
             "links": [],
             "tables": [],
@@ -76,39 +62,16 @@ class PDFStructureExtractor:
         for page_num in range(len(doc)):
             page = doc[page_num]
             
-            # Extract text blocks with formatting
-            blocks = page.get_text("dict")
-            for block in blocks.get("blocks", []):
-                if "lines" in block:
-                    for line in block["lines"]:
-                        for span in line.get("spans", []):
-                            font_info = {
-                                "font": span.get("font", ""),
-                                "size": span.get("size", 0),
-                                "flags": span.get("flags", 0),
-                                "color": span.get("color", 0)
-                            }
-                            
-                            text_block = {
-                                "text": span.get("text", ""),
-                                "bbox": span.get("bbox", []),
-                                "page": page_num + 1,
-                                "font_info": font_info,
-                                "is_header": self._is_header(font_info, span.get("text", ""))
-                            }
-                            extracted_data["text_blocks"].append(text_block)
-                            
-                            # Track fonts for analysis
-                            font_key = f"{font_info['font']}_{font_info['size']}"
-                            if font_key not in extracted_data["fonts"]:
-                                extracted_data["fonts"][font_key] = {
-                                    "count": 0,
-                                    "font_info": font_info
-                                }
-                            extracted_data["fonts"][font_key]["count"] += 1
+            # Extract text lines with formatting (image blocks are not needed here)
+            blocks = page.get_text("dict", flags=text_flags)
+            spans.add_page_lines(
+                page_num + 1,
+                [line for block in blocks.get("blocks", []) for line in block.get("lines", [])],
+                self._is_header
+            )
             
             # Extract images
-            image_list = page.get_images()
+            image_list = page.get_images(full=True)
             for img_index, img in enumerate(image_list):
                 extracted_data["images"].append({
                     "page": page_num + 1,
@@ -128,17 +91,18 @@ class PDFStructureExtractor:
                 })
         
         doc.close()
+        
+        # Track fonts for analysis
+        extracted_data["fonts"] = spans.font_stats()
         return extracted_data
     
     def extract_with_pdfplumber(self, pdf_path: str) -> Dict[str, Any]:
         """Extract structured content using pdfplumber."""
-        if not PDFPLUMBER_AVAILABLE:
-            raise ImportError("pdfplumber not available")
+        pdfplumber = processors.load("pdfplumber")
         
         extracted_data = {
             "text": "",
             "tables": [],
-            "chars": [],
             "metadata": {}
         }
         
@@ -162,28 +126,149 @@ class PDFStructureExtractor:
                             "bbox": page.bbox
                         })
                 
-                # Extract character-level information
-                chars = page.chars
-                extracted_data["chars"].extend([
-                    {
-                        **char,
-                        "page": page_num + 1
-                    } for char in chars
-                ])
+                # Release the page's cached layout objects before the next page
+                page.close()
         
         return extracted_data
     
-    def extract_with_camelot(self, pdf_path: str) -> Dict[str, Any]:
-        """Extract tables using Camelot."""
-        if not CAMELOT_AVAILABLE:
-            raise ImportError("Camelot not available")
+    def detect_table_pages(self, pdf_path: str) -> Optional[List[int]]:
+        """
+        Cheaply flag pages that are likely to contain tables.
+        
+        Uses ruling-line/rectangle density from the page drawings and the
+        column alignment of words. Returns 1-based page numbers, or None when
+        no detector is available and the caller should scan every page.
+        """
+        if processors.is_available("pymupdf"):
+            fitz = processors.load("pymupdf")
+            candidate_pages = []
+            with fitz.open(pdf_path) as doc:
+                for page_num, page in enumerate(doc, start=1):
+                    rulings = self._count_rulings_pymupdf(page.get_drawings())
+                    words = [(w[0], w[1], w[2]) for w in page.get_text("words")]
+                    if self._is_table_candidate(rulings, words):
+                        candidate_pages.append(page_num)
+            return candidate_pages
+        
+        if processors.is_available("pdfplumber"):
+            pdfplumber = processors.load("pdfplumber")
+            candidate_pages = []
+            with pdfplumber.open(pdf_path) as pdf:
+                for page_num, page in enumerate(pdf.pages, start=1):
+                    rulings = self._count_rulings_pdfplumber(page.lines, page.rects)
+                    words = [(w["x0"], w["top"], w["x1"]) for w in page.extract_words()]
+                    if self._is_table_candidate(rulings, words):
+                        candidate_pages.append(page_num)
+            return candidate_pages
+        
+        return None
+    
+    def _count_rulings_pymupdf(self, drawings: List[Dict[str, Any]], tol: float = 1.5) -> Tuple[int, int, int]:
+        """Count horizontal rules, vertical rules and cell rectangles in PyMuPDF drawings."""
+        horizontal = vertical = cells = 0
+        for path in drawings:
+            for item in path.get("items", []):
+                if item[0] == "l":
+                    p1, p2 = item[1], item[2]
+                    if abs(p1.y - p2.y) <= tol and abs(p1.x - p2.x) > tol:
+                        horizontal += 1
+                    elif abs(p1.x - p2.x) <= tol and abs(p1.y - p2.y) > tol:
+                        vertical += 1
+                elif item[0] == "re":
+                    rect = item[1]
+                    if rect.height <= tol < rect.width:
+                        horizontal += 1
+                    elif rect.width <= tol < rect.height:
+                        vertical += 1
+                    elif rect.width > tol and rect.height > tol:
+                        cells += 1
+        return horizontal, vertical, cells
+    
+    def _count_rulings_pdfplumber(
+        self, lines: List[Dict[str, Any]], rects: List[Dict[str, Any]], tol: float = 1.5
+    ) -> Tuple[int, int, int]:
+        """Count horizontal rules, vertical rules and cell rectangles in pdfplumber objects."""
+        horizontal = vertical = cells = 0
+        for line in lines:
+            width, height = abs(line["x1"] - line["x0"]), abs(line["bottom"] - line["top"])
+            if height <= tol < width:
+                horizontal += 1
+            elif width <= tol < height:
+                vertical += 1
+        for rect in rects:
+            width, height = rect["width"], rect["height"]
+            if height <= tol < width:
+                horizontal += 1
+            elif width <= tol < height:
+                vertical += 1
+            elif width > tol and height > tol:
+                cells += 1
+        return horizontal, vertical, cells
+    
+    def _is_table_candidate(
+        self, 
+        rulings: Tuple[int, int, int], 
+        words: List[Tuple[float, float, float]], 
+        min_rows: int = 3, 
+        min_columns: int = 3
+    ) -> bool:
+        """Decide whether ruling counts or word alignment suggest a table on the page."""
+        horizontal, vertical, cells = rulings
+        
+        # Ruled grid: enough crossing lines or cell rectangles for a lattice table
+        if (horizontal >= 3 and vertical >= 2) or cells >= 4:
+            return True
+        
+        # Unruled table: several rows whose cell starts line up in the same columns
+        rows: Dict[int, List[Tuple[float, float]]] = {}
+        for x0, top, x1 in words:
+            rows.setdefault(round(top / 3), []).append((x0, x1))
+        
+        column_hits: Dict[int, int] = {}
+        multi_cell_rows = 0
+        for row_words in rows.values():
+            row_words.sort()
+            cell_starts = [row_words[0][0]]
+            for (_, prev_x1), (x0, _) in zip(row_words, row_words[1:]):
+                if x0 - prev_x1 > 12:  # wider than a normal word gap
+                    cell_starts.append(x0)
+            if len(cell_starts) >= min_columns:
+                multi_cell_rows += 1
+                for x0 in cell_starts:
+                    column_key = round(x0 / 5)
+                    column_hits[column_key] = column_hits.get(column_key, 0) + 1
+        
+        aligned_columns = sum(1 for hits in column_hits.values() if hits >= min_rows)
+        return multi_cell_rows >= min_rows and aligned_columns >= min_columns
+    
+    def _format_page_ranges(self, pages: List[int]) -> str:
+        """Format page numbers as a Camelot page spec, e.g. [1, 2, 3, 7] -> '1-3,7'."""
+        ranges = []
+        for page in sorted(set(pages)):
+            if ranges and page == ranges[-1][1] + 1:
+                ranges[-1][1] = page
+            else:
+                ranges.append([page, page])
+        return ",".join(str(a) if a == b else f"{a}-{b}" for a, b in ranges)
+    
+    def extract_with_camelot(self, pdf_path: str, pages: Optional[List[int]] = None) -> Dict[str, Any]:
+        """
+        Extract tables using Camelot.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            pages: 1-based pages to scan; None scans every page
+        """
+        camelot = processors.load("camelot")
+        
+        if pages is not None and not pages:
+            return {"tables": []}
+        
+        page_spec = self._format_page_ranges(pages) if pages else "all"
         
         try:
             # Extract tables using lattice method (better for tables with lines)
-            tables_lattice = camelot.read_pdf(pdf_path, flavor='lattice', pages='all')
-            
-            # Fallback to stream method if lattice fails
-            tables_stream = camelot.read_pdf(pdf_path, flavor='stream', pages='all')
+            tables_lattice = camelot.read_pdf(pdf_path, flavor='lattice', pages=page_spec)
             
             extracted_tables = []
             
@@ -199,8 +284,9 @@ class PDFStructureExtractor:
                     "markdown": table.df.to_markdown(index=False)
                 })
             
-            # Process stream tables if lattice didn't find enough
+            # Fallback to stream method if lattice didn't find enough
             if len(tables_lattice) < 2:
+                tables_stream = camelot.read_pdf(pdf_path, flavor='stream', pages=page_spec)
                 for table in tables_stream:
                     extracted_tables.append({
                         "method": "stream",
@@ -217,17 +303,16 @@ class PDFStructureExtractor:
         except Exception as e:
             return {"tables": [], "error": str(e)}
     
-    def _is_header(self, font_info: Dict[str, Any], text: str) -> bool:
+    def _is_header(self, size: float, flags: int, text: str) -> bool:
         """Determine if text is likely a header based on font properties."""
         if not text.strip():
             return False
         
         # Check font size (headers typically larger)
-        if font_info.get("size", 0) > 14:
+        if size > 14:
             return True
         
         # Check font flags (bold, italic indicators)
-        flags = font_info.get("flags", 0)
         if flags & 2**4:  # Bold flag
             return True
         
@@ -266,6 +351,7 @@ class EnhancedPDFProcessor:
     
     def __init__(self):
         self.extractor = PDFStructureExtractor()
+        self.ocr = PageOCR() if "ocr" in self.extractor.available_processors else None
         self.processing_stats = {
             "total_processed": 0,
             "successful_extractions": 0,
@@ -278,61 +364,90 @@ class EnhancedPDFProcessor:
         file_name = os.path.basename(pdf_path)
         documents = []
         
-        print(f"\n🔄 Enhanced processing: {file_name}")
+        logger.debug(f"🔄 Enhanced processing: {file_name}")
         
         if not use_enhanced:
             return self._fallback_processing(pdf_path)
         
         # Try PyMuPDF first for structure extraction
         structure_data = None
-        if PYMUPDF_AVAILABLE:
+        if processors.is_available("pymupdf"):
             try:
-                print("   📖 Extracting structure with PyMuPDF...")
-                structure_data = self.extractor.extract_with_pymupdf(pdf_path)
+                logger.debug("   📖 Extracting structure with PyMuPDF...")
+                with telemetry.span("extract.pymupdf", file_name):
+                    structure_data = self.extractor.extract_with_pymupdf(pdf_path)
                 self.processing_stats["processors_used"]["pymupdf"] = \
                     self.processing_stats["processors_used"].get("pymupdf", 0) + 1
-                print(f"   ✅ Extracted {len(structure_data['text_blocks'])} text blocks")
+                logger.debug(f"   ✅ Extracted {len(structure_data['text_blocks'])} text blocks")
+            except Exception as e:
+                logger.warning(f"   ⚠️  PyMuPDF failed on {file_name}: {str(e)}")
+        
+        # OCR pages without a usable text layer (scanned pages)
+        if structure_data and self.ocr:
+            try:
+                with telemetry.span("extract.ocr", file_name):
+                    structure_data["ocr_pages"] = self.ocr.ocr_pdf(pdf_path)
+                telemetry.count("pages.ocr", len(structure_data["ocr_pages"]))
+                if structure_data["ocr_pages"]:
+                    self.processing_stats["processors_used"]["ocr"] = \
+                        self.processing_stats["processors_used"].get("ocr", 0) + 1
+                    logger.debug(f"   ✅ OCRed {len(structure_data['ocr_pages'])} image-only page(s)")
             except Exception as e:
-                error_msg = str(e)
-                if "need item of full page image list" in error_msg:
-                    print(f"   ⚠️  PyMuPDF skipped: Image-heavy PDF, using alternative processors")
-                else:
-                    print(f"   ⚠️  PyMuPDF failed: {error_msg}")
-                print(f"   🔄 Continuing with other processors...")
+                logger.warning(f"   ⚠️  OCR failed on {file_name}: {str(e)}")
         
         # Try pdfplumber for tables and text
         table_data = None
-        if PDFPLUMBER_AVAILABLE:
+        if processors.is_available("pdfplumber"):
             try:
-                print("   📊 Extracting tables with pdfplumber...")
-                table_data = self.extractor.extract_with_pdfplumber(pdf_path)
+                logger.debug("   📊 Extracting tables with pdfplumber...")
+                with telemetry.span("extract.pdfplumber", file_name):
+                    table_data = self.extractor.extract_with_pdfplumber(pdf_path)
                 self.processing_stats["processors_used"]["pdfplumber"] = \
                     self.processing_stats["processors_used"].get("pdfplumber", 0) + 1
-                print(f"   ✅ Extracted {len(table_data['tables'])} tables")
+                logger.debug(f"   ✅ Extracted {len(table_data['tables'])} tables")
             except Exception as e:
-                print(f"   ⚠️  pdfplumber failed: {str(e)}")
+                logger.warning(f"   ⚠️  pdfplumber failed on {file_name}: {str(e)}")
         
         # Try Camelot for advanced table extraction
         camelot_data = None
-        if CAMELOT_AVAILABLE and (not table_data or len(table_data.get("tables", [])) < 2):
+        if processors.is_available("camelot") and (not table_data or len(table_data.get("tables", [])) < 2):
+            # Cheap pre-pass so Camelot only scans pages that look like tables
             try:
-                print("   🔍 Advanced table extraction with Camelot...")
-                camelot_data = self.extractor.extract_with_camelot(pdf_path)
-                self.processing_stats["processors_used"]["camelot"] = \
-                    self.processing_stats["processors_used"].get("camelot", 0) + 1
-                print(f"   ✅ Extracted {len(camelot_data['tables'])} tables")
+                with telemetry.span("extract.detect_table_pages", file_name):
+                    candidate_pages = self.extractor.detect_table_pages(pdf_path)
             except Exception as e:
-                print(f"   ⚠️  Camelot failed: {str(e)}")
+                logger.warning(f"   ⚠️  Table page detection failed on {file_name}: {str(e)}")
+                candidate_pages = None
+            
+            if candidate_pages == []:
+                logger.debug("   ⏭️  No table-like pages detected, skipping Camelot")
+                telemetry.count("files.camelot_skipped")
+            else:
+                try:
+                    page_spec = (
+                        self.extractor._format_page_ranges(candidate_pages)
+                        if candidate_pages else "all"
+                    )
+                    logger.debug(f"   🔍 Advanced table extraction with Camelot (pages: {page_spec})...")
+                    with telemetry.span("extract.camelot", file_name):
+                        camelot_data = self.extractor.extract_with_camelot(pdf_path, pages=candidate_pages)
+                    self.processing_stats["processors_used"]["camelot"] = \
+                        self.processing_stats["processors_used"].get("camelot", 0) + 1
+                    logger.debug(f"   ✅ Extracted {len(camelot_data['tables'])} tables")
+                except Exception as e:
+                    logger.warning(f"   ⚠️  Camelot failed on {file_name}: {str(e)}")
         
         # Combine and structure the extracted data
-        documents = self._combine_extracted_data(
-            pdf_path, structure_data, table_data, camelot_data
-        )
+        with telemetry.span("extract.combine", file_name):
+            documents = self._combine_extracted_data(
+                pdf_path, structure_data, table_data, camelot_data
+            )
         
         # Fallback to unstructured if nothing worked
         if not documents:
-            print("   🔄 Falling back to unstructured processing...")
-            documents = self._fallback_processing(pdf_path)
+            logger.debug("   🔄 Falling back to unstructured processing...")
+            with telemetry.span("extract.fallback", file_name):
+                documents = self._fallback_processing(pdf_path)
         
         self.processing_stats["total_processed"] += 1
         if documents:
@@ -398,40 +513,34 @@ class EnhancedPDFProcessor:
         """Process structured content from PyMuPDF extraction."""
         documents = []
         
-        # Group text blocks by page and structure
-        pages_content = {}
-        
-        for block in structure_data["text_blocks"]:
-            page_num = block["page"]
-            if page_num not in pages_content:
-                pages_content[page_num] = {
-                    "headers": [],
-                    "content": [],
-                    "links": []
-                }
-            
-            if block["is_header"]:
-                pages_content[page_num]["headers"].append(block)
-            else:
-                pages_content[page_num]["content"].append(block)
+        spans = structure_data["text_blocks"]
         
-        # Add links information
+        # Group links by page
+        links_by_page = {}
         for link in structure_data["links"]:
-            page_num = link["page"]
-            if page_num in pages_content:
-                pages_content[page_num]["links"].append(link)
+            links_by_page.setdefault(link["page"], []).append(link)
         
-        # Create documents for each page
-        for page_num, content in pages_content.items():
+        ocr_pages = structure_data.get("ocr_pages", {})
+        
+        # Create documents for each page, slicing its lines straight from the store
+        for page_num, start, end in spans.iter_pages():
+            ocr_text = ocr_pages.get(page_num, "").strip()
+            if start == end and not ocr_text:
+                continue
+            
+            header_idx = [i for i in range(start, end) if spans.is_header[i]]
+            content_idx = [i for i in range(start, end) if not spans.is_header[i]]
+            page_links = links_by_page.get(page_num, [])
+            
             # Build structured content
             page_text_parts = []
             
             # Add headers with markdown formatting
-            for header in content["headers"]:
-                header_text = header["text"].strip()
+            for i in header_idx:
+                header_text = spans.texts[i].strip()
                 if header_text:
                     # Determine header level based on font size
-                    font_size = header["font_info"]["size"]
+                    font_size = spans.sizes[i]
                     if font_size > 18:
                         header_level = "# "
                     elif font_size > 16:
@@ -444,15 +553,19 @@ class EnhancedPDFProcessor:
                     page_text_parts.append(f"{header_level}{header_text}")
             
             # Add regular content
-            for text_block in content["content"]:
-                text = text_block["text"].strip()
+            for i in content_idx:
+                text = spans.texts[i].strip()
                 if text:
                     page_text_parts.append(text)
             
+            # Add text recognized on scanned pages
+            if ocr_text:
+                page_text_parts.append(ocr_text)
+            
             # Add links section if present
-            if content["links"]:
+            if page_links:
                 page_text_parts.append("\n## Links Found:")
-                for link in content["links"]:
+                for link in page_links:
                     if link["uri"]:
                         page_text_parts.append(f"- [{link['uri']}]({link['uri']})")
             
@@ -466,11 +579,11 @@ class EnhancedPDFProcessor:
                         "source": pdf_path,
                         "file_name": file_name,
                         "page": page_num,
-                        "processor": "pymupdf_structured",
+                        "processor": "pymupdf_ocr" if ocr_text else "pymupdf_structured",
                         "content_type": "structured_page",
                         "char_count": len(page_content),
-                        "headers_count": len(content["headers"]),
-                        "links_count": len(content["links"]),
+                        "headers_count": len(header_idx),
+                        "links_count": len(page_links),
                         "has_structure": True
                     }
                 )
@@ -529,8 +642,9 @@ class EnhancedPDFProcessor:
         file_name = os.path.basename(pdf_path)
         
         # Try unstructured first
-        if UNSTRUCTURED_AVAILABLE:
+        if processors.is_available("unstructured"):
             try:
+                partition_pdf = processors.load("unstructured").partition_pdf
                 elements = partition_pdf(
                     filename=pdf_path,
                     strategy="fast",
@@ -560,7 +674,7 @@ class EnhancedPDFProcessor:
                 return documents
                 
             except Exception as e:
-                print(f"   ⚠️  Unstructured fallback failed: {str(e)}")
+                logger.warning(f"   ⚠️  Unstructured fallback failed: {str(e)}")
         
         # Final fallback to PyPDFLoader
         try:
@@ -579,16 +693,106 @@ class EnhancedPDFProcessor:
             return fallback_docs
             
         except Exception as e:
-            print(f"   ❌ Final fallback failed: {str(e)}")
+            logger.warning(f"   ❌ Final fallback failed: {str(e)}")
             return []
 
-def load_pdf_documents(directory_path, use_enhanced_processing=True):
+def get_extraction_cache(use_enhanced_processing=True, cache_dir=None):
+    """Extraction cache keyed on the extractor version, the processors installed here and the OCR settings."""
+    processors = ",".join(PDFStructureExtractor().available_processors)
+    mode = "enhanced" if use_enhanced_processing else "basic"
+    ocr = f"ocr-{Config.OCR_LANG}-{Config.OCR_DPI}dpi-{Config.OCR_MIN_TEXT_CHARS}"
+    return ExtractionCache(
+        cache_dir or Config.EXTRACTION_CACHE_DIR,
+        extractor_signature=f"v{EXTRACTOR_VERSION}|{mode}|{processors}|{ocr}"
+    )
+
+def _extract_pdf(processor, pdf_file, use_enhanced_processing, cache=None):
+    """Extract one PDF, serving and filling the extraction cache when given."""
+    file_name = os.path.basename(pdf_file)
+    if cache is not None:
+        with telemetry.span("cache_lookup", file_name):
+            cached_documents = cache.get(pdf_file)
+        if cached_documents is not None:
+            telemetry.count("files.cached")
+            telemetry.count("documents.extracted", len(cached_documents))
+            logger.debug(f"   ⚡ Loaded {len(cached_documents)} documents from extraction cache")
+            return cached_documents
+    
+    with telemetry.span("extract", file_name):
+        if use_enhanced_processing:
+            file_documents = processor.process_pdf(pdf_file, use_enhanced=True)
+        else:
+            file_documents = processor._fallback_processing(pdf_file)
+    telemetry.count("files.extracted")
+    telemetry.count("documents.extracted", len(file_documents))
+    
+    if cache is not None and file_documents:
+        cache.put(pdf_file, file_documents)
+    return file_documents
+
+def find_pdf_files(directory_path):
+    """List the PDF files in a directory in a stable order."""
+    return sorted(glob.glob(os.path.join(directory_path, "*.pdf")))
+
+def collection_namespace(name):
+    """Index namespace for a source collection (sub-directory) name."""
+    return re.sub(r"[^a-z0-9_-]+", "-", name.lower()).strip("-")
+
+_skipped_collections = set()
+
+def _report_skipped_collection(path, reason):
+    """Log a skipped collection directory once per process (the watch daemon rescans every few seconds)."""
+    if (path, reason) not in _skipped_collections:
+        _skipped_collections.add((path, reason))
+        logger.error(f"❌ Skipping collection {path}: {reason}")
+
+def find_collections(directory_path):
+    """
+    Group the corpus into source collections, one index namespace each.
+    
+    PDFs directly in the directory form the default collection (namespace "");
+    each sub-directory holding PDFs is a collection of its own. Directories
+    whose namespace is empty, reserved for a blue/green serving slot, or
+    already taken by another directory (names differing only in case or
+    punctuation) are skipped with an error.
+    
+    Returns:
+        Mapping of namespace to the collection's PDF files
+    """
+    collections = {}
+    if not os.path.isdir(directory_path):
+        return collections
+    top_level = find_pdf_files(directory_path)
+    if top_level:
+        collections[""] = top_level
+    owners = {}
+    for entry in sorted(os.scandir(directory_path), key=lambda entry: entry.name):
+        if not entry.is_dir() or entry.name.startswith("."):
+            continue
+        pdf_files = find_pdf_files(entry.path)
+        if not pdf_files:
+            continue
+        namespace = collection_namespace(entry.name)
+        if not namespace:
+            _report_skipped_collection(entry.path, "its name gives no usable namespace")
+        elif is_slot_namespace(namespace):
+            _report_skipped_collection(entry.path, f"namespace '{namespace}' is reserved for blue/green serving slots")
+        elif namespace in owners:
+            _report_skipped_collection(entry.path, f"namespace '{namespace}' is already used by {owners[namespace]}")
+        else:
+            owners[namespace] = entry.path
+            collections[namespace] = pdf_files
+    return collections
+
+def load_pdf_documents(directory_path, use_enhanced_processing=True, pdf_files=None, cache=None):
     """
     Load PDF documents with enhanced processing capabilities.
     
     Args:
         directory_path: Directory containing PDF files
         use_enhanced_processing: Whether to use multi-library enhanced processing
+        pdf_files: Specific PDF files to load instead of every PDF in the directory
+        cache: Optional ExtractionCache to reuse extraction results of unchanged files
     
     Returns:
         List of Document objects with extracted content and metadata
@@ -596,68 +800,68 @@ def load_pdf_documents(directory_path, use_enhanced_processing=True):
     documents = []
     
     # Find all PDF files in directory
-    pdf_files = glob.glob(os.path.join(directory_path, "*.pdf"))
+    if pdf_files is None:
+        pdf_files = find_pdf_files(directory_path)
     
-    print("\n" + "="*80)
-    print("📁 ENHANCED PDF DOCUMENT PROCESSING")
-    print("="*80)
+    logger.info("\n" + "="*80)
+    logger.info("📁 ENHANCED PDF DOCUMENT PROCESSING")
+    logger.info("="*80)
     
     if not pdf_files:
-        print(f"ℹ️  No PDF files found in {directory_path}")
+        logger.info(f"ℹ️  No PDF files found in {directory_path}")
         return documents
     
     # Show available processors
     processor = EnhancedPDFProcessor()
     available_processors = processor.extractor.available_processors
     
-    print(f"🔧 Available processors: {', '.join(available_processors)}")
-    print(f"📊 Found {len(pdf_files)} PDF file(s) to process:")
-    for i, pdf_file in enumerate(pdf_files, 1):
-        print(f"   {i}. {os.path.basename(pdf_file)}")
+    logger.info(f"🔧 Available processors: {', '.join(available_processors)}")
+    logger.info(f"📊 Found {len(pdf_files)} PDF file(s) to process")
+    logger.info(f"🎛️  Processing mode: {'Enhanced' if use_enhanced_processing else 'Basic'}")
+    logger.info("=" * 80)
     
-    print(f"\n🎛️  Processing mode: {'Enhanced' if use_enhanced_processing else 'Basic'}")
-    print("=" * 80)
+    progress = RateLimitedLog()
     
     # Process each PDF file
-    for pdf_file in pdf_files:
+    for i, pdf_file in enumerate(pdf_files, 1):
         file_name = os.path.basename(pdf_file)
-        file_size = os.path.getsize(pdf_file) / 1024  # KB
-        
-        print(f"\n📄 Processing: {file_name}")
-        print(f"   📍 Path: {pdf_file}")
-        print(f"   📏 Size: {file_size:.1f} KB")
+        logger.debug(f"\n📄 Processing: {file_name} ({os.path.getsize(pdf_file) / 1024:.1f} KB)")
         
         try:
             # Use enhanced processing or fallback
-            if use_enhanced_processing:
-                file_documents = processor.process_pdf(pdf_file, use_enhanced=True)
-            else:
-                file_documents = processor._fallback_processing(pdf_file)
+            file_documents = _extract_pdf(processor, pdf_file, use_enhanced_processing, cache)
             
             if file_documents:
                 documents.extend(file_documents)
-                print(f"   ✅ Successfully extracted {len(file_documents)} document chunks")
-                
-                # Show content type breakdown for this file
-                content_types = {}
-                for doc in file_documents:
-                    content_type = doc.metadata.get('content_type', 'unknown')
-                    content_types[content_type] = content_types.get(content_type, 0) + 1
-                
-                print(f"   📊 Content breakdown: {dict(content_types)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    content_types = {}
+                    for doc in file_documents:
+                        content_type = doc.metadata.get('content_type', 'unknown')
+                        content_types[content_type] = content_types.get(content_type, 0) + 1
+                    logger.debug(f"   ✅ Extracted {len(file_documents)} documents: {content_types}")
             else:
-                print(f"   ❌ No content extracted from {file_name}")
+                telemetry.count("files.empty")
+                logger.warning(f"   ❌ No content extracted from {file_name}")
                 
         except Exception as e:
-            print(f"   ❌ Processing failed: {str(e)}")
+            telemetry.count("files.failed")
+            logger.warning(f"   ❌ Processing {file_name} failed: {str(e)}")
+        
+        progress(f"   📄 {i}/{len(pdf_files)} files, {len(documents)} documents")
     
-    # Generate comprehensive summary
-    print("\n" + "="*80)
-    print("📊 ENHANCED PROCESSING SUMMARY")
-    print("="*80)
+    # The summary walks every document, so only build it when it will be shown
+    if logger.isEnabledFor(logging.INFO):
+        _log_processing_summary(processor, pdf_files, documents, cache)
+    return documents
+
+def _log_processing_summary(processor, pdf_files, documents, cache=None):
+    """Log the corpus-wide processor / content type breakdown of load_pdf_documents."""
+    logger.info("\n" + "="*80)
+    logger.info("📊 ENHANCED PROCESSING SUMMARY")
+    logger.info("="*80)
     
-    print(f"📁 Total files processed: {len(pdf_files)}")
-    print(f"📄 Total document chunks: {len(documents)}")
+    logger.info(f"📁 Total files processed: {len(pdf_files)}")
+    logger.info(f"📄 Total document chunks: {len(documents)}")
     
     if documents:
         # Processor statistics
@@ -683,24 +887,59 @@ def load_pdf_documents(directory_path, use_enhanced_processing=True):
             if doc.metadata.get('has_structure', False):
                 structured_content += 1
         
-        print(f"💾 Total characters: {total_chars:,}")
-        print(f"📊 Processor breakdown:")
+        logger.info(f"💾 Total characters: {total_chars:,}")
+        logger.info(f"📊 Processor breakdown:")
         for proc, count in processors.items():
             percentage = (count / len(documents)) * 100
-            print(f"   • {proc}: {count} chunks ({percentage:.1f}%)")
+            logger.info(f"   • {proc}: {count} chunks ({percentage:.1f}%)")
         
-        print(f"📋 Content type breakdown:")
+        logger.info(f"📋 Content type breakdown:")
         for content_type, count in content_types.items():
             percentage = (count / len(documents)) * 100
-            print(f"   • {content_type}: {count} chunks ({percentage:.1f}%)")
+            logger.info(f"   • {content_type}: {count} chunks ({percentage:.1f}%)")
         
-        print(f"🔍 Enhanced features:")
-        print(f"   📊 Tables extracted: {tables_found}")
-        print(f"   🏗️  Structured content: {structured_content}")
-        print(f"   🎯 Processing success rate: {(processor.processing_stats['successful_extractions'] / max(1, processor.processing_stats['total_processed'])) * 100:.1f}%")
+        logger.info(f"🔍 Enhanced features:")
+        logger.info(f"   📊 Tables extracted: {tables_found}")
+        logger.info(f"   🏗️  Structured content: {structured_content}")
+        logger.info(f"   🎯 Processing success rate: {(processor.processing_stats['successful_extractions'] / max(1, processor.processing_stats['total_processed'])) * 100:.1f}%")
     
-    print("="*80 + "\n")
-    return documents
+    if cache is not None:
+        hits, misses = cache.stats()
+        logger.info(f"⚡ Extraction cache: {hits} hit(s), {misses} miss(es)")
+    
+    logger.info("="*80 + "\n")
+
+def iter_pdf_documents(pdf_files, use_enhanced_processing=True, processor=None, cache=None):
+    """
+    Lazily load PDF documents one file at a time.
+    
+    Streaming counterpart of load_pdf_documents: only the current file's
+    documents are held in memory, and no corpus-wide summary is built.
+    
+    Args:
+        pdf_files: PDF file paths to process, in order
+        use_enhanced_processing: Whether to use multi-library enhanced processing
+        processor: Optional EnhancedPDFProcessor to reuse (and collect stats on)
+        cache: Optional ExtractionCache to reuse extraction results of unchanged files
+    
+    Yields:
+        Document objects, file by file
+    """
+    processor = processor or EnhancedPDFProcessor()
+    
+    for pdf_file in pdf_files:
+        try:
+            file_documents = _extract_pdf(processor, pdf_file, use_enhanced_processing, cache)
+        except Exception as e:
+            telemetry.count("files.failed")
+            logger.warning(f"   ❌ Processing {os.path.basename(pdf_file)} failed: {str(e)}")
+            continue
+        
+        if not file_documents:
+            telemetry.count("files.empty")
+            logger.warning(f"   ❌ No content extracted from {os.path.basename(pdf_file)}")
+        
+        yield from file_documents
 
 def split_documents(documents, chunk_size=500, chunk_overlap=20):
     """Split documents into text chunks based on chunk size."""
@@ -0,0 +1,228 @@
+"""
+Ingestion manifest for incremental re-indexing.
+
+The manifest records a content hash per source file and per chunk, and derives
+deterministic vector IDs from them. Re-running ingestion then only embeds and
+upserts chunks that are new or changed, and deletes vectors whose chunks
+disappeared, instead of re-embedding (and duplicating) the whole corpus.
+"""
+
+import glob
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from langchain.schema.document import Document
+
+MANIFEST_VERSION = 1
+
+
+def list_namespaces(base_path: str) -> List[str]:
+    """
+    Namespaces with a manifest next to base_path ("" is the default namespace).
+
+    Namespace manifests are named like base_path with "@<namespace>" before the
+    extension (Config.namespace_path).
+    """
+    root, ext = os.path.splitext(base_path)
+    prefix = f"{os.path.basename(root)}@"
+    namespaces = [""] if os.path.exists(base_path) else []
+    for path in sorted(glob.glob(f"{glob.escape(root)}@*{glob.escape(ext)}")):
+        name = os.path.basename(path)
+        namespaces.append(name[len(prefix):len(name) - len(ext)])
+    return namespaces
+
+
+def compute_file_hash(file_path: str, block_size: int = 1 << 20) -> str:
+    """Compute the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def compute_chunk_hash(text: str) -> str:
+    """Compute the SHA-256 hex digest of a chunk's text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def make_vector_id(source: str, chunk_hash: str, occurrence: int = 0) -> str:
+    """
+    Derive a stable vector ID from the chunk's source file and content hash.
+
+    Identical chunks within one file are told apart by their occurrence index.
+    """
+    file_key = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+    vector_id = f"{file_key}-{chunk_hash[:32]}"
+    return f"{vector_id}-{occurrence}" if occurrence else vector_id
+
+
+def iter_vector_ids(chunks: Iterable[Document]) -> Iterator[Tuple[str, Document]]:
+    """Lazily pair each chunk with its deterministic vector ID."""
+    seen: Dict[str, int] = {}
+    for chunk in chunks:
+        source = chunk.metadata.get("source", "unknown")
+        chunk_hash = compute_chunk_hash(chunk.page_content)
+        occurrence_key = f"{source}\0{chunk_hash}"
+        occurrence = seen.get(occurrence_key, 0)
+        seen[occurrence_key] = occurrence + 1
+        yield make_vector_id(source, chunk_hash, occurrence), chunk
+
+
+def assign_vector_ids(chunks: Iterable[Document]) -> List[Tuple[str, Document]]:
+    """Pair each chunk with its deterministic vector ID."""
+    return list(iter_vector_ids(chunks))
+
+
+@dataclass
+class FileDiff:
+    """Files grouped by how they changed since the last recorded run."""
+    new: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    file_hashes: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def to_process(self) -> List[str]:
+        return self.new + self.changed
+
+    def exclude(self, paths: Iterable[str]) -> None:
+        """
+        Drop files that could not be processed (extraction failed or yielded nothing).
+
+        They are neither planned nor recorded, so their existing vectors and
+        manifest entries stay as they are and the next run retries them.
+        """
+        excluded = set(paths)
+        self.new = [path for path in self.new if path not in excluded]
+        self.changed = [path for path in self.changed if path not in excluded]
+        for path in excluded:
+            self.file_hashes.pop(path, None)
+
+
+@dataclass
+class ChunkDiff:
+    """Vector operations needed to bring the index in line with the corpus."""
+    to_upsert: List[Tuple[str, Document]] = field(default_factory=list)
+    to_delete: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+
+class IngestionManifest:
+    """Persistent record of indexed files, their hashes and their vector IDs."""
+
+    def __init__(self, path: str, data: Dict = None):
+        self.path = path
+        self.data = data or {"version": MANIFEST_VERSION, "signature": None, "files": {}}
+
+    @classmethod
+    def load(cls, path: str) -> "IngestionManifest":
+        """Load the manifest from disk, or start an empty one."""
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                return cls(path, data)
+        return cls(path)
+
+    def save(self) -> None:
+        """Atomically write the manifest to disk."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    @property
+    def files(self) -> Dict[str, Dict]:
+        return self.data["files"]
+
+    def clear(self) -> None:
+        """Forget every recorded file (the index was emptied, so nothing in it is unchanged)."""
+        self.data["files"] = {}
+
+    def diff_files(self, pdf_files: List[str], signature: str, force: bool = False) -> FileDiff:
+        """
+        Compare files on disk against the manifest.
+
+        Args:
+            pdf_files: Paths of the PDF files currently in the corpus
+            signature: Processing/chunking settings; a different value invalidates every file
+            force: Treat every file as changed (full rebuild with stable IDs)
+        """
+        diff = FileDiff()
+        invalidate_all = force or self.data.get("signature") != signature
+
+        for pdf_file in sorted(pdf_files):
+            file_hash = compute_file_hash(pdf_file)
+            diff.file_hashes[pdf_file] = file_hash
+            entry = self.files.get(pdf_file)
+            if entry is None:
+                diff.new.append(pdf_file)
+            elif invalidate_all or entry["file_hash"] != file_hash:
+                diff.changed.append(pdf_file)
+            else:
+                diff.unchanged.append(pdf_file)
+
+        current = set(pdf_files)
+        diff.deleted = sorted(path for path in self.files if path not in current)
+        return diff
+
+    def plan_chunks(self, file_diff: FileDiff, chunks: List[Document], reupsert: bool = False) -> ChunkDiff:
+        """
+        Work out which vectors to upsert and delete for the processed files.
+
+        With reupsert, chunks already in the index are upserted again (their
+        payload changed, or the index was emptied).
+        """
+        plan = ChunkDiff()
+
+        new_ids_by_file: Dict[str, set] = {path: set() for path in file_diff.to_process}
+        old_ids = set() if reupsert else {
+            vector_id for path in new_ids_by_file for vector_id in self.chunk_ids_for(path)
+        }
+        for vector_id, chunk in assign_vector_ids(chunks):
+            source = chunk.metadata.get("source", "unknown")
+            new_ids_by_file.setdefault(source, set()).add(vector_id)
+            if vector_id in old_ids:
+                plan.unchanged += 1
+            else:
+                plan.to_upsert.append((vector_id, chunk))
+
+        for path, new_ids in new_ids_by_file.items():
+            plan.to_delete.extend(sorted(self.chunk_ids_for(path) - new_ids))
+        for path in file_diff.deleted:
+            plan.to_delete.extend(self.files[path]["chunk_ids"])
+
+        return plan
+
+    def record(self, file_diff: FileDiff, chunks: List[Document], signature: str) -> None:
+        """Record the processed files and their vector IDs after a successful run."""
+        ids_by_file: Dict[str, List[str]] = {path: [] for path in file_diff.to_process}
+        for vector_id, chunk in assign_vector_ids(chunks):
+            ids_by_file.setdefault(chunk.metadata.get("source", "unknown"), []).append(vector_id)
+
+        for path, chunk_ids in ids_by_file.items():
+            self.record_file(path, file_diff.file_hashes.get(path, ""), chunk_ids)
+        for path in file_diff.deleted:
+            self.remove_file(path)
+        self.data["signature"] = signature
+
+    def record_file(self, path: str, file_hash: str, chunk_ids: List[str]) -> None:
+        """Record one file's hash and the vector IDs of its chunks."""
+        self.files[path] = {"file_hash": file_hash, "chunk_ids": list(chunk_ids)}
+
+    def remove_file(self, path: str) -> None:
+        """Forget a file that is no longer part of the corpus."""
+        self.files.pop(path, None)
+
+    def chunk_ids_for(self, path: str) -> set:
+        """Vector IDs recorded for a file (empty if the file is unknown)."""
+        entry = self.files.get(path)
+        return set(entry["chunk_ids"]) if entry else set()
@@ -0,0 +1,153 @@
+"""
+Page-level OCR for scanned PDFs.
+
+Only pages without a usable text layer are OCRed: they are rasterized with
+PyMuPDF at a configurable DPI and recognized with Tesseract in a process pool.
+Results are cached per page fingerprint (page content plus embedded image
+streams), so re-running ingestion on an unchanged scan does not OCR it again.
+"""
+
+import hashlib
+import io
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Optional
+
+from config.settings import Config
+from src.utils import processors
+
+# pytesseract/Pillow and PyMuPDF are imported on first use
+PYMUPDF_AVAILABLE = processors.is_available("pymupdf")
+OCR_AVAILABLE = processors.is_available("ocr")
+
+
+def ocr_image_bytes(png_bytes: bytes, lang: str = "eng") -> str:
+    """Run Tesseract on a PNG image (module-level so it can run in worker processes)."""
+    pytesseract = processors.load("ocr")
+    from PIL import Image
+    with Image.open(io.BytesIO(png_bytes)) as image:
+        return pytesseract.image_to_string(image, lang=lang)
+
+
+def page_needs_ocr(page, min_text_chars: int = Config.OCR_MIN_TEXT_CHARS) -> bool:
+    """Whether a page carries images but (almost) no extractable text."""
+    if len(page.get_text("text").strip()) >= min_text_chars:
+        return False
+    return bool(page.get_images(full=True))
+
+
+def page_fingerprint(doc, page) -> str:
+    """Hash of a page's content stream and embedded images, independent of the file."""
+    digest = hashlib.sha256()
+    digest.update(page.read_contents())
+    for img in page.get_images(full=True):
+        digest.update(doc.xref_stream_raw(img[0]) or b"")
+    return digest.hexdigest()
+
+
+class PageOCR:
+    """OCR the image-only pages of PDFs in parallel, caching text per page."""
+
+    def __init__(
+        self,
+        dpi: int = Config.OCR_DPI,
+        workers: int = Config.OCR_WORKERS,
+        lang: str = Config.OCR_LANG,
+        min_text_chars: int = Config.OCR_MIN_TEXT_CHARS,
+        cache_dir: Optional[str] = Config.OCR_CACHE_DIR,
+    ):
+        """
+        Args:
+            dpi: Rasterization resolution for OCR
+            workers: OCR worker processes (0 = one per CPU)
+            lang: Tesseract language(s), e.g. "eng" or "eng+ind"
+            min_text_chars: Pages with fewer extractable characters are OCRed
+            cache_dir: Directory for per-page OCR results (None disables caching)
+        """
+        self.dpi = dpi
+        self.workers = workers or os.cpu_count() or 1
+        self.lang = lang
+        self.min_text_chars = min_text_chars
+        self.cache_dir = cache_dir
+        self.pages_ocred = 0
+        self.cache_hits = 0
+
+    def ocr_pdf(self, pdf_path: str) -> Dict[int, str]:
+        """
+        OCR the pages of a PDF that have no usable text layer.
+
+        Returns:
+            Mapping of 1-based page number to recognized text
+        """
+        if not (processors.is_available("ocr") and processors.is_available("pymupdf")):
+            return {}
+        fitz = processors.load("pymupdf")
+
+        results: Dict[int, str] = {}
+        pending = {}
+        pool = None
+
+        try:
+            with fitz.open(pdf_path) as doc:
+                for page in doc:
+                    if not page_needs_ocr(page, self.min_text_chars):
+                        continue
+
+                    page_num = page.number + 1
+                    cache_key = self._cache_key(page_fingerprint(doc, page))
+                    cached = self._cache_get(cache_key)
+                    if cached is not None:
+                        self.cache_hits += 1
+                        results[page_num] = cached
+                        continue
+
+                    # Bound the rendered pages held in memory to a few per worker
+                    while len(pending) >= 2 * self.workers:
+                        self._collect(wait(pending, return_when=FIRST_COMPLETED).done, pending, results)
+
+                    if pool is None:
+                        pool = ProcessPoolExecutor(max_workers=self.workers)
+                    png_bytes = page.get_pixmap(dpi=self.dpi).tobytes("png")
+                    pending[pool.submit(ocr_image_bytes, png_bytes, self.lang)] = (page_num, cache_key)
+
+            self._collect(list(pending), pending, results)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        return dict(sorted(results.items()))
+
+    def _collect(self, futures, pending, results: Dict[int, str]) -> None:
+        for future in futures:
+            page_num, cache_key = pending.pop(future)
+            text = future.result()
+            self.pages_ocred += 1
+            results[page_num] = text
+            self._cache_put(cache_key, text)
+
+    # Per-page cache ----------------------------------------------------------
+
+    def _cache_key(self, fingerprint: str) -> str:
+        return hashlib.sha256(f"{fingerprint}:{self.dpi}:{self.lang}".encode("utf-8")).hexdigest()
+
+    def _cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.txt")
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._cache_path(key), "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _cache_put(self, key: str, text: str) -> None:
+        if not self.cache_dir:
+            return
+        path = self._cache_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp.{os.getpid()}"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
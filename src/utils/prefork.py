@@ -0,0 +1,235 @@
+"""
+Pre-fork WSGI server: one master, N forked worker processes sharing a listening socket.
+
+Whatever the master has loaded before forking (library code, the intent
+vocabulary, a local vector snapshot) is inherited copy-on-write, so N
+workers do not hold N copies of it. gc.freeze() moves those objects out of
+the collector's generations; otherwise the first full collection in each
+worker would touch their headers and un-share the pages. Objects that own
+sockets or threads (HTTP/gRPC clients, SQLite connections) must be created
+in each worker by the init_worker callback instead.
+
+Workers serve requests on threads (handlers mostly wait on OpenAI) and are
+recycled after max_requests (plus jitter) to bound slow memory growth; the
+master replaces any worker that exits. SIGTERM/SIGINT stop the server
+gracefully, SIGHUP recycles every worker.
+"""
+
+import gc
+import logging
+import os
+import random
+import signal
+import socket
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from werkzeug.serving import WSGIRequestHandler, make_server
+from werkzeug.wsgi import ClosingIterator
+
+from src.utils.telemetry import logger
+
+
+def _read_memory_kb(pid: int) -> Dict[str, int]:
+    """Rss, Pss and private memory of a process in KB (Linux; empty elsewhere)."""
+    memory = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name in ("Rss", "Pss", "Private_Clean", "Private_Dirty"):
+                    memory[name] = int(value.split()[0])
+    except OSError:
+        return {}
+    memory["Private"] = memory.pop("Private_Clean", 0) + memory.pop("Private_Dirty", 0)
+    return memory
+
+
+class _RequestHandler(WSGIRequestHandler):
+    """Access log lines at DEBUG through the ingest logger instead of werkzeug's stderr output."""
+
+    def log_request(self, code="-", size="-") -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{self.address_string()} {self.requestline} {code}")
+
+
+class _WorkerApp:
+    """WSGI wrapper counting requests and tracking the ones still in flight."""
+
+    def __init__(self, app: Callable, max_requests: int, on_limit: Callable[[], None]):
+        self.app = app
+        self.max_requests = max_requests
+        self.on_limit = on_limit
+        self.served = 0
+        self.active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        with self._lock:
+            self.served += 1
+            self.active += 1
+            limit_reached = self.max_requests and self.served == self.max_requests
+        if limit_reached:
+            self.on_limit()
+        try:
+            return ClosingIterator(self.app(environ, start_response), [self._finished])
+        except BaseException:
+            self._finished()
+            raise
+
+    def _finished(self) -> None:
+        with self._lock:
+            self.active -= 1
+
+
+class PreforkServer:
+    """Fork workers serving a WSGI app from one listening socket and keep them running."""
+
+    def __init__(
+        self,
+        app: Callable,
+        host: str = "0.0.0.0",
+        port: int = 5000,
+        workers: int = 0,
+        max_requests: int = 0,
+        max_requests_jitter: int = 0,
+        graceful_timeout: float = 30.0,
+        init_worker: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Args:
+            app: WSGI application, fully loaded in the master
+            host: Interface to bind
+            port: Port to bind (0 picks a free one; see self.port)
+            workers: Worker processes (0 = one per CPU)
+            max_requests: Requests after which a worker is replaced (0 = never)
+            max_requests_jitter: Random extra requests per worker, so workers do not restart together
+            graceful_timeout: Seconds a stopping worker waits for in-flight requests
+            init_worker: Called in each worker after forking, before serving
+        """
+        self.app = app
+        self.host = host
+        self.workers = workers or os.cpu_count() or 1
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.graceful_timeout = graceful_timeout
+        self.init_worker = init_worker
+        self.pids: Dict[int, float] = {}  # pid -> start time
+
+        self.socket = socket.create_server((host, port), backlog=2048)
+        # Workers race for connections; whoever loses gets EAGAIN instead of blocking
+        self.socket.setblocking(False)
+        self.port = self.socket.getsockname()[1]
+        self._stopping = False
+        self._recycle = False
+
+    def serve_forever(self) -> None:
+        """Fork the workers and supervise them until SIGTERM/SIGINT."""
+        gc.collect()
+        gc.freeze()
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGHUP, self._handle_recycle)
+        logger.info(f"🚀 Serving on http://{self.host}:{self.port} with {self.workers} worker(s) "
+                    f"(master pid {os.getpid()})")
+
+        try:
+            while not self._stopping:
+                if self._recycle:
+                    self._recycle = False
+                    logger.info("🔁 Recycling all workers")
+                    self._signal_workers(signal.SIGTERM)
+                self._reap()
+                while len(self.pids) < self.workers and not self._stopping:
+                    self._spawn()
+                time.sleep(0.2)
+        finally:
+            self._signal_workers(signal.SIGTERM)
+            deadline = time.monotonic() + self.graceful_timeout + 5
+            while self.pids and time.monotonic() < deadline:
+                self._reap()
+                time.sleep(0.1)
+            self._signal_workers(signal.SIGKILL)
+            self.socket.close()
+
+    def worker_memory(self) -> Dict[int, Dict[str, int]]:
+        """Memory of each live worker (KB), keyed by pid."""
+        return {pid: _read_memory_kb(pid) for pid in list(self.pids)}
+
+    def _handle_stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    def _handle_recycle(self, signum, frame) -> None:
+        self._recycle = True
+
+    def _signal_workers(self, signum: int) -> None:
+        for pid in list(self.pids):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                self.pids.pop(pid, None)
+
+    def _reap(self) -> None:
+        while self.pids:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.pids.clear()
+                return
+            if pid == 0:
+                return
+            started = self.pids.pop(pid, None)
+            if started is not None and os.waitstatus_to_exitcode(status) != 0 and not self._stopping:
+                logger.warning(f"⚠️  Worker {pid} exited with status {os.waitstatus_to_exitcode(status)} "
+                               f"after {time.monotonic() - started:.0f}s")
+                if time.monotonic() - started < 1:
+                    time.sleep(1)  # Do not spin on a worker that crashes at startup
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid:
+            self.pids[pid] = time.monotonic()
+            return
+        status = 0
+        try:
+            self._run_worker()
+        except BaseException as e:
+            logger.error(f"❌ Worker {os.getpid()} failed: {e}")
+            status = 1
+        finally:
+            os._exit(status)
+
+    def _run_worker(self) -> None:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C reaches the master, which stops us
+        signal.signal(signal.SIGHUP, signal.SIG_DFL)
+        random.seed()
+        if self.init_worker is not None:
+            self.init_worker()
+
+        max_requests = self.max_requests
+        if max_requests and self.max_requests_jitter:
+            max_requests += random.randint(0, self.max_requests_jitter)
+
+        server = None
+        stop = threading.Event()
+
+        def shutdown():
+            if not stop.is_set():
+                stop.set()
+                threading.Thread(target=server.shutdown, daemon=True).start()
+
+        worker_app = _WorkerApp(self.app, max_requests, shutdown)
+        server = make_server(
+            self.host, self.port, worker_app, threaded=True, request_handler=_RequestHandler,
+            fd=self.socket.fileno()
+        )
+        signal.signal(signal.SIGTERM, lambda signum, frame: shutdown())
+        logger.debug(f"👷 Worker {os.getpid()} started")
+
+        server.serve_forever(poll_interval=0.5)
+        deadline = time.monotonic() + self.graceful_timeout
+        while worker_app.active and time.monotonic() < deadline:
+            time.sleep(0.05)
+        logger.debug(f"👋 Worker {os.getpid()} exiting after {worker_app.served} request(s)")
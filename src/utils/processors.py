@@ -0,0 +1,97 @@
+"""
+Registry of the optional PDF processing libraries, imported on first use.
+
+PyMuPDF, pdfplumber, Camelot (OpenCV + pandas), unstructured and
+Tesseract cost seconds of import time and hundreds of MB together, and most
+runs need only some of them. Each processor lists the modules it needs;
+is_available() probes them with importlib.util.find_spec (locating the
+package without executing it), and load() imports them the first time an
+extractor actually runs. A processor whose import fails is reported
+unavailable from then on.
+"""
+
+import importlib
+import importlib.util
+import shutil
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class LazyProcessor:
+    """An optional library (or group of libraries) imported on first use."""
+
+    def __init__(self, name: str, modules: Tuple[str, ...], check: Optional[Callable[[], bool]] = None):
+        """
+        Args:
+            name: Processor name as listed in available_processors
+            modules: Modules to import; load() returns the first one
+            check: Extra availability test run after the modules are found (e.g. a binary on PATH)
+        """
+        self.name = name
+        self.modules = modules
+        self.check = check
+        self._available: Optional[bool] = None
+        self._module = None
+        self._lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        """Whether the modules can be found, without importing them."""
+        if self._available is None:
+            try:
+                found = all(importlib.util.find_spec(module.split(".")[0]) is not None for module in self.modules)
+            except (ImportError, ValueError):
+                found = False
+            self._available = found and (self.check is None or self.check())
+        return self._available
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self):
+        """Import the modules (once) and return the first; raises ImportError if unavailable."""
+        if self._module is not None:
+            return self._module
+        with self._lock:
+            if self._module is None:
+                if not self.is_available():
+                    raise ImportError(f"{self.name} not available")
+                try:
+                    modules = [importlib.import_module(module) for module in self.modules]
+                except ImportError:
+                    self._available = False
+                    raise
+                self._module = modules[0]
+        return self._module
+
+
+def _tesseract_installed() -> bool:
+    # pytesseract's default command; checked on PATH without importing pytesseract
+    return shutil.which("tesseract") is not None
+
+
+PROCESSORS: Dict[str, LazyProcessor] = {
+    processor.name: processor
+    for processor in (
+        LazyProcessor("pymupdf", ("fitz",)),
+        LazyProcessor("pdfplumber", ("pdfplumber",)),
+        LazyProcessor("camelot", ("camelot",)),
+        LazyProcessor("unstructured", ("unstructured.partition.pdf",)),
+        LazyProcessor("ocr", ("pytesseract", "PIL.Image"), check=_tesseract_installed),
+    )
+}
+
+
+def is_available(name: str) -> bool:
+    """Whether a processor's libraries are installed (probed without importing them)."""
+    return PROCESSORS[name].is_available()
+
+
+def load(name: str):
+    """Import a processor's library on first use and return its module."""
+    return PROCESSORS[name].load()
+
+
+def available_processors() -> List[str]:
+    """Names of the processors whose libraries are installed."""
+    return [name for name, processor in PROCESSORS.items() if processor.is_available()]
@@ -0,0 +1,125 @@
+"""
+Compact columnar storage for text extracted with PyMuPDF.
+
+Instead of one Python dict per text span (plus a nested font dict and a bbox
+list), spans are merged into lines up front and each attribute is kept in a
+typed array. Font names are interned, and page offsets allow a page's lines
+to be sliced directly without regrouping.
+"""
+
+from array import array
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class SpanStore:
+    """Columnar store of text lines with their font and position attributes."""
+
+    def __init__(self):
+        self.texts: List[str] = []
+        self.bboxes = array("f")      # x0, y0, x1, y1 per line
+        self.sizes = array("f")
+        self.flags = array("I")
+        self.colors = array("I")
+        self.font_ids = array("I")
+        self.is_header = array("b")
+
+        self.font_names: List[str] = []
+        self._font_lookup: Dict[str, int] = {}
+        self.font_counts: Dict[Tuple[int, float], int] = {}
+
+        self.page_numbers = array("I")
+        self.page_offsets = array("I", [0])  # lines of page i: [offsets[i], offsets[i + 1])
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_numbers)
+
+    def intern_font(self, font_name: str) -> int:
+        """Return the ID of a font name, registering it on first use."""
+        font_id = self._font_lookup.get(font_name)
+        if font_id is None:
+            font_id = len(self.font_names)
+            self.font_names.append(font_name)
+            self._font_lookup[font_name] = font_id
+        return font_id
+
+    def add_page_lines(self, page_num: int, lines: List[Dict[str, Any]], is_header_fn) -> None:
+        """
+        Append one page of PyMuPDF 'dict' lines, merging each line's spans.
+
+        The line takes its font attributes from its longest span. Font usage
+        is still counted per span, matching the old per-span font statistics.
+
+        Args:
+            page_num: 1-based page number
+            lines: PyMuPDF line dicts of the page, in reading order
+            is_header_fn: Callable (size, flags, text) -> bool
+        """
+        for line in lines:
+            spans = line.get("spans", [])
+            if not spans:
+                continue
+
+            dominant = spans[0]
+            for span in spans:
+                font_id = self.intern_font(span.get("font", ""))
+                key = (font_id, span.get("size", 0))
+                self.font_counts[key] = self.font_counts.get(key, 0) + 1
+                if len(span.get("text", "")) > len(dominant.get("text", "")):
+                    dominant = span
+
+            text = "".join(span.get("text", "") for span in spans)
+            size = dominant.get("size", 0)
+            flags = dominant.get("flags", 0)
+
+            self.texts.append(text)
+            self.bboxes.extend(line.get("bbox", (0, 0, 0, 0)))
+            self.sizes.append(size)
+            self.flags.append(flags)
+            self.colors.append(dominant.get("color", 0) & 0xFFFFFFFF)
+            self.font_ids.append(self.intern_font(dominant.get("font", "")))
+            self.is_header.append(1 if is_header_fn(size, flags, text) else 0)
+
+        self.page_numbers.append(page_num)
+        self.page_offsets.append(len(self.texts))
+
+    def iter_pages(self) -> Iterator[Tuple[int, int, int]]:
+        """Yield (page_number, start, end) line ranges, one per page."""
+        for i, page_num in enumerate(self.page_numbers):
+            yield page_num, self.page_offsets[i], self.page_offsets[i + 1]
+
+    def line(self, i: int) -> Dict[str, Any]:
+        """Materialize one line as a dict (for debugging and inspection)."""
+        return {
+            "text": self.texts[i],
+            "bbox": list(self.bboxes[4 * i:4 * i + 4]),
+            "size": self.sizes[i],
+            "flags": self.flags[i],
+            "color": self.colors[i],
+            "font": self.font_names[self.font_ids[i]],
+            "is_header": bool(self.is_header[i]),
+        }
+
+    def font_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Font usage in the legacy '<font>_<size>' -> {count, font_info} shape."""
+        stats = {}
+        for (font_id, size), count in self.font_counts.items():
+            font_name = self.font_names[font_id]
+            stats[f"{font_name}_{size}"] = {
+                "count": count,
+                "font_info": {"font": font_name, "size": size},
+            }
+        return stats
+
+    def nbytes(self) -> int:
+        """Approximate payload size of the store in bytes (excluding object headers)."""
+        columns = (self.bboxes, self.sizes, self.flags, self.colors,
+                   self.font_ids, self.is_header, self.page_numbers, self.page_offsets)
+        return (
+            sum(col.itemsize * len(col) for col in columns)
+            + sum(len(text.encode("utf-8")) for text in self.texts)
+            + sum(len(name) for name in self.font_names)
+        )
@@ -0,0 +1,117 @@
+"""
+Serving of the fingerprinted, precompressed assets built by scripts/build_assets.py.
+
+Templates call asset_url("js/script.js"). With a build manifest present this
+resolves to /assets/js/script.<hash>.js, served with the best precompressed
+variant the client accepts, an ETag and a one-year immutable Cache-Control;
+without one it falls back to the plain /static/ file so development works
+without a build step. Large dynamic responses (/get) are gzip-compressed on
+the fly.
+"""
+
+import gzip
+import json
+import mimetypes
+import os
+from typing import Any, Dict, Optional
+
+from flask import Flask, Response, abort, request, send_file
+
+from config.settings import Config
+from src.utils.telemetry import logger
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Precompressed variants in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def load_asset_manifest(dist_dir: str = Config.STATIC_DIST_DIR) -> Dict[str, Any]:
+    """Source path → {"path", "hash", "bytes"} entries; empty without a build."""
+    try:
+        with open(os.path.join(dist_dir, "manifest.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _accepts(encoding: str) -> bool:
+    return request.accept_encodings[encoding] > 0
+
+
+def _compress_response(response: Response, min_bytes: int) -> Response:
+    """Gzip a large uncompressed response when the client accepts it."""
+    if (
+        response.direct_passthrough
+        or response.status_code < 200
+        or response.status_code >= 300
+        or "Content-Encoding" in response.headers
+        or not _accepts("gzip")
+    ):
+        return response
+    data = response.get_data()
+    if len(data) < min_bytes:
+        return response
+    response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def register_static_assets(
+    app: Flask,
+    dist_dir: str = Config.STATIC_DIST_DIR,
+    compress_min_bytes: Optional[int] = None,
+) -> None:
+    """
+    Add the /assets route, the asset_url template helper and response compression.
+    
+    Args:
+        app: Flask application
+        dist_dir: Build output of scripts/build_assets.py
+        compress_min_bytes: Smallest dynamic response to gzip (COMPRESS_MIN_BYTES by default)
+    """
+    manifest = load_asset_manifest(dist_dir)
+    by_hashed_path = {entry["path"]: entry for entry in manifest.values()}
+    min_bytes = Config.COMPRESS_MIN_BYTES if compress_min_bytes is None else compress_min_bytes
+
+    if manifest:
+        logger.info(f"📦 Serving {len(manifest)} built asset(s) from {dist_dir}")
+
+    @app.template_global()
+    def asset_url(path: str) -> str:
+        entry = manifest.get(path)
+        return f"/assets/{entry['path']}" if entry else f"/static/{path}"
+
+    @app.route("/assets/<path:filename>")
+    def built_asset(filename):
+        entry = by_hashed_path.get(filename)
+        if entry is None:
+            abort(404)
+        file_path = os.path.join(dist_dir, filename)
+        mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+        encoding, suffix = "identity", ""
+        for candidate, candidate_suffix in ENCODINGS:
+            if candidate in entry["bytes"] and _accepts(candidate):
+                encoding, suffix = candidate, candidate_suffix
+                break
+
+        response = send_file(
+            file_path + suffix,
+            mimetype=mimetype,
+            etag=f"{entry['hash']}-{encoding}",
+            conditional=True,
+            max_age=31536000,
+        )
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+    @app.after_request
+    def compress_response(response):
+        if request.path.startswith("/assets/") or request.path.startswith("/static/"):
+            return response
+        return _compress_response(response, min_bytes)
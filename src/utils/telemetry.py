@@ -0,0 +1,152 @@
+"""
+Ingestion telemetry: timed spans per file and stage, counters and a JSON report.
+
+Spans are aggregated on the fly (count / total / max per stage, seconds per
+file and stage), so recording one costs two perf_counter calls and a dict
+update. Dotted stage names ("extract.camelot") are nested inside their
+top-level stage ("extract") and are not added again to a file's total.
+
+Console progress goes through the "ingest" logger, whose level is
+INGEST_LOG_LEVEL; per-file detail is logged at DEBUG and frequent progress
+lines are rate-limited.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from config.settings import Config
+
+logger = logging.getLogger("ingest")
+
+
+def configure_logging(level: Optional[str] = None) -> None:
+    """Send ingestion logs to stdout with the given level (INGEST_LOG_LEVEL by default)."""
+    level_name = (level or Config.INGEST_LOG_LEVEL).upper()
+    if not any(getattr(handler, "_ingest_handler", False) for handler in logger.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler._ingest_handler = True
+        logger.addHandler(handler)
+    logger.setLevel(getattr(logging, level_name, logging.INFO))
+    logger.propagate = False
+
+
+class RateLimitedLog:
+    """Log callable that emits at most one message per interval (the latest one wins)."""
+
+    def __init__(self, log: logging.Logger = logger, interval: float = 1.0, level: int = logging.INFO):
+        self.log = log
+        self.interval = interval
+        self.level = level
+        self._last = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, message: str) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            if now - self._last < self.interval:
+                return
+            self._last = now
+        self.log.log(self.level, message)
+
+
+class _Span:
+    __slots__ = ("telemetry", "stage", "file", "start")
+
+    def __init__(self, telemetry: "IngestionTelemetry", stage: str, file: Optional[str]):
+        self.telemetry = telemetry
+        self.stage = stage
+        self.file = file
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.telemetry.record(self.stage, time.perf_counter() - self.start, file=self.file,
+                              failed=exc_type is not None)
+
+
+class IngestionTelemetry:
+    """Aggregated timings and counters for one ingestion run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started_at = time.time()
+            self._start = time.perf_counter()
+            self.stages: Dict[str, Dict[str, float]] = {}
+            self.files: Dict[str, Dict[str, float]] = {}
+            self.counters: Dict[str, int] = {}
+
+    def span(self, stage: str, file: Optional[str] = None) -> _Span:
+        """Context manager timing one stage (optionally attributed to a file)."""
+        return _Span(self, stage, file)
+
+    def record(self, stage: str, seconds: float, file: Optional[str] = None, failed: bool = False) -> None:
+        """Add a measured duration to a stage (and file)."""
+        with self._lock:
+            entry = self.stages.get(stage)
+            if entry is None:
+                entry = self.stages[stage] = {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0, "failures": 0}
+            entry["count"] += 1
+            entry["total_seconds"] += seconds
+            if seconds > entry["max_seconds"]:
+                entry["max_seconds"] = seconds
+            if failed:
+                entry["failures"] += 1
+            if file is not None:
+                file_stages = self.files.setdefault(file, {})
+                file_stages[stage] = file_stages.get(stage, 0.0) + seconds
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def report(self, slowest: int = 10) -> Dict[str, Any]:
+        """Machine-readable summary of the run."""
+        with self._lock:
+            stages = {
+                name: {**entry, "mean_seconds": entry["total_seconds"] / entry["count"]}
+                for name, entry in sorted(self.stages.items())
+            }
+            file_totals = sorted(
+                (
+                    (sum(seconds for stage, seconds in stages_.items() if "." not in stage), path, dict(stages_))
+                    for path, stages_ in self.files.items()
+                ),
+                reverse=True
+            )
+            return {
+                "started_at": self.started_at,
+                "elapsed_seconds": time.perf_counter() - self._start,
+                "stages": stages,
+                "counters": dict(sorted(self.counters.items())),
+                "slowest_files": [
+                    {"file": path, "seconds": total, "stages": stages_}
+                    for total, path, stages_ in file_totals[:slowest]
+                ],
+            }
+
+    def write_report(self, path: str) -> None:
+        """Write the report as JSON (atomically)."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        os.replace(tmp_path, path)
+
+
+# Process-wide collector used by the ingestion modules
+telemetry = IngestionTelemetry()
@@ -0,0 +1,42 @@
+"""
+Token counting for chunk sizing and prompt budgets.
+
+Uses tiktoken's encoding for the OpenAI embedding/chat models, loaded once
+per process. When tiktoken (or its encoding file) is unavailable, token
+counts fall back to a characters / 4 estimate.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Encoding used by text-embedding-3-* and gpt-4/gpt-3.5 models
+DEFAULT_ENCODING = "cl100k_base"
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=None)
+def get_encoder(encoding_name: str = DEFAULT_ENCODING) -> Optional["tiktoken.Encoding"]:
+    """Return the cached tiktoken encoder, or None if it cannot be loaded."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding(encoding_name)
+    except Exception:
+        # The encoding file is downloaded on first use; offline hosts fall back
+        return None
+
+
+def count_tokens(text: str, encoding_name: str = DEFAULT_ENCODING) -> int:
+    """Number of tokens in text (estimated when no encoder is available)."""
+    if not text:
+        return 0
+    encoder = get_encoder(encoding_name)
+    if encoder is None:
+        return max(1, len(text) // CHARS_PER_TOKEN)
+    return len(encoder.encode_ordinary(text))
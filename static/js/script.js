@@ -253,11 +253,16 @@ class ChatbotController {
       chatListItem.classList.remove('typing');
       messageParagraph.classList.remove('typing-animation');
       
-      // Add response with typewriter effect
-      await this.typewriterEffect(messageParagraph, response);
-      
-      // Add to history
-      this.addToHistory(response, 'incoming');
+      if (typeof response === "string") {
+        // Plain-text answer: rebuild the formatting client-side
+        await this.typewriterEffect(messageParagraph, response);
+        this.addToHistory(response, 'incoming');
+      } else {
+        // Structured answer: render the typed blocks directly
+        this.renderAnswerBlocks(messageParagraph, response.blocks);
+        this.scrollToBottom();
+        this.addToHistory(response.answer, 'incoming');
+      }
       
       this.retryCount = 0; // Reset retry count on success
       
@@ -279,9 +284,10 @@ class ChatbotController {
       method: "POST",
       headers: { 
         "Content-Type": "application/x-www-form-urlencoded",
+        "Accept": "application/json",
         "X-Requested-With": "XMLHttpRequest"
       },
-      body: `msg=${encodeURIComponent(message)}`,
+      body: `msg=${encodeURIComponent(message)}&format=json`,
       signal: controller.signal
     };
 
@@ -294,6 +300,15 @@ class ChatbotController {
         throw new Error(`Server error (${response.status}): ${errorText}`);
       }
       
+      // Structured answer (blocks, sources, timing); older servers send plain text
+      if ((response.headers.get("Content-Type") || "").includes("application/json")) {
+        const payload = await response.json();
+        if (payload.blocks && payload.blocks.length) {
+          return payload;
+        }
+        return payload.answer || "Sorry, I cannot provide a response at this time.";
+      }
+      
       const responseText = await response.text();
       return responseText || "Sorry, I cannot provide a response at this time.";
       
@@ -563,6 +578,79 @@ class ChatbotController {
     return text.trim();
   }
 
+  // Render the structured answer blocks (see src/utils/answer_blocks.py) as DOM nodes
+  renderAnswerBlocks(element, blocks) {
+    const fragment = document.createDocumentFragment();
+    
+    blocks.forEach(block => {
+      switch (block.type) {
+        case "heading": {
+          const heading = document.createElement(`h${Math.min(Math.max(block.level, 1), 4)}`);
+          this.appendSpans(heading, block.spans);
+          fragment.appendChild(heading);
+          break;
+        }
+        case "steps":
+        case "bullets":
+          fragment.appendChild(this.createList(block));
+          break;
+        case "code": {
+          const pre = document.createElement("pre");
+          const code = document.createElement("code");
+          code.textContent = block.text;
+          pre.appendChild(code);
+          fragment.appendChild(pre);
+          break;
+        }
+        default: {
+          const paragraph = document.createElement("span");
+          paragraph.className = "answer-paragraph";
+          this.appendSpans(paragraph, block.spans || []);
+          fragment.appendChild(paragraph);
+        }
+      }
+    });
+    
+    element.replaceChildren(fragment);
+  }
+  
+  createList(block) {
+    const list = document.createElement(block.type === "steps" ? "ol" : "ul");
+    if (block.type === "steps" && block.start && block.start !== 1) {
+      list.start = block.start;
+    }
+    block.items.forEach(item => {
+      const listItem = document.createElement("li");
+      this.appendSpans(listItem, item.spans);
+      (item.lists || []).forEach(nested => listItem.appendChild(this.createList(nested)));
+      list.appendChild(listItem);
+    });
+    return list;
+  }
+  
+  appendSpans(element, spans) {
+    spans.forEach(span => {
+      let node;
+      if (span.type === "link") {
+        node = document.createElement("a");
+        node.href = span.url;
+        node.target = "_blank";
+        node.rel = "noopener noreferrer";
+        node.className = "auto-link";
+        node.textContent = span.text;
+      } else if (span.type === "bold") {
+        node = document.createElement("strong");
+        node.textContent = span.text;
+      } else if (span.type === "code") {
+        node = document.createElement("code");
+        node.textContent = span.text;
+      } else {
+        node = document.createTextNode(span.text);
+      }
+      element.appendChild(node);
+    });
+  }
+
   async typewriterEffect(element, text, speed = 30) {
     // Parse markdown and display immediately for better formatting
     const htmlContent = this.parseMarkdown(text);
@@ -0,0 +1,45 @@
+from src.services.chat_service import ChatService
+from src.utils.answer_blocks import parse_answer_blocks, parse_inline
+
+
+def _clean(text, **kwargs):
+    # _clean_response_text needs no model or retriever
+    return ChatService.__new__(ChatService)._clean_response_text(text, **kwargs)
+
+
+def test_structured_answer_keeps_greater_than():
+    answer = _clean("1. Buka Control Panel > Network\n2. Klik OK", collapse_whitespace=False)
+
+    assert answer == "1. Buka Control Panel > Network\n2. Klik OK"
+    assert parse_answer_blocks(answer) == [{
+        "type": "steps",
+        "start": 1,
+        "items": [
+            {"spans": [{"type": "text", "text": "Buka Control Panel > Network"}]},
+            {"spans": [{"type": "text", "text": "Klik OK"}]},
+        ],
+    }]
+
+
+def test_nested_steps_and_bullets_keep_their_type():
+    blocks = parse_answer_blocks("1. Buka menu\n   1. Klik A\n   2. Klik B\n   - Catatan\n2. Selesai")
+
+    assert len(blocks) == 1
+    nested = blocks[0]["items"][0]["lists"]
+    assert [(block["type"], len(block["items"])) for block in nested] == [("steps", 2), ("bullets", 1)]
+    assert nested[0]["start"] == 1
+    assert "lists" not in blocks[0]["items"][1]
+
+
+def test_inline_spans():
+    spans = parse_inline("Klik **Simpan**, jalankan `ipconfig` lalu buka https://uii.ac.id.")
+
+    assert spans == [
+        {"type": "text", "text": "Klik "},
+        {"type": "bold", "text": "Simpan"},
+        {"type": "text", "text": ", jalankan "},
+        {"type": "code", "text": "ipconfig"},
+        {"type": "text", "text": " lalu buka "},
+        {"type": "link", "text": "https://uii.ac.id", "url": "https://uii.ac.id"},
+        {"type": "text", "text": "."},
+    ]
@@ -0,0 +1,39 @@
+from langchain.schema.document import Document
+
+from src.utils.dedup import deduplicate_chunks
+
+TEXT = (
+    "To connect to the campus VPN open the client, enter the server address "
+    "vpn.example.ac.id, sign in with your account and accept the certificate prompt."
+)
+
+
+def _chunk(text, page, processor):
+    return Document(page_content=text, metadata={"source": "a.pdf", "page": page, "processor": processor})
+
+
+def test_near_duplicates_are_merged_with_string_pages():
+    chunks = [
+        _chunk(TEXT, 2, "pymupdf"),
+        _chunk(TEXT + " ", 3, "pdfplumber"),
+        _chunk("Printers on the third floor need the PaperCut client installed first.", 4, "pymupdf"),
+    ]
+
+    kept, stats = deduplicate_chunks(chunks)
+
+    assert len(kept) == 2
+    assert stats.removed == 1
+    assert stats.duplicate_groups == 1
+    merged = kept[0]
+    assert merged.metadata["duplicates_merged"] == 1
+    assert merged.metadata["merged_pages"] == ["2", "3"]
+    assert merged.metadata["merged_processors"] == ["pdfplumber", "pymupdf"]
+
+
+def test_distinct_chunks_are_kept():
+    chunks = [_chunk(TEXT, 1, "pymupdf"), _chunk("Reset your password at the service desk portal.", 1, "pymupdf")]
+
+    kept, stats = deduplicate_chunks(chunks)
+
+    assert kept == chunks
+    assert stats.removed == 0
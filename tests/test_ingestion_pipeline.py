@@ -0,0 +1,63 @@
+from langchain.schema.document import Document
+
+from src.services import ingestion_pipeline
+from src.services.ingestion_pipeline import StreamingIngestionPipeline
+from src.utils.manifest import FileDiff, IngestionManifest
+
+
+class FakeEmbeddings:
+    def embed_documents(self, texts):
+        return [[0.1, 0.2, 0.3] for _ in texts]
+
+
+class FakeIndex:
+    def __init__(self):
+        self.upserted = []
+        self.deleted = []
+
+    def upsert(self, vectors, **kwargs):
+        self.upserted.extend(vectors)
+
+    def delete(self, ids, **kwargs):
+        self.deleted.extend(ids)
+
+
+def _run(monkeypatch, manifest, file_diff, failing=(), **kwargs):
+    def fake_iter_pdf_documents(pdf_files, **_):
+        for path in pdf_files:
+            if path not in failing:
+                yield Document(page_content=f"content of {path}", metadata={"source": path, "page": 1})
+
+    monkeypatch.setattr(ingestion_pipeline, "iter_pdf_documents", fake_iter_pdf_documents)
+    index = FakeIndex()
+    pipeline = StreamingIngestionPipeline(
+        FakeEmbeddings(), index, manifest=manifest, use_semantic_chunking=False, deduplicate=False, **kwargs
+    )
+    return pipeline.run(file_diff), index
+
+
+def test_reupsert_sends_chunks_the_manifest_already_lists(monkeypatch, tmp_path):
+    manifest = IngestionManifest(str(tmp_path / "manifest.json"))
+    diff = FileDiff(new=["a.pdf"], file_hashes={"a.pdf": "h"})
+    _run(monkeypatch, manifest, diff)
+
+    diff = FileDiff(changed=["a.pdf"], file_hashes={"a.pdf": "h"})
+    stats, index = _run(monkeypatch, manifest, diff)
+    assert stats.vectors_upserted == 0
+
+    stats, index = _run(monkeypatch, manifest, diff, reupsert=True)
+    assert stats.vectors_upserted == 1
+    assert index.deleted == []
+
+
+def test_failed_file_keeps_its_vectors_and_manifest_entry(monkeypatch, tmp_path):
+    manifest = IngestionManifest(str(tmp_path / "manifest.json"))
+    manifest.record_file("failed.pdf", "old-hash", ["old-id"])
+    diff = FileDiff(changed=["failed.pdf", "good.pdf"], file_hashes={"failed.pdf": "new", "good.pdf": "g"})
+
+    stats, index = _run(monkeypatch, manifest, diff, failing={"failed.pdf"})
+
+    assert index.deleted == []
+    assert manifest.files["failed.pdf"] == {"file_hash": "old-hash", "chunk_ids": ["old-id"]}
+    assert len(manifest.files["good.pdf"]["chunk_ids"]) == 1
+    assert stats.vectors_upserted == 1
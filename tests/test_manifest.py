@@ -0,0 +1,67 @@
+from langchain.schema.document import Document
+
+from src.utils.manifest import IngestionManifest
+
+
+def _chunk(source, text):
+    return Document(page_content=text, metadata={"source": source})
+
+
+def _indexed_manifest(tmp_path, files):
+    """Manifest with every file's chunks recorded, as after a successful run."""
+    manifest = IngestionManifest(str(tmp_path / "manifest.json"))
+    diff = manifest.diff_files(list(files), "sig")
+    manifest.record(diff, [chunk for chunks in files.values() for chunk in chunks], "sig")
+    return manifest
+
+
+def test_clear_replans_every_chunk_after_reset(tmp_path):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"a")
+    chunks = [_chunk(str(pdf), "first"), _chunk(str(pdf), "second")]
+    manifest = _indexed_manifest(tmp_path, {str(pdf): chunks})
+
+    manifest.clear()
+    diff = manifest.diff_files([str(pdf)], "sig")
+    plan = manifest.plan_chunks(diff, chunks)
+
+    assert diff.new == [str(pdf)]
+    assert len(plan.to_upsert) == 2
+    assert plan.unchanged == 0
+    assert plan.to_delete == []
+
+
+def test_unchanged_chunks_are_skipped_without_reset(tmp_path):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"a")
+    chunks = [_chunk(str(pdf), "first")]
+    manifest = _indexed_manifest(tmp_path, {str(pdf): chunks})
+
+    diff = manifest.diff_files([str(pdf)], "sig", force=True)
+    plan = manifest.plan_chunks(diff, chunks)
+
+    assert plan.to_upsert == []
+    assert plan.unchanged == 1
+
+
+def test_failed_extraction_keeps_vectors_and_is_retried(tmp_path):
+    good, failed = tmp_path / "good.pdf", tmp_path / "failed.pdf"
+    good.write_bytes(b"good")
+    failed.write_bytes(b"failed")
+    manifest = _indexed_manifest(tmp_path, {
+        str(good): [_chunk(str(good), "good")],
+        str(failed): [_chunk(str(failed), "failed")],
+    })
+    old_entry = dict(manifest.files[str(failed)])
+
+    good.write_bytes(b"good, edited")
+    failed.write_bytes(b"failed, edited")
+    diff = manifest.diff_files([str(good), str(failed)], "sig")
+    diff.exclude([str(failed)])
+    new_chunks = [_chunk(str(good), "good, edited")]
+    plan = manifest.plan_chunks(diff, new_chunks)
+    manifest.record(diff, new_chunks, "sig")
+
+    assert not set(plan.to_delete) & set(old_entry["chunk_ids"])
+    assert manifest.files[str(failed)] == old_entry
+    assert manifest.diff_files([str(good), str(failed)], "sig").changed == [str(failed)]
@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+from langchain.schema.document import Document
+
+from scripts.setup_index import backfill_snapshot
+from src.core.snapshot import SnapshotWriter, load_snapshot
+from src.utils.manifest import IngestionManifest
+
+
+class FakeIndex:
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.fetched = []
+
+    def fetch(self, ids, **kwargs):
+        self.fetched.extend(ids)
+        return SimpleNamespace(vectors={
+            vector_id: self.vectors[vector_id] for vector_id in ids if vector_id in self.vectors
+        })
+
+
+def _vector(values, text):
+    return SimpleNamespace(values=values, metadata={"text": text, "page": 1})
+
+
+def test_backfill_fetches_only_vectors_the_snapshot_lacks(tmp_path):
+    manifest = IngestionManifest(str(tmp_path / "manifest.json"))
+    manifest.record_file("a.pdf", "h", ["a-1", "a-2"])
+    manifest.record_file("b.pdf", "h", ["b-1"])
+    index = FakeIndex({"a-2": _vector([0.0, 1.0], "second"), "b-1": _vector([1.0, 1.0], "other")})
+
+    writer = SnapshotWriter(str(tmp_path / "snapshots"), dimension=2)
+    writer.add([("a-1", Document(page_content="first", metadata={"page": 1}))], [[1.0, 0.0]])
+    fetched = backfill_snapshot(writer, index, manifest)
+    writer.commit()
+
+    assert fetched == 2
+    assert sorted(index.fetched) == ["a-2", "b-1"]
+    snapshot = load_snapshot(str(tmp_path / "snapshots"))
+    assert sorted(snapshot.index.ids) == ["a-1", "a-2", "b-1"]
+    assert "second" in snapshot.index.texts
+
+
+def test_files_with_vectors_missing_from_the_index_are_embedded_again(tmp_path):
+    manifest = IngestionManifest(str(tmp_path / "manifest.json"))
+    manifest.record_file("a.pdf", "h", ["a-1"])
+    manifest.record_file("b.pdf", "h", ["b-1"])
+    index = FakeIndex({"a-1": _vector([1.0, 0.0], "first")})
+
+    writer = SnapshotWriter(str(tmp_path / "snapshots"), dimension=2)
+    fetched = backfill_snapshot(writer, index, manifest)
+    writer.abort()
+
+    assert fetched == 1
+    assert list(manifest.files) == ["a.pdf"]